@@ -0,0 +1,341 @@
+"""
+Headless HTTP inference API for MannKiBaat.
+A dependency-free ASGI application exposing the validator, hybrid intent
+classifier and PHQ-8 detector, so inference replicas can be scaled and
+load-balanced independently of the Streamlit UI.
+
+Endpoints:
+    GET  /health          Liveness check
+    GET  /ready           Readiness check: 503 until the models are loaded and warmed up
+    GET  /timings         Per-stage latency percentiles (see stage_timing.py)
+    POST /validate        {"text": str}          -> rule-based validation
+    POST /classify        {"text": str}          -> hybrid intent classification
+    POST /analyze         {"text": str}          -> PHQ-8 depression assessment (micro-batched)
+    POST /analyze/batch   {"texts": [str, ...]}  -> assessments in input order
+
+Prometheus metrics are served separately on METRICS_HOST:METRICS_PORT
+(see metrics.py), so scrapes never compete with inference for admission.
+
+Usage:
+    uvicorn api:app --host 0.0.0.0 --port 8000
+"""
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import stage_timing
+from inference_batcher import get_micro_batcher
+from metrics import counter, histogram, start_exporter
+from config import (
+    API_WORKERS,
+    API_MAX_PENDING,
+    API_MAX_BATCH_TEXTS,
+    API_MAX_BODY_BYTES,
+    API_SHUTDOWN_TIMEOUT,
+    METRICS_PORT,
+    WARMUP_TEXTS,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = counter(
+    "mannkibaat_api_requests_total",
+    "HTTP requests by route and status code.",
+    ["path", "status"],
+)
+REQUEST_SECONDS = histogram(
+    "mannkibaat_api_request_seconds",
+    "Time spent in each route handler, in seconds.",
+    ["path"],
+    buckets=[0.001 * 2 ** i for i in range(15)],
+)
+
+
+class HTTPError(Exception):
+    """Error that is returned to the client as a JSON response."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _default_resources_loader():
+    # Imported lazily so the ASGI app object can be created before any
+    # model code (torch, transformers, scikit-learn) is loaded
+    from model_resources import get_resources
+
+    return get_resources()
+
+
+def _require_text(payload):
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise HTTPError(400, "Request body must contain a 'text' string")
+    return text
+
+
+class InferenceAPI:
+    """
+    ASGI application serving the screening pipeline.
+
+    Inference runs in a bounded thread pool; at most max_pending requests are
+    admitted at once and the rest are rejected with 503 so a saturated replica
+    sheds load instead of queueing without limit. On lifespan shutdown the app
+    stops admitting requests, waits up to shutdown_timeout for in-flight ones
+    and then shuts the pool down without blocking the event loop.
+
+    Models are loaded and warmed up in the background after startup; /health
+    answers immediately while /ready returns 503 until the warm-up is done, so
+    an orchestrator only routes traffic to warm replicas.
+    """
+
+    def __init__(
+        self,
+        workers=API_WORKERS,
+        max_pending=API_MAX_PENDING,
+        shutdown_timeout=API_SHUTDOWN_TIMEOUT,
+        resources_loader=None,
+        warmup_texts=WARMUP_TEXTS,
+        metrics_port=METRICS_PORT,
+    ):
+        """
+        Args:
+            workers (int): Threads running CPU-bound inference.
+            max_pending (int): Requests admitted at once before returning 503.
+            shutdown_timeout (float): Seconds to wait for in-flight requests on shutdown.
+            resources_loader (callable, optional): Returns the warm model resources
+                (defaults to model_resources.get_resources).
+            warmup_texts (list): Synthetic inputs run through the models at startup.
+            metrics_port (int): Port for the Prometheus exporter (None disables it).
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.shutdown_timeout = shutdown_timeout
+        self.resources_loader = resources_loader or _default_resources_loader
+        self.warmup_texts = warmup_texts
+        self.metrics_port = metrics_port
+        self._warmup_task = None
+        self.executor = None
+        self.draining = False
+        self._in_flight = 0
+        self._idle = None
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/ready"): self.readiness,
+            ("GET", "/timings"): self.timings,
+            ("POST", "/validate"): self.validate,
+            ("POST", "/classify"): self.classify,
+            ("POST", "/analyze"): self.analyze,
+            ("POST", "/analyze/batch"): self.analyze_batch,
+        }
+
+    # ----- Lifecycle -----
+
+    def _ensure_executor(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="api-inference"
+            )
+            self._idle = asyncio.Event()
+            self._idle.set()
+
+    async def startup(self):
+        """Create the worker pool and start loading and warming up every model."""
+        self._ensure_executor()
+        start_exporter(self.metrics_port)
+        self._warmup_task = asyncio.ensure_future(self.warm_up())
+
+    async def warm_up(self):
+        """Load and warm up the models in the pool (which marks the process ready)."""
+        # Imported lazily, like the default resources loader
+        from model_resources import warm_up
+
+        try:
+            await self.run_in_pool(warm_up, self.resources_loader, self.warmup_texts)
+        except Exception as e:
+            logger.error(f"Warm-up failed; replica stays unready: {e}", exc_info=True)
+            return
+        logger.info("Inference API ready")
+
+    async def shutdown(self):
+        """Stop admitting requests, drain in-flight ones and stop the pool."""
+        self.draining = True
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+        if self.executor is None:
+            return
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Shutdown timeout: {self._in_flight} requests still running")
+        # Never block the event loop on stuck requests or a running warm-up;
+        # queued work is cancelled and running threads finish on their own
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        stage_timing.log_summary(logger)
+        logger.info("Inference API stopped")
+
+    async def run_in_pool(self, fn, *args):
+        """Run a CPU-bound callable in the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    # ----- Handlers -----
+
+    async def health(self, payload):
+        return 200, {"status": "ok"}
+
+    async def readiness(self, payload):
+        # model_resources owns readiness: it is cleared while models reload
+        import model_resources
+
+        if not model_resources.is_ready():
+            return 503, {"status": "warming_up"}
+        return 200, {"status": "ready", "warmup_seconds": model_resources.warmup_timings()}
+
+    async def timings(self, payload):
+        return 200, {"enabled": stage_timing.is_enabled(), "stages": stage_timing.snapshot()}
+
+    async def validate(self, payload):
+        text = _require_text(payload)
+
+        def run():
+            is_valid, validation_type, metadata = self.resources_loader().validator.validate_input(text)
+            return {"is_valid": is_valid, "validation_type": validation_type, "metadata": metadata}
+
+        return 200, await self.run_in_pool(run)
+
+    async def classify(self, payload):
+        text = _require_text(payload)
+        result = await self.run_in_pool(
+            lambda: self.resources_loader().hybrid_classifier.classify_intent(text)
+        )
+        return 200, result
+
+    async def analyze(self, payload):
+        text = _require_text(payload)
+        detector = await self.run_in_pool(lambda: self.resources_loader().detector)
+        # Concurrent requests share forward passes; the pool thread is not held while waiting
+        future = get_micro_batcher(detector=detector).submit(text)
+        return 200, await asyncio.wrap_future(future)
+
+    async def analyze_batch(self, payload):
+        texts = payload.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise HTTPError(400, "Request body must contain a 'texts' list of strings")
+        if len(texts) > API_MAX_BATCH_TEXTS:
+            raise HTTPError(413, f"At most {API_MAX_BATCH_TEXTS} texts per batch")
+
+        results = await self.run_in_pool(
+            lambda: list(self.resources_loader().detector.analyze_many(texts))
+        )
+        return 200, {"results": results}
+
+    # ----- ASGI plumbing -----
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    logger.error(f"Startup failed: {e}", exc_info=True)
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        self._ensure_executor()
+        handler = self.routes.get((scope["method"], scope["path"]))
+
+        if handler is None:
+            known_path = any(path == scope["path"] for _, path in self.routes)
+            status = 405 if known_path else 404
+            # Unknown paths share one label so scanners cannot blow up cardinality
+            REQUESTS.labels(scope["path"] if known_path else "other", status).inc()
+            await self._respond(send, status, {"error": "Method not allowed" if known_path else "Not found"})
+            return
+
+        path = scope["path"]
+        if self.draining:
+            REQUESTS.labels(path, 503).inc()
+            await self._respond(send, 503, {"error": "Server is shutting down"})
+            return
+        if self._in_flight >= self.max_pending:
+            REQUESTS.labels(path, 503).inc()
+            await self._respond(send, 503, {"error": "Server busy, retry later"})
+            return
+
+        self._in_flight += 1
+        self._idle.clear()
+        start = time.perf_counter()
+        try:
+            payload = await self._read_json(receive) if scope["method"] == "POST" else {}
+            status, body = await handler(payload)
+        except HTTPError as e:
+            status, body = e.status, {"error": e.message}
+        except Exception as e:
+            logger.error(f"Request to {path} failed: {e}", exc_info=True)
+            status, body = 500, {"error": "Internal server error"}
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+        REQUEST_SECONDS.labels(path).observe(time.perf_counter() - start)
+        REQUESTS.labels(path, status).inc()
+        await self._respond(send, status, body)
+
+    async def _read_json(self, receive):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if len(body) > API_MAX_BODY_BYTES:
+                raise HTTPError(413, "Request body too large")
+            if not message.get("more_body", False):
+                break
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Request body must be valid JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        return payload
+
+    async def _respond(self, send, status, body):
+        data = json.dumps(body, default=str).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(data)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": data})
+
+
+app = InferenceAPI()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    uvicorn.run("api:app", host="0.0.0.0", port=8000)
@@ -5,9 +5,17 @@ Enhanced Streamlit application with PHQ-8 integration and cultural context.
 
 import streamlit as st
 from phq8_model import analyze_depression_risk
-from config import PHQ8_THRESHOLDS
-from input_validator import InputValidator
-from hybrid_intent_classifier import HybridIntentClassifier
+from config import (
+    PHQ8_THRESHOLDS,
+    ANALYSIS_WORKERS,
+    ANALYSIS_POLL_SECONDS,
+    ANALYSIS_MIN_DISPLAY_SECONDS,
+)
+from model_resources import load_resources, model_fingerprint, warm_up
+from metrics import counter, start_exporter
+from stage_timing import timed
+from text_normalization import normalize
+from concurrent.futures import ThreadPoolExecutor, wait
 import time
 import uuid
 from datetime import datetime
@@ -19,20 +27,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize validators
-validator = InputValidator()
-hybrid_classifier = HybridIntentClassifier(use_ml=True, ml_threshold=0.6)
+SUBMISSIONS = counter(
+    "mannkibaat_app_submissions_total",
+    "Analyze button submissions by outcome.",
+    ["outcome"],
+)
+
+@st.cache_resource(max_entries=1, show_spinner="Loading models...")
+def load_models(fingerprint):
+    """
+    Load the validator, hybrid intent classifier and PHQ-8 detector once per
+    process and share them across sessions and reruns. The fingerprint of the
+    model files is part of the cache key, so changing a model on disk
+    rebuilds (and evicts) the cached entry. Synthetic inputs are run through
+    the models before the first real analysis.
+    """
+    resources = load_resources(fingerprint)
+    warm_up(lambda: resources)
+    return resources
 
 
+# Startup hook: the first script run preloads every model; later reruns and
+# sessions reuse the cached instances
+resources = load_models(model_fingerprint())
+validator = resources.validator
+hybrid_classifier = resources.hybrid_classifier
+
+# Serves GET /metrics on METRICS_HOST:METRICS_PORT (once per process)
+start_exporter()
+
+
+@st.cache_resource
+def get_analysis_executor():
+    """Process-wide worker pool that runs PHQ-8 analysis off the script thread."""
+    return ThreadPoolExecutor(
+        max_workers=ANALYSIS_WORKERS, thread_name_prefix="phq8-analysis"
+    )
+
+
+@timed("is_gibberish")
 def is_gibberish(text):
     """
     Detect if input is gibberish/nonsense text.
     Returns True if text appears to be gibberish.
+    Accepts a str or the request's shared NormalizedText.
     """
     import re
     
     # Remove whitespace and convert to lowercase
-    clean_text = text.strip().lower()
+    text = normalize(text)
+    clean_text = text.stripped_lower
     
     # Check 1: Too many repeated characters (e.g., "aaaaaaa", "dnksdnksdds")
     if len(set(clean_text.replace(" ", ""))) < 5:  # Less than 5 unique characters
@@ -53,7 +97,7 @@ def is_gibberish(text):
         return True
     
     # Check 4: Repeated patterns (e.g., "asdasdasd", "dnkdnkdnk")
-    words = clean_text.split()
+    words = text.tokens
     for word in words:
         if len(word) > 6:
             # Check if word is just repeated patterns
@@ -70,7 +114,7 @@ def is_gibberish(text):
         'sad', 'happy', 'tired', 'exhausted', 'hopeless', 'worthless', 'depressed', 'anxious',
         'stressed', 'worried', 'scared', 'afraid', 'angry', 'upset', 'hurt', 'pain', 'help'
     }
-    words_set = set(clean_text.split())
+    words_set = text.token_set
     if len(words_set) > 3:  # Only check if more than 3 words
         common_word_count = len(words_set & common_words)
         if common_word_count == 0:  # No common words at all
@@ -83,10 +127,12 @@ def is_not_describing_feelings(text):
     """
     Detect if the text is not actually describing feelings or mental state.
     Returns True if text is casual conversation, questions, or non-descriptive.
+    Accepts a str or the request's shared NormalizedText.
     """
     import re
     
-    clean_text = text.strip().lower()
+    text = normalize(text)
+    clean_text = text.stripped_lower
     
     # Common phrases that indicate user is NOT describing their feelings
     non_descriptive_patterns = [
@@ -112,7 +158,7 @@ def is_not_describing_feelings(text):
     
     # Check if text is mostly questions
     question_words = ['what', 'why', 'how', 'when', 'where', 'who', 'which']
-    words = clean_text.split()
+    words = text.tokens
     question_count = sum(1 for word in words if word.rstrip('?.,!') in question_words)
     if question_count >= len(words) * 0.3:  # More than 30% questions
         return True
@@ -128,7 +174,7 @@ def is_not_describing_feelings(text):
         'suffering', 'suffer', 'mood', 'emotional', 'emotions'
     }
     
-    words_set = set(clean_text.split())
+    words_set = text.token_set
     emotion_word_count = len(words_set & emotion_keywords)
     
     # If text is longer than 5 words but has NO emotion/feeling words, it's suspicious
@@ -577,6 +623,9 @@ with col2:
             del st.session_state.result
         if "analysis_count" in st.session_state:
             del st.session_state.analysis_count
+        if "pending_analysis" in st.session_state:
+            st.session_state.pending_analysis["future"].cancel()
+            del st.session_state.pending_analysis
         # Keep session ID but log the clear
         logger.info("Session data cleared - privacy maintained")
         st.rerun()
@@ -585,13 +634,18 @@ with col2:
 # Analysis section with robust error handling
 use_mock = False  # Always use production model
 if analyze_button:
+    # Normalize once; every pipeline stage reuses the cached forms
+    normalized_input = normalize(user_input or "")
+
     # Comprehensive input validation using Hybrid Two-Stage Classifier
     if not user_input or len(user_input.strip()) < 10:
+        SUBMISSIONS.labels("too_short").inc()
         st.error("⚠️ Please provide at least 10 characters describing your feelings.")
         logger.warning(
             f"Session {st.session_state.session_id}: Invalid input - too short"
         )
-    elif is_gibberish(user_input):
+    elif is_gibberish(normalized_input):
+        SUBMISSIONS.labels("gibberish").inc()
         st.error("⚠️ Please provide meaningful text describing your feelings. The input appears to be random characters.")
         st.info("💡 **Tip:** Share genuine thoughts like 'I feel tired and unmotivated' or 'I'm feeling anxious about work'")
         logger.warning(
@@ -599,7 +653,7 @@ if analyze_button:
         )
     else:
         # Use two-stage hybrid classifier (Rules + ML)
-        classification = hybrid_classifier.classify_intent(user_input)
+        classification = hybrid_classifier.classify_intent(normalized_input)
         
         is_valid = classification['is_valid']
         final_decision = classification['final_decision']
@@ -612,6 +666,7 @@ if analyze_button:
         )
         
         if not is_valid:
+            SUBMISSIONS.labels("rejected").inc()
             # Show rejection message with examples
             st.warning(classification['message'])
             st.info(classification['examples'])
@@ -633,90 +688,116 @@ if analyze_button:
                 f"Session {st.session_state.session_id}: Input rejected - {final_decision}"
             )
         else:
+            SUBMISSIONS.labels("accepted").inc()
             # Log analysis start
             logger.info(f"Session {st.session_state.session_id}: Starting analysis")
             logger.info(f"Input length: {len(user_input)} characters")
             logger.info(f"Using mock model: {use_mock}")
 
-            # Show loading spinner
-            with st.spinner("🔄 Analyzing your input with PHQ-8 validated AI model..."):
-                time.sleep(1)  # Brief pause for UX
-
-                try:
-                    # Perform analysis
-                    logger.info("Calling PHQ-8 model...")
-                    result = analyze_depression_risk(user_input, use_mock=use_mock)
-
-                    # Log results
-                    logger.info(
-                        f"Analysis complete - Risk: {result['risk_level']}, "
-                        f"Confidence: {result['confidence_percent']}, "
-                        f"PHQ-8: {result['phq8_score']}"
-                    )
-
-                    st.session_state.analysis_done = True
-                    st.session_state.result = result
-                    st.session_state.result["timestamp"] = datetime.now()
-                    st.session_state.analysis_count = (
-                        st.session_state.get("analysis_count", 0) + 1
-                    )
-
-                    st.success("✅ Analysis completed successfully!")
-
-                except ImportError as e:
-                    logger.error(f"Import error: {str(e)}")
-                    st.error("❌ Model dependencies not found. Attempting fallback...")
-                    try:
-                        # Fallback to mock model
-                        logger.info("Falling back to mock model...")
-                        result = analyze_depression_risk(user_input, use_mock=True)
-                        st.session_state.analysis_done = True
-                        st.session_state.result = result
-                        st.session_state.result["timestamp"] = datetime.now()
-                        st.warning(
-                            "⚠️ Using demo model (mock). For production, ensure all dependencies are installed."
-                        )
-                    except Exception as fallback_error:
-                        logger.error(f"Fallback failed: {str(fallback_error)}")
-                        st.error(
-                            f"❌ Both model and fallback failed: {str(fallback_error)}"
-                        )
-
-                except FileNotFoundError as e:
-                    logger.error(f"Model file not found: {str(e)}")
-                    st.error("❌ Model weights not found. Switching to demo mode...")
-                    try:
-                        result = analyze_depression_risk(user_input, use_mock=True)
-                        st.session_state.analysis_done = True
-                        st.session_state.result = result
-                        st.session_state.result["timestamp"] = datetime.now()
-                        st.info(
-                            "ℹ️ Using demo model. Train the model using: python train_model.py"
-                        )
-                    except Exception as fallback_error:
-                        logger.error(f"Fallback failed: {str(fallback_error)}")
-                        st.error(f"❌ Analysis failed: {str(fallback_error)}")
-
-                except Exception as e:
-                    logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-                    st.error(f"❌ An unexpected error occurred: {str(e)}")
-                    st.info("💡 Troubleshooting tips:")
-                    st.info(
-                        "1. Check that all dependencies are installed: pip install -r requirements.txt"
-                    )
-                    st.info("2. Try enabling Demo mode checkbox")
-                    st.info("3. Ensure model weights are in model/fine_tuned_model/")
-
-                    # Attempt one last fallback
-                    try:
-                        logger.info("Final fallback attempt...")
-                        result = analyze_depression_risk(user_input, use_mock=True)
-                        st.session_state.analysis_done = True
-                        st.session_state.result = result
-                        st.session_state.result["timestamp"] = datetime.now()
-                        st.warning("⚠️ Recovered using demo model")
-                    except:
-                        pass
+            # Run the analysis in the background; the spinner below tracks it
+            logger.info("Calling PHQ-8 model...")
+            st.session_state.pending_analysis = {
+                "future": get_analysis_executor().submit(
+                    analyze_depression_risk, normalized_input, use_mock=use_mock
+                ),
+                "input": normalized_input,
+                "started_at": time.monotonic(),
+            }
+
+
+# Poll a pending analysis. Each script run waits at most one poll interval
+# and then reruns, so widget interactions are never blocked by slow inference.
+if "pending_analysis" in st.session_state:
+    pending = st.session_state.pending_analysis
+    future = pending["future"]
+    normalized_input = pending["input"]
+
+    with st.spinner("🔄 Analyzing your input with PHQ-8 validated AI model..."):
+        wait([future], timeout=ANALYSIS_POLL_SECONDS)
+        if not future.done():
+            st.rerun()
+
+        # Optional minimum spinner time, overlapped with the analysis itself
+        remaining = ANALYSIS_MIN_DISPLAY_SECONDS - (time.monotonic() - pending["started_at"])
+        if remaining > 0:
+            time.sleep(remaining)
+
+        del st.session_state.pending_analysis
+
+        try:
+            # Re-raises any exception from the background analysis
+            result = future.result()
+
+            # Log results
+            logger.info(
+                f"Analysis complete - Risk: {result['risk_level']}, "
+                f"Confidence: {result['confidence_percent']}, "
+                f"PHQ-8: {result['phq8_score']}"
+            )
+
+            st.session_state.analysis_done = True
+            st.session_state.result = result
+            st.session_state.result["timestamp"] = datetime.now()
+            st.session_state.analysis_count = (
+                st.session_state.get("analysis_count", 0) + 1
+            )
+
+            st.success("✅ Analysis completed successfully!")
+
+        except ImportError as e:
+            logger.error(f"Import error: {str(e)}")
+            st.error("❌ Model dependencies not found. Attempting fallback...")
+            try:
+                # Fallback to mock model
+                logger.info("Falling back to mock model...")
+                result = analyze_depression_risk(normalized_input, use_mock=True)
+                st.session_state.analysis_done = True
+                st.session_state.result = result
+                st.session_state.result["timestamp"] = datetime.now()
+                st.warning(
+                    "⚠️ Using demo model (mock). For production, ensure all dependencies are installed."
+                )
+            except Exception as fallback_error:
+                logger.error(f"Fallback failed: {str(fallback_error)}")
+                st.error(
+                    f"❌ Both model and fallback failed: {str(fallback_error)}"
+                )
+
+        except FileNotFoundError as e:
+            logger.error(f"Model file not found: {str(e)}")
+            st.error("❌ Model weights not found. Switching to demo mode...")
+            try:
+                result = analyze_depression_risk(normalized_input, use_mock=True)
+                st.session_state.analysis_done = True
+                st.session_state.result = result
+                st.session_state.result["timestamp"] = datetime.now()
+                st.info(
+                    "ℹ️ Using demo model. Train the model using: python train_model.py"
+                )
+            except Exception as fallback_error:
+                logger.error(f"Fallback failed: {str(fallback_error)}")
+                st.error(f"❌ Analysis failed: {str(fallback_error)}")
+
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+            st.error(f"❌ An unexpected error occurred: {str(e)}")
+            st.info("💡 Troubleshooting tips:")
+            st.info(
+                "1. Check that all dependencies are installed: pip install -r requirements.txt"
+            )
+            st.info("2. Try enabling Demo mode checkbox")
+            st.info("3. Ensure model weights are in model/fine_tuned_model/")
+
+            # Attempt one last fallback
+            try:
+                logger.info("Final fallback attempt...")
+                result = analyze_depression_risk(normalized_input, use_mock=True)
+                st.session_state.analysis_done = True
+                st.session_state.result = result
+                st.session_state.result["timestamp"] = datetime.now()
+                st.warning("⚠️ Recovered using demo model")
+            except:
+                pass
 
 
 # Display results if analysis is done
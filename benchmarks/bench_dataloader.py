@@ -0,0 +1,108 @@
+"""
+Training throughput benchmark for DataLoader workers and torch threads.
+Runs a few fine-tuning steps of train_model's pipeline for every combination
+of DataLoader workers and intra-op threads and reports samples/sec.
+
+The model is randomly initialised from MODEL_DIR's config (same architecture
+and cost as the fine-tuned one), so no pretrained download is needed.
+
+Usage:
+    python benchmarks/bench_dataloader.py [--workers 0,2,4] [--threads 1,2,4,8] [--steps 20]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import torch  # noqa: E402
+from torch.utils.data import DataLoader  # noqa: E402
+from transformers import (  # noqa: E402
+    DistilBertConfig,
+    DistilBertForSequenceClassification,
+)
+
+from config import MODEL_DIR  # noqa: E402
+from model_files import load_tokenizer  # noqa: E402
+from train_model import (  # noqa: E402
+    DynamicPaddingCollator,
+    LengthBucketSampler,
+    MentalHealthDataset,
+    configure_threads,
+    load_data,
+    loader_options,
+)
+
+DATA_PATH = "data/training_data.csv"
+WARMUP_STEPS = 3
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(",") if v]
+
+
+def run(dataset, collator, args, num_workers, threads):
+    """Time args.steps training steps for one setting; returns samples/sec."""
+    configure_threads(threads, num_workers=num_workers)
+    torch.manual_seed(0)
+    model = DistilBertForSequenceClassification(DistilBertConfig.from_pretrained(MODEL_DIR, num_labels=2))
+    model.train()
+    optimizer = torch.optim.AdamW(model.parameters(), lr=2e-5)
+
+    loader = DataLoader(
+        dataset,
+        batch_sampler=LengthBucketSampler(dataset.lengths, args.batch_size),
+        collate_fn=collator,
+        **loader_options(num_workers, False, args.persistent_workers, args.prefetch_factor),
+    )
+
+    batches = itertools.chain.from_iterable(itertools.repeat(loader))
+    samples = 0
+    for step in range(WARMUP_STEPS + args.steps):
+        if step == WARMUP_STEPS:
+            start = time.perf_counter()
+            samples = 0
+        batch = next(batches)
+        samples += len(batch["labels"])
+
+        optimizer.zero_grad()
+        model(**batch).loss.backward()
+        optimizer.step()
+
+    return samples / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=_int_list, default=[0, 2, 4], help="Comma-separated worker counts")
+    parser.add_argument("--threads", type=_int_list, default=None,
+                        help="Comma-separated intra-op thread counts (default: 1, half and all cores)")
+    parser.add_argument("--steps", type=int, default=20, help="Timed training steps per setting")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--prefetch-factor", type=int, default=None)
+    parser.add_argument("--persistent-workers", action="store_true")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    threads = args.threads or sorted({1, max(1, cores // 2), cores})
+
+    texts, labels = load_data(DATA_PATH)
+    tokenizer = load_tokenizer(MODEL_DIR)
+    dataset = MentalHealthDataset(texts, labels, tokenizer)
+    collator = DynamicPaddingCollator(tokenizer.pad_token_id)
+
+    print(f"\n{'workers':>8} {'threads':>8} {'samples/sec':>12}")
+    results = {}
+    for num_workers, intra in itertools.product(args.workers, threads):
+        results[(num_workers, intra)] = run(dataset, collator, args, num_workers, intra)
+        print(f"{num_workers:>8} {intra:>8} {results[(num_workers, intra)]:>12.1f}")
+
+    (best_workers, best_threads), best = max(results.items(), key=lambda item: item[1])
+    print(f"\nBest: --num-workers {best_workers} --intra-op-threads {best_threads} ({best:.1f} samples/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Throughput benchmark for EnsembleIntentClassifier batch prediction.
+Compares the per-text predict() loop against predict_batch (dicts and
+columnar) and predict_stream on the bundled datasets.
+
+Usage:
+    python benchmarks/bench_ensemble_batch.py [--repeat 5] [--chunk-size 4096]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np  # noqa: E402
+
+from train_ensemble_classifier import EnsembleIntentClassifier  # noqa: E402
+
+DATA_FILES = ["data/training_data.csv", "data/intent_classification_data.csv"]
+
+
+def load_texts():
+    texts = []
+    for path in DATA_FILES:
+        with open(path, newline="", encoding="utf-8") as f:
+            texts.extend(row["text"] for row in csv.DictReader(f))
+    return texts
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus")
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    classifier = EnsembleIntentClassifier()
+    if not classifier.load_model():
+        raise SystemExit("No trained model; run train_ensemble_classifier.py first")
+    texts = load_texts()
+
+    loop_time, loop_results = timed(lambda: [classifier.predict(t) for t in texts], args.repeat)
+    batch_time, batch_results = timed(lambda: classifier.predict_batch(texts), args.repeat)
+    columnar_time, columns = timed(lambda: classifier.predict_batch(texts, columnar=True), args.repeat)
+    stream_time, _ = timed(lambda: list(classifier.predict_stream(texts, args.chunk_size)), args.repeat)
+
+    if batch_results != loop_results:
+        print("❌ predict_batch results differ from predict()")
+        sys.exit(1)
+    assert np.array_equal(columns["label"], [r["label"] for r in loop_results])
+    print(f"✅ {len(texts)} predictions identical\n")
+
+    for name, elapsed in [
+        ("predict() loop", loop_time),
+        ("predict_batch", batch_time),
+        ("predict_batch columnar", columnar_time),
+        (f"predict_stream ({args.chunk_size})", stream_time),
+    ]:
+        print(f"{name:<26} {len(texts) / elapsed:>12,.0f} texts/sec  ({loop_time / elapsed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Throughput benchmark for InputValidator.validate_input.
+Compares the precompiled rule tables against the original per-request
+regex loop on the bundled datasets.
+
+Usage:
+    python benchmarks/bench_input_validator.py [--repeat 20]
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from input_validator import InputValidator  # noqa: E402
+
+DATA_FILES = ["data/training_data.csv", "data/intent_classification_data.csv"]
+
+
+def legacy_validate_input(validator, text):
+    """validate_input as it was before the rules were precompiled."""
+    if not text or not text.strip():
+        return False, "empty", {"message": "Input is empty"}
+
+    text_lower = text.lower().strip()
+    word_count = len(text.split())
+
+    for phrase in validator.CASUAL_PHRASES:
+        if " " in phrase:
+            if phrase in text_lower:
+                return False, "casual", {
+                    "message": "Casual conversation detected",
+                    "matched_phrase": phrase,
+                }
+        else:
+            pattern = r'\b' + re.escape(phrase) + r'\b'
+            if re.search(pattern, text_lower):
+                return False, "casual", {
+                    "message": "Casual conversation detected",
+                    "matched_phrase": phrase,
+                }
+
+    for pattern in validator.QUESTION_PATTERNS:
+        if re.search(pattern, text_lower):
+            return False, "question", {
+                "message": "Non-descriptive question detected",
+                "matched_pattern": pattern,
+            }
+
+    if word_count < 5:
+        return False, "short", {
+            "message": "Input too short (less than 5 words)",
+            "word_count": word_count,
+        }
+
+    feeling_matches = set(text_lower.split()) & validator.ALL_FEELING_KEYWORDS
+    if feeling_matches:
+        return True, "genuine", {
+            "message": "Genuine feeling description detected",
+            "matched_keywords": list(feeling_matches),
+            "keyword_count": len(feeling_matches),
+        }
+
+    if word_count > 5:
+        return False, "neutral", {
+            "message": "No emotional/feeling keywords found",
+            "word_count": word_count,
+        }
+
+    return True, "accepted", {"message": "Input accepted"}
+
+
+def load_texts():
+    """Load every text from the bundled CSV datasets."""
+    texts = []
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    for path in DATA_FILES:
+        with open(os.path.join(root, path), newline="", encoding="utf-8") as f:
+            texts.extend(row["text"] for row in csv.DictReader(f))
+    return texts
+
+
+def measure(fn, texts, repeat):
+    """Return texts/second for fn over the corpus."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    return len(texts) * repeat / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the corpus")
+    args = parser.parse_args()
+
+    validator = InputValidator()
+    texts = load_texts()
+
+    mismatches = [
+        t for t in texts
+        if validator.validate_input(t) != legacy_validate_input(validator, t)
+    ]
+    if mismatches:
+        print(f"❌ {len(mismatches)} decisions differ, e.g. {mismatches[0]!r}")
+        sys.exit(1)
+
+    legacy = measure(lambda t: legacy_validate_input(validator, t), texts, args.repeat)
+    current = measure(validator.validate_input, texts, args.repeat)
+
+    print(f"Corpus: {len(texts)} texts x {args.repeat} passes (decisions identical)")
+    print(f"  Legacy regex loop:   {legacy:>12,.0f} texts/sec")
+    print(f"  Precompiled rules:   {current:>12,.0f} texts/sec")
+    print(f"  Speedup:             {current / legacy:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Import-time (cold start) report for the serving modules.
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter per
+module, prints the heaviest packages and fails if a serving module
+loads a training-only or heavy ML dependency.
+
+Usage:
+    python benchmarks/bench_startup.py [module ...] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import Counter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# What the Streamlit app and API workers import before serving a request
+SERVING_MODULES = ["api", "model_resources"]
+
+# Must not be imported just to serve predictions (see intent_classifier.py
+# and the deferred imports in phq8_model.py)
+TRAINING_MODULES = ["pandas", "sklearn.model_selection", "sklearn.metrics", "torch", "transformers"]
+
+
+def import_profile(module):
+    """
+    Import module in a fresh interpreter with -X importtime.
+
+    Returns:
+        list: (depth, self_us, cumulative_us, name) per imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two extra spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=SERVING_MODULES)
+    parser.add_argument("--top", type=int, default=15, help="Packages to list")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        rows = import_profile(module)
+        total_ms = sum(r[2] for r in rows if r[0] == 0) / 1000
+        loaded = {r[3] for r in rows}
+
+        # Self time summed per top-level package (numpy, numpy.linalg, ... -> numpy)
+        packages = Counter()
+        for _, self_us, _, name in rows:
+            packages[name.split(".")[0]] += self_us
+
+        print(f"\nimport {module}: {total_ms:,.0f} ms, {len(rows)} modules")
+        for name, self_us in packages.most_common(args.top):
+            print(f"  {self_us / 1000:>9,.1f} ms  {name}")
+
+        heavy = [name for name in TRAINING_MODULES if name in loaded]
+        if heavy:
+            failed = True
+            print(f"❌ {module} imports {', '.join(heavy)}")
+        else:
+            print("✅ no training/ML framework imports")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
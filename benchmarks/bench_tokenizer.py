@@ -0,0 +1,81 @@
+"""
+Tokenizer throughput benchmark.
+Compares the pure-Python DistilBertTokenizer (one call per text) against the
+fast, Rust-backed tokenizer called per text and on the whole list, and checks
+that every variant produces identical token ids.
+
+Usage:
+    python benchmarks/bench_tokenizer.py [--repeat 5] [--max-length 128]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from transformers import DistilBertTokenizer  # noqa: E402
+
+from config import TOKENIZER_PATH  # noqa: E402
+from model_files import load_tokenizer  # noqa: E402
+
+DATA_FILES = ["data/training_data.csv", "data/intent_classification_data.csv"]
+
+
+def load_texts():
+    texts = []
+    for path in DATA_FILES:
+        with open(path, newline="", encoding="utf-8") as f:
+            texts.extend(row["text"] for row in csv.DictReader(f))
+    return texts
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus")
+    parser.add_argument("--max-length", type=int, default=128)
+    args = parser.parse_args()
+
+    texts = load_texts()
+    fast = load_tokenizer(TOKENIZER_PATH)
+    options = {"truncation": True, "max_length": args.max_length}
+
+    variants = {
+        "fast, one call per text": lambda: [fast(t, **options)["input_ids"] for t in texts],
+        "fast, batched": lambda: fast(texts, **options)["input_ids"],
+    }
+    slow = DistilBertTokenizer.from_pretrained(TOKENIZER_PATH, local_files_only=True)
+    if slow.is_fast:
+        # transformers >= 5 only ships the fast implementation
+        print("Pure-Python tokenizer unavailable; comparing fast variants only")
+    else:
+        variants = {"slow, one call per text": lambda: [slow(t, **options)["input_ids"] for t in texts], **variants}
+
+    timings = {}
+    reference = None
+    for name, fn in variants.items():
+        timings[name], ids = timed(fn, args.repeat)
+        if reference is None:
+            reference = ids
+        elif ids != reference:
+            print(f"❌ {name} produced different token ids")
+            sys.exit(1)
+    tokens = sum(len(ids) for ids in reference)
+    print(f"✅ {len(texts)} texts, {tokens} tokens: ids identical across variants\n")
+
+    baseline = next(iter(timings.values()))
+    for name, elapsed in timings.items():
+        print(f"{name:<26} {tokens / elapsed:>12,.0f} tokens/sec  ({baseline / elapsed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
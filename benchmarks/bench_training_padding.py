@@ -0,0 +1,105 @@
+"""
+Training throughput benchmark for train_model.
+Compares fixed max_length padding against dynamic per-batch padding with
+length-bucketed batches, reporting real (non-padding) tokens/sec.
+
+Usage:
+    python benchmarks/bench_training_padding.py [--steps 30] [--batch-size 16]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import torch  # noqa: E402
+from torch.utils.data import DataLoader  # noqa: E402
+from transformers import (  # noqa: E402
+    DistilBertConfig,
+    DistilBertForSequenceClassification,
+)
+
+from config import MODEL_DIR, TOKENIZER_PATH  # noqa: E402
+from model_files import load_tokenizer  # noqa: E402
+from train_model import (  # noqa: E402
+    DynamicPaddingCollator,
+    LengthBucketSampler,
+    MentalHealthDataset,
+    load_data,
+)
+
+DATA_PATH = "data/training_data.csv"
+
+
+def run(tokenizer, texts, labels, dynamic_padding, steps, batch_size, max_length):
+    """Run a fixed number of training steps and return throughput stats."""
+    torch.manual_seed(0)
+    # Built from the local config (random weights): throughput does not depend
+    # on the weights and no hub download is needed
+    model = DistilBertForSequenceClassification(DistilBertConfig.from_pretrained(MODEL_DIR, num_labels=2))
+    model.train()
+    optimizer = torch.optim.AdamW(model.parameters(), lr=2e-5)
+
+    dataset = MentalHealthDataset(texts, labels, tokenizer, max_length)
+    collator = DynamicPaddingCollator(
+        tokenizer.pad_token_id, max_length=None if dynamic_padding else max_length
+    )
+    if dynamic_padding:
+        loader = DataLoader(
+            dataset, batch_sampler=LengthBucketSampler(dataset.lengths, batch_size), collate_fn=collator
+        )
+    else:
+        loader = DataLoader(dataset, batch_size=batch_size, shuffle=True, collate_fn=collator)
+
+    real_tokens = padded_tokens = 0
+    batches = itertools.chain.from_iterable(itertools.repeat(loader))
+    start = time.perf_counter()
+    for _ in range(steps):
+        batch = next(batches)
+        real_tokens += int(batch["attention_mask"].sum())
+        padded_tokens += batch["input_ids"].numel()
+
+        optimizer.zero_grad()
+        loss = model(**batch).loss
+        loss.backward()
+        optimizer.step()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "tokens_per_sec": real_tokens / elapsed,
+        "padding_ratio": 1 - real_tokens / padded_tokens,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=30, help="Training steps per mode")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--max-length", type=int, default=128)
+    args = parser.parse_args()
+
+    torch.set_num_threads(os.cpu_count() or 1)
+    texts, labels = load_data(DATA_PATH)
+    tokenizer = load_tokenizer(TOKENIZER_PATH)
+
+    results = {}
+    for name, dynamic_padding in (("fixed (max_length)", False), ("dynamic + buckets", True)):
+        results[name] = run(
+            tokenizer, texts, labels, dynamic_padding, args.steps, args.batch_size, args.max_length
+        )
+        stats = results[name]
+        print(
+            f"{name:<20} {stats['tokens_per_sec']:>10,.0f} tokens/sec  "
+            f"{stats['seconds']:6.1f}s  {stats['padding_ratio']:.0%} padding"
+        )
+
+    before, after = results.values()
+    print(f"\nSpeedup: {after['tokens_per_sec'] / before['tokens_per_sec']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Latency/throughput benchmark suite for the screening pipeline.
+Times every serving component at batch sizes 1/8/64 on short, medium and
+long inputs, writes the results as JSON and compares them against a
+previous run to catch regressions between commits.
+
+Components:
+    validate_input     InputValidator.validate_input (per text)
+    is_gibberish       InputValidator.is_gibberish (per text)
+    intent_predict     EnsembleIntentClassifier.predict / predict_batch
+    symptoms           PHQ8SymptomDetector.analyze_symptoms (per text)
+    phq8_mock          PHQ8DepressionDetector.analyze / analyze_batch, mock model
+    phq8_model         PHQ8DepressionDetector.analyze / analyze_batch, fine-tuned
+                       model (skipped when the weights are not installed)
+
+Inputs are built from data/training_data.csv with a fixed seed, so every run
+(and every commit) times the same texts. The result cache is bypassed.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json [--threshold 0.2]
+    python benchmarks/run_benchmarks.py --only phq8 --batch-sizes 1 64
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+DATA_FILE = "data/training_data.csv"
+BATCH_SIZES = [1, 8, 64]
+# Texts joined from the corpus per input: ~10, ~50 and ~250 words
+TEXT_LENGTHS = {"short": 1, "medium": 5, "long": 25}
+SEED = 0
+
+
+def build_inputs(lengths=TEXT_LENGTHS, count=max(BATCH_SIZES), seed=SEED):
+    """
+    Build the benchmark inputs from the bundled corpus.
+
+    Returns:
+        dict: Length name -> list of count distinct texts.
+    """
+    with open(os.path.join(ROOT, DATA_FILE), newline="", encoding="utf-8") as f:
+        corpus = [row["text"] for row in csv.DictReader(f)]
+
+    rng = random.Random(seed)
+    inputs = {}
+    for name, sentences in lengths.items():
+        inputs[name] = [" ".join(rng.sample(corpus, sentences)) for _ in range(count)]
+    return inputs
+
+
+def per_text(fn):
+    """Run a single-input function over every text of the batch."""
+    return lambda texts: [fn(text) for text in texts]
+
+
+def batched(single, batch):
+    """Use the single-input entry point for batch size 1, the batch one otherwise."""
+    return lambda texts: single(texts[0]) if len(texts) == 1 else batch(texts)
+
+
+def load_components(only=None):
+    """
+    Load every component being benchmarked.
+
+    Returns:
+        tuple: ({name: fn(texts)}, {name: reason skipped}).
+    """
+    from input_validator import InputValidator
+    from intent_classifier import EnsembleIntentClassifier
+    from phq8_model import PHQ8DepressionDetector
+    from phq8_symptom_detector import PHQ8SymptomDetector
+
+    def wanted(name):
+        return not only or any(pattern in name for pattern in only)
+
+    components, skipped = {}, {}
+
+    validator = InputValidator()
+    if wanted("validate_input"):
+        components["validate_input"] = per_text(validator.validate_input)
+    if wanted("is_gibberish"):
+        components["is_gibberish"] = per_text(validator.is_gibberish)
+
+    if wanted("intent_predict"):
+        classifier = EnsembleIntentClassifier()
+        if classifier.load_model():
+            components["intent_predict"] = batched(classifier.predict, classifier.predict_batch)
+        else:
+            skipped["intent_predict"] = "no trained model (run train_ensemble_classifier.py)"
+
+    if wanted("symptoms"):
+        components["symptoms"] = per_text(PHQ8SymptomDetector().analyze_symptoms)
+
+    for name, use_mock in (("phq8_mock", True), ("phq8_model", False)):
+        if not wanted(name):
+            continue
+        detector = PHQ8DepressionDetector(use_mock=use_mock)
+        if detector.use_mock != use_mock:
+            skipped[name] = "fine-tuned model weights not found (run train_model.py)"
+            continue
+        # Time the pipeline itself, not cache lookups
+        detector.result_cache = None
+        components[name] = batched(detector.analyze, detector.analyze_batch)
+
+    return components, skipped
+
+
+def measure(fn, texts, rounds, warmup):
+    """
+    Time fn(texts) over several rounds.
+
+    Returns:
+        dict: Per-batch latency in milliseconds and throughput in texts/second.
+    """
+    for _ in range(warmup):
+        fn(texts)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(texts)
+        samples.append(time.perf_counter() - start)
+
+    median = statistics.median(samples)
+    return {
+        "rounds": rounds,
+        "median_ms": median * 1000,
+        "min_ms": min(samples) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "stdev_ms": statistics.stdev(samples) * 1000 if rounds > 1 else 0.0,
+        "texts_per_sec": len(texts) / median,
+    }
+
+
+def rounds_for(batch_size, target_texts):
+    """Rounds so that each case processes roughly target_texts inputs."""
+    return max(5, target_texts // batch_size)
+
+
+def environment():
+    """Describe where the results were produced."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(components, inputs, batch_sizes, target_texts, warmup):
+    """
+    Run every component at every text length and batch size.
+
+    Returns:
+        list: One result dict per case.
+    """
+    results = []
+    for name, fn in components.items():
+        for length, texts in inputs.items():
+            for batch_size in batch_sizes:
+                stats = measure(fn, texts[:batch_size], rounds_for(batch_size, target_texts), warmup)
+                results.append(dict(benchmark=name, length=length, batch_size=batch_size, **stats))
+                print(
+                    f"{name:<15} {length:<7} batch={batch_size:<3} "
+                    f"{stats['median_ms']:>10.3f} ms  {stats['texts_per_sec']:>12,.0f} texts/sec",
+                    flush=True,
+                )
+    return results
+
+
+def case_key(result):
+    return result["benchmark"], result["length"], result["batch_size"]
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare median latencies against a baseline run.
+
+    Args:
+        results (list): Current results.
+        baseline (list): Results loaded from an earlier JSON file.
+        threshold (float): Relative slowdown reported as a regression (0.2 = 20%).
+
+    Returns:
+        list: (case, baseline_ms, current_ms, ratio) for every regressed case.
+    """
+    previous = {case_key(r): r for r in baseline}
+    regressions = []
+    print(f"\n{'case':<38} {'baseline':>11} {'current':>11} {'change':>8}")
+    for result in results:
+        key = case_key(result)
+        if key not in previous:
+            continue
+        before, after = previous[key]["median_ms"], result["median_ms"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append((key, before, after, ratio))
+            flag = "  ❌"
+        elif ratio < 1 - threshold:
+            flag = "  ✅"
+        case = f"{key[0]} {key[1]} batch={key[2]}"
+        print(f"{case:<38} {before:>8.3f} ms {after:>8.3f} ms {ratio - 1:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="+", help="Run benchmarks whose name contains any of these")
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=BATCH_SIZES)
+    parser.add_argument("--lengths", nargs="+", choices=list(TEXT_LENGTHS), default=list(TEXT_LENGTHS))
+    parser.add_argument("--target-texts", type=int, default=640,
+                        help="Inputs processed per case (sets the number of rounds)")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed rounds per case")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Slowdown vs. the baseline reported as a regression")
+    args = parser.parse_args()
+
+    components, skipped = load_components(args.only)
+    for name, reason in skipped.items():
+        print(f"⚠️  skipping {name}: {reason}")
+
+    inputs = build_inputs({name: TEXT_LENGTHS[name] for name in args.lengths}, max(args.batch_sizes))
+    results = run(components, inputs, args.batch_sizes, args.target_texts, args.warmup)
+
+    report = {
+        "environment": environment(),
+        "settings": {
+            "batch_sizes": args.batch_sizes,
+            "lengths": {name: TEXT_LENGTHS[name] for name in args.lengths},
+            "target_texts": args.target_texts,
+            "warmup": args.warmup,
+            "seed": SEED,
+        },
+        "skipped": skipped,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+        print(f"\n✅ no regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
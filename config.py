@@ -11,6 +11,140 @@ MODEL_DIR = "model/fine_tuned_model"
 # This should match the base model used for fine-tuning.
 TOKENIZER_NAME = "distilbert-base-uncased"
 
+# Local tokenizer files (vocab.txt + tokenizer_config.json) for the fast,
+# Rust-backed tokenizer. Loaded offline, with no Hugging Face hub lookup.
+TOKENIZER_PATH = MODEL_DIR
+
+# Directory containing the TF-IDF + Logistic Regression intent classifier.
+ENSEMBLE_MODEL_DIR = "model/ensemble_intent"
+
+# Confidence threshold for the ML intent classifier in the hybrid pipeline.
+ML_INTENT_THRESHOLD = 0.6
+
+# Intent classifier features: "tfidf" (pickled TfidfVectorizer) or "hashing"
+# (stateless HashingVectorizer + stored IDF/weight arrays in hashing_model.npz).
+# Train the hashing model with `python train_ensemble_classifier.py --vectorizer hashing`.
+ENSEMBLE_VECTORIZER = "tfidf"
+
+
+# --- Quantization Configuration ---
+# Serve the PHQ-8 model with dynamic INT8 quantization of its Linear layers
+# (faster, smaller CPU inference). Check `python quantization.py report` first.
+QUANTIZE_MODEL = False
+
+# Quantized state dict written by `python quantization.py export`. If it is
+# missing, the float32 weights in MODEL_DIR are quantized at load time.
+QUANTIZED_MODEL_PATH = "model/fine_tuned_model_int8/model_int8.pt"
+
+
+# --- Inference Backend Configuration ---
+# Backend for the PHQ-8 model: "torch" (eager PyTorch) or "onnx" (ONNX Runtime,
+# lower per-call overhead at small batch sizes). Export with
+# `python onnx_backend.py export` and verify with `python onnx_backend.py parity`.
+INFERENCE_BACKEND = "torch"
+
+# Exported ONNX graphs (dynamic batch and sequence axes).
+ONNX_MODEL_PATH = "model/fine_tuned_model_onnx/model.onnx"
+ONNX_INTENT_MODEL_PATH = "model/intent_classifier_onnx/model.onnx"
+
+
+# --- Training Cache Configuration ---
+# Pre-tokenized datasets (memory-mapped .npy), keyed by tokenizer + data hash.
+# Safe to delete; entries are rebuilt on the next training run.
+TOKEN_CACHE_DIR = "cache/tokens"
+
+
+# --- Inference Batching Configuration ---
+# Concurrent analyze() requests are coalesced into a single forward pass.
+# Maximum number of requests padded together into one batch.
+BATCH_MAX_SIZE = 16
+
+# Maximum time (milliseconds) the batcher waits for more requests after
+# the first one arrives before running the batch.
+BATCH_MAX_WAIT_MS = 10
+
+
+# --- UI Analysis Configuration ---
+# Worker threads that run PHQ-8 analysis in the background for the Streamlit app.
+ANALYSIS_WORKERS = 4
+
+# How long (seconds) one script run waits on a pending analysis before
+# rerunning, so other widgets stay responsive during slow inference.
+ANALYSIS_POLL_SECONDS = 0.25
+
+# Minimum time (seconds) the analysis spinner is shown. It overlaps the
+# analysis instead of adding to it; set to 0 to disable.
+ANALYSIS_MIN_DISPLAY_SECONDS = 0.5
+
+
+# --- HTTP Inference API Configuration ---
+# Worker threads running CPU-bound inference for the ASGI service (api.py).
+API_WORKERS = 4
+
+# Requests admitted at once (running + queued); extra requests get HTTP 503.
+API_MAX_PENDING = 64
+
+# Maximum number of texts accepted by /analyze/batch.
+API_MAX_BATCH_TEXTS = 256
+
+# Maximum request body size in bytes.
+API_MAX_BODY_BYTES = 1_000_000
+
+# Seconds to wait for in-flight requests to finish on shutdown.
+API_SHUTDOWN_TIMEOUT = 30
+
+# Synthetic inputs run through every model at startup (see
+# model_resources.warm_up) so the first real request does not pay for lazy
+# allocations and the first slow forward pass. Varied lengths exercise padding.
+WARMUP_TEXTS = [
+    "hi there",
+    "I feel tired and hopeless and I can't sleep at night",
+    "Lately I have been feeling down most days, I lost interest in things I used "
+    "to enjoy, I struggle to concentrate at work and I feel like a failure.",
+]
+
+
+# --- Scoring Configuration ---
+# Derive the small PHQ-8 score/confidence jitter from a hash of the input text
+# instead of the global RNG, so identical inputs always get identical results
+# (required for result caching and reproducible benchmarks).
+DETERMINISTIC_SCORING = True
+
+
+# --- Stage Timing Configuration ---
+# Record per-stage latencies (validation, intent model, tokenization, forward
+# pass, symptom detection) into histograms and attach a "timings" breakdown in
+# milliseconds to classify_intent/analyze results. See stage_timing.py.
+STAGE_TIMING_ENABLED = True
+
+
+# --- Metrics Configuration ---
+# Prometheus text-format exporter (metrics.py), started by app.py and api.py.
+# Bound to localhost by default; set METRICS_PORT = None to disable it.
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9464
+
+
+# --- Result Cache Configuration ---
+# Cache classify_intent and PHQ-8 analysis results for repeated inputs.
+# Keys are HMACs of the normalized text and cached results hold only labels,
+# scores and symptom names (matched input words are dropped), so no user text
+# is stored.
+RESULT_CACHE_ENABLED = True
+
+# Maximum number of cached results per process.
+RESULT_CACHE_MAX_ENTRIES = 2048
+
+# Maximum total size (bytes) of the serialized cached results.
+RESULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Seconds before a cached result expires (None = only evicted by the caps).
+RESULT_CACHE_TTL_SECONDS = 3600
+
+# HMAC key for cache keys. None generates a random key per process, which is
+# fine because the cache lives in process memory.
+RESULT_CACHE_SECRET = None
+
 
 # --- Risk Scoring Configuration ---
 # PHQ-8 based thresholds for depression severity
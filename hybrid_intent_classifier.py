@@ -4,11 +4,27 @@ Combines rule-based validation + ML classifier for robust intent detection
 """
 
 from input_validator import InputValidator
-from train_ensemble_classifier import EnsembleIntentClassifier
+from intent_classifier import EnsembleIntentClassifier
+from text_normalization import normalize
+from model_files import model_fingerprint
+from metrics import counter
+from result_cache import get_result_cache
+from stage_timing import attach, collect, stage
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Counted on every call, cached or not; rejections have is_valid="false"
+DECISIONS = counter(
+    "mannkibaat_intent_decisions_total",
+    "Intent classifications by final decision.",
+    ["final_decision", "is_valid"],
+)
+
+# Stage-1 metadata that echoes words of the input. Dropped from results so
+# that nothing taken from user text is kept in the result cache.
+INPUT_DERIVED_METADATA = ('matched_keywords', 'matched_phrase', 'matched_pattern')
+
 
 class HybridIntentClassifier:
     """
@@ -19,15 +35,16 @@ class HybridIntentClassifier:
     Only proceeds to depression assessment if BOTH stages approve.
     """
     
-    def __init__(self, use_ml=True, ml_threshold=0.6):
+    def __init__(self, use_ml=True, ml_threshold=0.6, validator=None):
         """
         Initialize hybrid classifier.
         
         Args:
             use_ml: Whether to use ML classifier (False = rules only)
             ml_threshold: Confidence threshold for ML predictions (0.6 = 60%)
+            validator: Shared InputValidator to reuse (a new one is created if None)
         """
-        self.validator = InputValidator()
+        self.validator = validator if validator is not None else InputValidator()
         self.use_ml = use_ml
         self.ml_threshold = ml_threshold
         self.ml_classifier = None
@@ -43,11 +60,25 @@ class HybridIntentClassifier:
             except Exception as e:
                 logger.error(f"❌ Failed to load ML classifier: {e}")
                 self.use_ml = False
+        
+        # Results are cached per model version (see result_cache.py)
+        self.result_cache = get_result_cache()
+        self.model_version = self._model_version()
+    
+    def _model_version(self):
+        """Identify the loaded model and settings for result caching."""
+        if not self.use_ml:
+            return "intent:rules"
+        ml = self.ml_classifier
+        return f"intent:{ml.vectorizer_type}:{self.ml_threshold}:{model_fingerprint((ml.model_dir,))}"
     
     def classify_intent(self, text):
         """
         Two-stage intent classification.
         
+        Args:
+            text: User input (str or the request's shared NormalizedText)
+        
         Returns:
             dict: {
                 'is_valid': bool,  # True if should proceed to depression assessment
@@ -57,9 +88,25 @@ class HybridIntentClassifier:
                 'confidence': float,  # Overall confidence
                 'method': str,  # 'rules', 'ml', or 'hybrid'
                 'message': str,  # User-facing message
-                'examples': str  # Helpful examples if rejected
+                'examples': str,  # Helpful examples if rejected
+                'timings': dict  # ms per stage, when stage timing is enabled
             }
         """
+        with collect() as timings:
+            # Normalize once; the cache key and both stages reuse the cached forms
+            text = normalize(text)
+            if self.result_cache is None:
+                result = self._classify_intent(text)
+            else:
+                result = self.result_cache.get_or_compute(
+                    "intent", text, self.model_version, lambda: self._classify_intent(text)
+                )
+        DECISIONS.labels(result['final_decision'], 'true' if result['is_valid'] else 'false').inc()
+        # Attached outside the cache, so cached results never carry stale timings
+        return attach(result, timings)
+    
+    def _classify_intent(self, text):
+        """Run both classification stages on a normalized input."""
         result = {
             'is_valid': False,
             'stage1_result': None,
@@ -77,7 +124,7 @@ class HybridIntentClassifier:
         result['stage1_result'] = {
             'is_valid': is_valid_rules,
             'type': validation_type,
-            'metadata': metadata
+            'metadata': {k: v for k, v in metadata.items() if k not in INPUT_DERIVED_METADATA}
         }
         
         logger.info(f"Stage 1 (Rules): {validation_type} - valid={is_valid_rules}")
@@ -96,7 +143,8 @@ class HybridIntentClassifier:
         # ===== STAGE 2: ML CLASSIFICATION (if enabled) =====
         if self.use_ml and self.ml_classifier:
             try:
-                ml_result = self.ml_classifier.predict(text)
+                with stage("intent_model"):
+                    ml_result = self.ml_classifier.predict(text)
                 result['stage2_result'] = ml_result
                 
                 ml_intent = ml_result['intent']
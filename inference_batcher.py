@@ -0,0 +1,278 @@
+"""
+Micro-batching inference server for the PHQ-8 depression detector.
+Coalesces concurrent analyze() calls into a single padded forward pass.
+"""
+
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+from config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS
+from metrics import gauge, histogram
+from stage_timing import attach, collect
+
+BATCH_SIZE = histogram(
+    "mannkibaat_batcher_batch_size",
+    "Requests coalesced into each micro-batcher forward pass.",
+    buckets=[2 ** i for i in range(11)],
+)
+REQUEST_SECONDS = histogram(
+    "mannkibaat_batcher_request_seconds",
+    "Time from submit() to result for micro-batched requests.",
+    buckets=[0.001 * 2 ** i for i in range(15)],
+)
+
+
+class _PendingRequest:
+    """A single queued analyze() call."""
+
+    __slots__ = ("user_input", "future", "enqueued_at")
+
+    def __init__(self, user_input):
+        self.user_input = user_input
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class MicroBatcher:
+    """
+    Request-coalescing batcher around PHQ8DepressionDetector.analyze_batch.
+
+    Callers submit single texts; a background worker collects requests for up
+    to max_wait_ms (or until max_batch_size is reached), runs one batched
+    forward pass and resolves each caller's future with its own result.
+    """
+
+    def __init__(
+        self,
+        detector,
+        max_batch_size=BATCH_MAX_SIZE,
+        max_wait_ms=BATCH_MAX_WAIT_MS,
+        latency_window=1000,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            detector: Object exposing analyze_batch(list_of_texts).
+            max_batch_size (int): Maximum requests per forward pass.
+            max_wait_ms (float): Maximum time to wait for a batch to fill.
+            latency_window (int): Number of recent request latencies kept for stats.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.detector = detector
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._worker = None
+        self._running = False
+        # Held across the running check and the put, so stop() cannot strand a request
+        self._state_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._latencies = deque(maxlen=latency_window)
+        self._completed = 0
+
+    def start(self):
+        """Start the background worker thread (idempotent)."""
+        with self._state_lock:
+            if self._running:
+                return self
+            self._running = True
+            self._worker = threading.Thread(
+                target=self._run, name="phq8-micro-batcher", daemon=True
+            )
+            self._worker.start()
+        return self
+
+    def stop(self, timeout=None):
+        """
+        Stop the worker after draining requests that are already queued.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the worker to exit.
+        """
+        with self._state_lock:
+            if not self._running:
+                return
+            self._running = False
+            # Nothing is admitted after the sentinel, so draining up to it serves every caller
+            self._queue.put(None)
+        self._worker.join(timeout)
+
+    def submit(self, user_input):
+        """
+        Queue a text for analysis.
+
+        Args:
+            user_input (str): Raw user input text.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the analyze() result dict.
+        """
+        request = _PendingRequest(user_input)
+        with self._state_lock:
+            if not self._running:
+                raise RuntimeError("MicroBatcher is not running; call start() first")
+            self._queue.put(request)
+        return request.future
+
+    def analyze(self, user_input, timeout=None):
+        """
+        Analyze a text through the batcher and wait for its result.
+
+        Args:
+            user_input (str): Raw user input text.
+            timeout (float, optional): Seconds to wait for the result.
+
+        Returns:
+            dict: Assessment result, identical to PHQ8DepressionDetector.analyze().
+        """
+        return self.submit(user_input).result(timeout)
+
+    def _collect_batch(self, first):
+        """Gather requests until the batch is full or the wait window closes."""
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                # Stop sentinel: put it back so the main loop sees it
+                self._queue.put(None)
+                break
+            batch.append(request)
+
+        return batch
+
+    def _run(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                self._drain()
+                return
+            self._process(self._collect_batch(request))
+
+    def _drain(self):
+        """Serve whatever is still queued after the stop sentinel."""
+        pending = []
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                pending.append(request)
+        for start in range(0, len(pending), self.max_batch_size):
+            self._process(pending[start:start + self.max_batch_size])
+
+    def _process(self, batch):
+        try:
+            with collect() as timings:
+                results = self.detector.analyze_batch([r.user_input for r in batch])
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            results = None
+
+        finished_at = time.perf_counter()
+        if results is not None:
+            # Stage timings of the batch each request was served in, when the
+            # detector recorded any (collect() always adds "total")
+            if len(timings) > 1:
+                results = [attach(result, timings) for result in results]
+            for request, result in zip(batch, results):
+                request.future.set_result(result)
+
+        BATCH_SIZE.observe(len(batch))
+        for request in batch:
+            REQUEST_SECONDS.observe(finished_at - request.enqueued_at)
+
+        with self._stats_lock:
+            self._batch_sizes[len(batch)] += 1
+            self._completed += len(batch)
+            self._latencies.extend(finished_at - r.enqueued_at for r in batch)
+
+    def stats(self):
+        """
+        Get batching statistics for tuning max_batch_size and max_wait_ms.
+
+        Returns:
+            dict: Queue depth, batch-size histogram and request latency
+                percentiles (milliseconds) over the recent window.
+        """
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            histogram = dict(sorted(self._batch_sizes.items()))
+            completed = self._completed
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "completed_requests": completed,
+            "batch_size_histogram": histogram,
+            "latency_ms": {
+                "count": len(latencies),
+                "mean": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                "p50": 1000 * _percentile(latencies, 50),
+                "p95": 1000 * _percentile(latencies, 95),
+                "p99": 1000 * _percentile(latencies, 99),
+            },
+        }
+
+
+_batchers = {}
+_batchers_lock = threading.Lock()
+
+gauge(
+    "mannkibaat_batcher_queue_depth",
+    "Requests waiting in the process-wide micro-batchers.",
+    lambda: sum(batcher._queue.qsize() for batcher in list(_batchers.values())),
+)
+
+
+def get_micro_batcher(use_mock=False, detector=None):
+    """
+    Return the process-wide batcher for a detector, starting it on first use.
+
+    When the detector changes (the registry reloaded it, or a caller passes a
+    different one) the old batcher is stopped after serving its queue and a
+    new one takes its place.
+
+    Args:
+        use_mock (bool): Whether to batch for the mock detector.
+        detector (optional): Detector to batch for (defaults to the registry's).
+
+    Returns:
+        MicroBatcher: Running batcher.
+    """
+    if detector is None:
+        from phq8_model import get_detector_registry
+
+        detector = get_detector_registry().get(use_mock=use_mock)
+
+    with _batchers_lock:
+        batcher = _batchers.get(use_mock)
+        if batcher is None or batcher.detector is not detector:
+            if batcher is not None:
+                batcher.stop(timeout=0)
+            batcher = MicroBatcher(detector).start()
+            _batchers[use_mock] = batcher
+        return batcher
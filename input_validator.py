@@ -4,7 +4,38 @@ Filters out casual/conversational inputs and validates genuine mental health con
 """
 
 import re
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional, Union
+
+from text_normalization import NormalizedText, normalize
+from stage_timing import timed
+
+# Runs of word characters; `\bphrase\b` matches exactly when one run equals phrase
+_WORD_RE = re.compile(r"\w+")
+
+
+def _compile_casual_rules(phrases: List[str]) -> Tuple[Dict[str, int], List[Tuple]]:
+    """
+    Precompile casual phrases into rule tables that preserve list order.
+
+    Single-word phrases go into one token -> rule index table that is served
+    by a single tokenization pass. Multi-word phrases (substring match) and
+    any single word containing non-word characters stay as ordered rules.
+
+    Returns:
+        Tuple of (word_rules, ordered_rules) where ordered_rules holds
+        (rule_index, phrase, compiled_pattern_or_None).
+    """
+    word_rules = {}
+    ordered_rules = []
+    for index, phrase in enumerate(phrases):
+        if " " in phrase:
+            ordered_rules.append((index, phrase, None))
+        elif _WORD_RE.fullmatch(phrase):
+            word_rules.setdefault(phrase, index)
+        else:
+            pattern = re.compile(r"\b" + re.escape(phrase) + r"\b")
+            ordered_rules.append((index, phrase, pattern))
+    return word_rules, ordered_rules
 
 
 class InputValidator:
@@ -212,16 +243,21 @@ class InputValidator:
         r"\bwhat is this\b",
     ]
 
+    # Rule tables compiled once at class load (see _match_casual_phrase)
+    _CASUAL_WORD_RULES, _CASUAL_ORDERED_RULES = _compile_casual_rules(CASUAL_PHRASES)
+    _QUESTION_RULES = [(pattern, re.compile(pattern)) for pattern in QUESTION_PATTERNS]
+
     def __init__(self):
         """Initialize the validator."""
         pass
 
-    def validate_input(self, text: str) -> Tuple[bool, str, Dict]:
+    @timed("validate_input")
+    def validate_input(self, text: Union[str, NormalizedText]) -> Tuple[bool, str, Dict]:
         """
         Main validation pipeline (Prompt 3).
 
         Args:
-            text: User input text
+            text: User input text (or its shared NormalizedText)
 
         Returns:
             Tuple of (is_valid, validation_type, metadata)
@@ -229,39 +265,29 @@ class InputValidator:
             - validation_type: "genuine", "casual", "short", "question", "neutral"
             - metadata: Additional information about the validation
         """
-        if not text or not text.strip():
+        text = normalize(text)
+        if not text.raw or not text.stripped_lower:
             return False, "empty", {"message": "Input is empty"}
 
-        text_lower = text.lower().strip()
-        words = text.split()
-        word_count = len(words)
+        text_lower = text.stripped_lower
+        word_count = text.word_count
 
         # Step 1: Check for casual/conversational input
         # Use word boundaries to avoid false matches (e.g., "hi" in "think")
-        for phrase in self.CASUAL_PHRASES:
-            # For multi-word phrases, use substring match
-            if " " in phrase:
-                if phrase in text_lower:
-                    return False, "casual", {
-                        "message": "Casual conversation detected",
-                        "matched_phrase": phrase,
-                    }
-            else:
-                # For single words, use word boundary matching
-                pattern = r'\b' + re.escape(phrase) + r'\b'
-                if re.search(pattern, text_lower):
-                    return False, "casual", {
-                        "message": "Casual conversation detected",
-                        "matched_phrase": phrase,
-                    }
+        matched_phrase = self._match_casual_phrase(text_lower)
+        if matched_phrase is not None:
+            return False, "casual", {
+                "message": "Casual conversation detected",
+                "matched_phrase": matched_phrase,
+            }
 
         # Step 2: Check for question patterns
-        for pattern in self.QUESTION_PATTERNS:
-            if re.search(pattern, text_lower):
-                return False, "question", {
-                    "message": "Non-descriptive question detected",
-                    "matched_pattern": pattern,
-                }
+        matched_pattern = self._match_question_pattern(text_lower)
+        if matched_pattern is not None:
+            return False, "question", {
+                "message": "Non-descriptive question detected",
+                "matched_pattern": matched_pattern,
+            }
 
         # Step 3: Check word count
         if word_count < 5:
@@ -271,8 +297,7 @@ class InputValidator:
             }
 
         # Step 4: Check for feeling-related keywords
-        words_set = set(text_lower.split())
-        feeling_matches = words_set & self.ALL_FEELING_KEYWORDS
+        feeling_matches = text.token_set & self.ALL_FEELING_KEYWORDS
 
         if feeling_matches:
             return True, "genuine", {
@@ -291,17 +316,59 @@ class InputValidator:
         # Default: allow if not caught by other filters
         return True, "accepted", {"message": "Input accepted"}
 
-    def is_gibberish(self, text: str) -> bool:
+    def _match_casual_phrase(self, text_lower: str) -> Optional[str]:
+        """
+        Find the first CASUAL_PHRASES entry (in list order) present in the text.
+
+        Args:
+            text_lower: Lowercased, stripped input text
+
+        Returns:
+            The matched phrase, or None
+        """
+        best = None
+        word_rules = self._CASUAL_WORD_RULES
+        for token in _WORD_RE.findall(text_lower):
+            index = word_rules.get(token)
+            if index is not None and (best is None or index < best):
+                best = index
+
+        # Ordered rules only matter if they come before the best word match
+        for index, phrase, pattern in self._CASUAL_ORDERED_RULES:
+            if best is not None and index > best:
+                break
+            if pattern.search(text_lower) if pattern else phrase in text_lower:
+                best = index
+                break
+
+        return None if best is None else self.CASUAL_PHRASES[best]
+
+    def _match_question_pattern(self, text_lower: str) -> Optional[str]:
+        """
+        Find the first QUESTION_PATTERNS entry (in list order) matching the text.
+
+        Args:
+            text_lower: Lowercased, stripped input text
+
+        Returns:
+            The matched pattern string, or None
+        """
+        for pattern, compiled in self._QUESTION_RULES:
+            if compiled.search(text_lower):
+                return pattern
+        return None
+
+    def is_gibberish(self, text: Union[str, NormalizedText]) -> bool:
         """
         Check if text is gibberish (random characters).
 
         Args:
-            text: Input text
+            text: Input text (or its shared NormalizedText)
 
         Returns:
             True if gibberish, False otherwise
         """
-        clean_text = text.strip().lower()
+        clean_text = normalize(text).stripped_lower
 
         # Too few unique characters
         if len(set(clean_text.replace(" ", ""))) < 5:
@@ -391,7 +458,7 @@ class InputValidator:
             },
         )
 
-    def extract_feeling_content(self, text: str) -> Tuple[str, int]:
+    def extract_feeling_content(self, text: Union[str, NormalizedText]) -> Tuple[str, int]:
         """
         Extract feeling-related content from mixed input.
 
@@ -401,7 +468,7 @@ class InputValidator:
         Returns:
             Tuple of (extracted_text, match_count)
         """
-        sentences = re.split(r"[.!?]+", text)
+        sentences = normalize(text).sentences
         feeling_sentences = []
 
         for sentence in sentences:
@@ -417,7 +484,7 @@ class InputValidator:
 
         return extracted, match_count
 
-    def get_validation_stats(self, text: str) -> Dict:
+    def get_validation_stats(self, text: Union[str, NormalizedText]) -> Dict:
         """
         Get detailed statistics about the input.
 
@@ -427,13 +494,12 @@ class InputValidator:
         Returns:
             Dict with validation statistics
         """
-        text_lower = text.lower()
-        words = text.split()
-        words_set = set(text_lower.split())
+        text = normalize(text)
+        words_set = text.token_set
 
         return {
-            "word_count": len(words),
-            "char_count": len(text),
+            "word_count": text.word_count,
+            "char_count": len(text.raw),
             "positive_feelings": len(words_set & self.POSITIVE_FEELINGS),
             "negative_feelings": len(words_set & self.NEGATIVE_FEELINGS),
             "physical_symptoms": len(words_set & self.PHYSICAL_SYMPTOMS),
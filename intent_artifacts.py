@@ -0,0 +1,163 @@
+"""
+Flat, pickle-free artifacts for the TF-IDF intent classifier.
+The fitted TfidfVectorizer + LogisticRegression are exported as:
+
+    tfidf_model.npz   idf, coef and intercept arrays
+    vocab.json        analyzer settings and the n-gram -> column vocabulary
+
+NumpyTfidfScorer loads them without scikit-learn or unpickling and
+reproduces predict_proba with NumPy only.
+"""
+
+import json
+import os
+import re
+
+import numpy as np
+
+ARRAYS_FILE = "tfidf_model.npz"
+VOCAB_FILE = "vocab.json"
+FORMAT_VERSION = 1
+
+
+def has_artifacts(model_dir):
+    """Whether model_dir contains an exported NumPy/JSON model."""
+    return all(os.path.exists(os.path.join(model_dir, name)) for name in (ARRAYS_FILE, VOCAB_FILE))
+
+
+def _idf_vector(vectorizer):
+    """IDF weights of a fitted TfidfVectorizer across scikit-learn versions."""
+    try:
+        return vectorizer.idf_
+    except AttributeError:
+        # Pickles from scikit-learn < 1.5 keep the IDF as a sparse diagonal
+        # matrix that newer versions no longer expose through idf_
+        return vectorizer._tfidf._idf_diag.diagonal()
+
+
+def export_artifacts(vectorizer, classifier, model_dir):
+    """
+    Export a fitted TfidfVectorizer and binary LogisticRegression.
+
+    Args:
+        vectorizer: Fitted sklearn TfidfVectorizer (word analyzer).
+        classifier: Fitted sklearn LogisticRegression with classes [0, 1].
+        model_dir (str): Directory to write the artifacts to.
+
+    Raises:
+        ValueError: If the pipeline uses options the NumPy scorer cannot reproduce.
+    """
+    unsupported = {
+        "analyzer": vectorizer.analyzer != "word",
+        "preprocessor": vectorizer.preprocessor is not None,
+        "tokenizer": vectorizer.tokenizer is not None,
+        "strip_accents": vectorizer.strip_accents is not None,
+        "stop_words": vectorizer.stop_words is not None,
+        "binary": vectorizer.binary,
+        "sublinear_tf": vectorizer.sublinear_tf,
+        "norm": vectorizer.norm not in ("l2", None),
+        "classes": list(classifier.classes_) != [0, 1],
+    }
+    problems = [name for name, bad in unsupported.items() if bad]
+    if problems:
+        raise ValueError(f"Cannot export pipeline; unsupported options: {', '.join(problems)}")
+
+    n_features = len(vectorizer.vocabulary_)
+    idf = _idf_vector(vectorizer) if vectorizer.use_idf else np.ones(n_features)
+
+    os.makedirs(model_dir, exist_ok=True)
+    np.savez(
+        os.path.join(model_dir, ARRAYS_FILE),
+        idf=np.asarray(idf, dtype=np.float64),
+        coef=np.asarray(classifier.coef_, dtype=np.float64).ravel(),
+        intercept=np.asarray(classifier.intercept_, dtype=np.float64),
+    )
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "lowercase": bool(vectorizer.lowercase),
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "norm": vectorizer.norm,
+        # Plain ints so the vocabulary serialises regardless of NumPy dtypes
+        "vocabulary": {term: int(index) for term, index in vectorizer.vocabulary_.items()},
+    }
+    with open(os.path.join(model_dir, VOCAB_FILE), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, sort_keys=True)
+
+
+class NumpyTfidfScorer:
+    """
+    Pure-NumPy reimplementation of TfidfVectorizer + LogisticRegression.predict_proba.
+
+    Tokenization and n-gram lookup run per text (as in scikit-learn); the
+    TF-IDF weighting, normalisation and scoring are vectorized over the batch.
+    """
+
+    def __init__(self, model_dir):
+        """
+        Args:
+            model_dir (str): Directory containing the exported artifacts.
+        """
+        with open(os.path.join(model_dir, VOCAB_FILE), encoding="utf-8") as f:
+            metadata = json.load(f)
+        if metadata.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format: {metadata.get('format_version')}")
+
+        with np.load(os.path.join(model_dir, ARRAYS_FILE)) as arrays:
+            self.idf = arrays["idf"]
+            self.coef = arrays["coef"]
+            self.intercept = float(arrays["intercept"][0])
+
+        self.vocabulary = metadata["vocabulary"]
+        self.lowercase = metadata["lowercase"]
+        self.token_re = re.compile(metadata["token_pattern"])
+        self.min_n, self.max_n = metadata["ngram_range"]
+        self.norm = metadata["norm"]
+
+    def _term_indices(self, text):
+        """Vocabulary columns of every n-gram in text (with repeats)."""
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_re.findall(text)
+        vocabulary = self.vocabulary
+        indices = []
+        for n in range(self.min_n, self.max_n + 1):
+            for i in range(len(tokens) - n + 1):
+                index = vocabulary.get(" ".join(tokens[i:i + n]))
+                if index is not None:
+                    indices.append(index)
+        return indices
+
+    def predict_proba(self, texts):
+        """
+        Class probabilities, matching LogisticRegression.predict_proba.
+
+        Args:
+            texts: Iterable of strings.
+
+        Returns:
+            np.ndarray: Shape (n, 2); column 0 is casual, column 1 genuine.
+        """
+        per_text = [self._term_indices(str(text)) for text in texts]
+        n_texts = len(per_text)
+
+        rows = np.repeat(np.arange(n_texts), [len(indices) for indices in per_text])
+        cols = np.fromiter(
+            (i for indices in per_text for i in indices), dtype=np.int64, count=len(rows)
+        )
+
+        # Each (row, col) occurrence contributes idf once, so summing
+        # occurrences gives term count * idf without building a matrix
+        weights = self.idf[cols]
+        dot = np.bincount(rows, weights=weights * self.coef[cols], minlength=n_texts).astype(np.float64)
+
+        if self.norm == "l2":
+            # ||x||^2 needs per-term totals, so aggregate duplicates first
+            keys, counts = np.unique(rows * len(self.idf) + cols, return_counts=True)
+            term_weights = counts * self.idf[keys % len(self.idf)]
+            sq_norm = np.bincount(keys // len(self.idf), weights=term_weights ** 2, minlength=n_texts)
+            norm = np.sqrt(sq_norm.astype(np.float64))
+            dot = np.divide(dot, norm, out=np.zeros_like(dot), where=norm > 0)
+
+        genuine = 1.0 / (1.0 + np.exp(-(dot + self.intercept)))
+        return np.column_stack([1.0 - genuine, genuine])
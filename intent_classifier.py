@@ -0,0 +1,254 @@
+"""
+Serving side of the ensemble intent classifier.
+Loads a trained model and predicts with NumPy (plus scikit-learn's hashing
+vectorizer for the hashing variant, imported on first use). Training lives in
+train_ensemble_classifier.py, so importing this module never pulls in pandas,
+sklearn.model_selection or sklearn.metrics.
+"""
+
+import os
+from itertools import islice
+
+import numpy as np
+
+from config import ENSEMBLE_MODEL_DIR, ENSEMBLE_VECTORIZER
+from intent_artifacts import NumpyTfidfScorer, has_artifacts
+
+# Hash buckets for the hashing vectorizer (2**16 keeps collisions rare for
+# this vocabulary while the stored IDF/weight arrays stay small)
+HASHING_FEATURES = 2 ** 16
+NGRAM_RANGE = (1, 3)
+
+
+class HashedTfidfVectorizer:
+    """
+    Stateless alternative to TfidfVectorizer.
+
+    N-grams are hashed into a fixed number of buckets, so there is no
+    vocabulary to store; the only state is the dense IDF vector.
+    """
+
+    def __init__(self, n_features=HASHING_FEATURES, ngram_range=NGRAM_RANGE, idf=None):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.idf = idf
+        self._hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=self.ngram_range,
+            alternate_sign=False,
+            norm=None,
+        )
+
+    def fit_transform(self, texts):
+        """Learn the IDF vector from texts and return their TF-IDF features."""
+        from sklearn.feature_extraction.text import TfidfTransformer
+
+        counts = self._hasher.transform(texts)
+        transformer = TfidfTransformer(norm=None, use_idf=True, smooth_idf=True)
+        transformer.fit(counts)
+        self.idf = transformer.idf_.astype(np.float32)
+        return self._weight(counts)
+
+    def transform(self, texts):
+        """Hashed, IDF-weighted, L2-normalised features (CSR matrix)."""
+        return self._weight(self._hasher.transform(texts))
+
+    def _weight(self, counts):
+        from sklearn.preprocessing import normalize as l2_normalize
+
+        counts = counts.tocsr()
+        counts.data *= self.idf[counts.indices]
+        return l2_normalize(counts, norm='l2', copy=False)
+
+
+class LinearScorer:
+    """Binary logistic regression scorer built from stored weights."""
+
+    def __init__(self, coef, intercept):
+        self.coef = np.asarray(coef, dtype=np.float32).ravel()
+        self.intercept = float(intercept)
+
+    def predict_proba(self, X):
+        """Same output as LogisticRegression.predict_proba for two classes."""
+        genuine = 1.0 / (1.0 + np.exp(-(X @ self.coef + self.intercept)))
+        return np.column_stack([1.0 - genuine, genuine])
+
+
+class EnsembleIntentClassifier:
+    """
+    Lightweight ensemble classifier combining:
+    1. Rule-based validation (from InputValidator)
+    2. TF-IDF + Logistic Regression
+    3. Confidence-based decision making
+
+    This class only loads and predicts; the training subclass of the same
+    name is in train_ensemble_classifier.py.
+    """
+    
+    def __init__(self, model_dir=ENSEMBLE_MODEL_DIR, vectorizer_type=ENSEMBLE_VECTORIZER):
+        """
+        Args:
+            model_dir: Directory the model is saved to / loaded from
+            vectorizer_type: 'tfidf' (pickled TfidfVectorizer + LogisticRegression)
+                or 'hashing' (stateless HashingVectorizer + stored IDF and weights)
+        """
+        if vectorizer_type not in ('tfidf', 'hashing'):
+            raise ValueError(f"Unknown vectorizer type: {vectorizer_type!r}")
+        self.model_dir = model_dir
+        self.vectorizer_type = vectorizer_type
+        self.vectorizer = None
+        self.classifier = None
+        # Pickle-free NumPy scorer, used instead of vectorizer + classifier when loaded
+        self.scorer = None
+        self.trained = False
+        
+    def predict(self, text):
+        """
+        Predict intent with confidence scores.
+        
+        Args:
+            text: User input (str or the request's shared NormalizedText)
+        
+        Returns:
+            dict: {
+                'intent': 'genuine' or 'casual',
+                'label': 1 or 0,
+                'confidence': float,
+                'genuine_prob': float,
+                'casual_prob': float,
+                'method': 'ml' or 'rule'
+            }
+        """
+        return self.predict_batch([text])[0]
+    
+    def predict_proba_batch(self, texts):
+        """
+        Class probabilities for a batch of texts.
+        
+        The whole batch is vectorized into one CSR matrix and scored with a
+        single predict_proba call.
+        
+        Args:
+            texts: Iterable of user inputs (str or NormalizedText)
+        
+        Returns:
+            np.ndarray: Shape (n, 2); column 0 is casual, column 1 genuine.
+        """
+        if not self.trained and not self.load_model():
+            raise ValueError("Model not trained. Please train first or load a trained model.")
+        
+        if self.scorer is not None:
+            return self.scorer.predict_proba(texts)
+        
+        X_vec = self.vectorizer.transform([str(text) for text in texts])
+        return self.classifier.predict_proba(X_vec)
+    
+    def predict_batch(self, texts, columnar=False):
+        """
+        Predict intent for many texts at once.
+        
+        Args:
+            texts: Iterable of user inputs (str or NormalizedText)
+            columnar (bool): Return NumPy columns instead of one dict per text.
+        
+        Returns:
+            list or dict: predict() dicts in input order, or with columnar=True
+            a dict of arrays: 'label', 'confidence', 'genuine_prob', 'casual_prob'.
+        """
+        probs = self.predict_proba_batch(texts)
+        labels = probs.argmax(axis=1)
+        confidence = probs.max(axis=1)
+        
+        if columnar:
+            return {
+                'label': labels,
+                'confidence': confidence,
+                'genuine_prob': probs[:, 1],
+                'casual_prob': probs[:, 0],
+            }
+        
+        # Convert whole columns to Python scalars at once
+        return [
+            {
+                'intent': 'genuine' if label == 1 else 'casual',
+                'label': label,
+                'confidence': conf,
+                'genuine_prob': genuine,
+                'casual_prob': casual,
+                'method': 'ml'
+            }
+            for label, conf, genuine, casual in zip(
+                labels.tolist(), confidence.tolist(), probs[:, 1].tolist(), probs[:, 0].tolist()
+            )
+        ]
+    
+    def predict_stream(self, texts, chunk_size=4096, columnar=False):
+        """
+        Predict intent for an arbitrarily long iterable in fixed-size chunks.
+        
+        Only one chunk of texts and features is held in memory at a time.
+        
+        Args:
+            texts: Iterable of user inputs (e.g. a file or database cursor)
+            chunk_size (int): Texts vectorized per batch.
+            columnar (bool): Yield one columnar dict per chunk instead of one
+                dict per text.
+        
+        Yields:
+            dict: Per-text result dicts in input order, or per-chunk columns.
+        """
+        iterator = iter(texts)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            if columnar:
+                yield self.predict_batch(chunk, columnar=True)
+            else:
+                yield from self.predict_batch(chunk)
+    
+    def load_model(self):
+        """Load a trained model (preferring the pickle-free NumPy/JSON export)."""
+        if self.vectorizer_type == 'hashing':
+            return self._load_hashing_model()
+        
+        if has_artifacts(self.model_dir):
+            self.scorer = NumpyTfidfScorer(self.model_dir)
+            self.trained = True
+            print(f"✅ Model loaded from {self.model_dir}/ (NumPy artifacts)")
+            return True
+        
+        vec_path = os.path.join(self.model_dir, 'vectorizer.pkl')
+        clf_path = os.path.join(self.model_dir, 'classifier.pkl')
+        
+        if os.path.exists(vec_path) and os.path.exists(clf_path):
+            import joblib
+            
+            self.vectorizer = joblib.load(vec_path)
+            self.classifier = joblib.load(clf_path)
+            # predict_proba_batch prefers the scorer; drop one loaded earlier
+            self.scorer = None
+            self.trained = True
+            print(f"✅ Model loaded from {self.model_dir}/")
+            return True
+        return False
+    
+    def _load_hashing_model(self):
+        """Load the hashing variant: dense arrays only, no pickles."""
+        path = os.path.join(self.model_dir, 'hashing_model.npz')
+        if not os.path.exists(path):
+            return False
+        
+        with np.load(path) as arrays:
+            self.vectorizer = HashedTfidfVectorizer(
+                n_features=int(arrays['n_features']),
+                ngram_range=arrays['ngram_range'].tolist(),
+                idf=arrays['idf'],
+            )
+            self.classifier = LinearScorer(arrays['coef'], arrays['intercept'][0])
+        self.scorer = None
+        self.trained = True
+        print(f"✅ Model loaded from {path}")
+        return True
@@ -0,0 +1,101 @@
+"""
+Multi-pattern keyword matching using an Aho-Corasick automaton.
+Finds every occurrence of every keyword (including overlapping ones) in a
+single left-to-right pass over the text.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Set
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over labelled keyword groups.
+
+    Each group name is assigned one bit. scan() returns the OR of the bits of
+    every group with at least one keyword occurring as a substring of the
+    text, which is exactly `any(keyword in text for keyword in group)` for
+    all groups at once.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        """
+        Compile keyword groups into the automaton.
+
+        Args:
+            groups: Mapping of group name to the keywords in that group.
+        """
+        self.labels = list(groups)
+        self.bits = {label: 1 << i for i, label in enumerate(self.labels)}
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [0]
+
+        for label, keywords in groups.items():
+            bit = self.bits[label]
+            for keyword in keywords:
+                self._add(keyword, bit)
+
+        self._build_failure_links()
+
+    def _add(self, keyword: str, bit: int):
+        if not keyword:
+            return
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(0)
+            state = next_state
+        self._out[state] |= bit
+
+    def _build_failure_links(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        # Depth-1 states fail back to the root
+        pending = deque(goto[0].values())
+
+        while pending:
+            state = pending.popleft()
+            for ch, child in goto[state].items():
+                pending.append(child)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(ch, 0)
+                # Inherit matches that end at the same position (suffix keywords)
+                out[child] |= out[fail[child]]
+
+    def scan(self, text: str) -> int:
+        """
+        Scan text once and return the bitmask of matched groups.
+
+        Args:
+            text: Text to search (matched case-sensitively).
+
+        Returns:
+            Bitmask with the bit of each group that has a keyword in the text.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        mask = 0
+        for ch in text:
+            while True:
+                next_state = goto[state].get(ch)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+            mask |= out[state]
+        return mask
+
+    def matched_labels(self, text: str) -> Set[str]:
+        """Return the names of all groups with a keyword in the text."""
+        mask = self.scan(text)
+        return {label for label, bit in self.bits.items() if mask & bit}
@@ -0,0 +1,390 @@
+"""
+In-process metrics with a Prometheus text-format exporter.
+
+Counters and histograms are kept in per-thread cells. Each thread increments
+its own list without taking a lock, and a scrape sums the cells, so hot-path
+updates stay cheap however many sessions run concurrently. A thread's cell is
+folded into a retired total when the thread exits. The exporter is a
+plain http.server on a local port; no Prometheus client library is needed.
+
+Usage:
+    REQUESTS = counter("mannkibaat_requests_total", "Requests handled.", ["endpoint"])
+    REQUESTS.labels(endpoint="/analyze").inc()
+
+    start_exporter()  # serves GET /metrics on METRICS_HOST:METRICS_PORT
+"""
+
+import logging
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import METRICS_HOST, METRICS_PORT
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _CellOwner:
+    """Held only by a thread's local storage; collected when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _ThreadCells:
+    """
+    Fixed-size float vectors, one per live thread, summed on read.
+
+    When a thread exits, its vector is folded into a retired total, so
+    short-lived threads (Streamlit runs every rerun on a new one) do not
+    leave their vectors behind. The last `maxes` columns are combined with
+    max() instead of a sum.
+    """
+
+    __slots__ = ("size", "maxes", "_local", "_cells", "_retired", "_lock")
+
+    def __init__(self, size, maxes=0):
+        self.size = size
+        self.maxes = maxes
+        self._local = threading.local()
+        self._cells = {}  # id(cell) -> cell, for live threads
+        self._retired = [0.0] * size
+        # Reentrant: a finalizer may run while this thread holds the lock
+        self._lock = threading.RLock()
+
+    def cell(self):
+        """This thread's vector; only the owning thread writes to it."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self.size
+            owner = _CellOwner()
+            with self._lock:
+                self._cells[id(cell)] = cell
+            weakref.finalize(owner, self._retire, cell)
+            self._local.cell = cell
+            self._local.owner = owner
+            return cell
+
+    def _retire(self, cell):
+        with self._lock:
+            self._cells.pop(id(cell), None)
+            self._retired = self._combine([self._retired, cell])
+
+    def _combine(self, cells):
+        split = self.size - self.maxes
+        columns = list(zip(*cells))
+        return [math.fsum(c) for c in columns[:split]] + [max(c) for c in columns[split:]]
+
+    def live_cells(self):
+        """Number of vectors held for live threads."""
+        with self._lock:
+            return len(self._cells)
+
+    def totals(self):
+        """Element-wise combination of every thread's vector, retired ones included."""
+        with self._lock:
+            cells = list(self._cells.values())
+            cells.append(self._retired)
+        return self._combine(cells)
+
+
+class CounterChild:
+    """One labelled time series of a counter."""
+
+    __slots__ = ("_cells",)
+
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount=1):
+        """Increase the counter (amount must not be negative)."""
+        self._cells.cell()[0] += amount
+
+    def value(self):
+        return self._cells.totals()[0]
+
+
+class HistogramChild:
+    """One labelled time series of a histogram."""
+
+    __slots__ = ("bounds", "_cells")
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        # Bucket counts (the last one above every bound), then sum, count and max
+        self._cells = _ThreadCells(len(self.bounds) + 4, maxes=1)
+
+    def observe(self, value):
+        """Record one observation."""
+        cell = self._cells.cell()
+        cell[bisect_left(self.bounds, value)] += 1
+        cell[-3] += value
+        cell[-2] += 1
+        if value > cell[-1]:
+            cell[-1] = value
+
+    def snapshot(self):
+        """
+        Returns:
+            tuple: (per-bucket counts, sum, count, max).
+        """
+        totals = self._cells.totals()
+        return totals[:-3], totals[-3], int(totals[-2]), totals[-1]
+
+    def percentile(self, q):
+        """
+        Approximate a percentile from the buckets.
+
+        Args:
+            q (float): Percentile in [0, 100].
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile (capped at
+                the largest observation), or 0.0 when empty.
+        """
+        counts, _, count, largest = self.snapshot()
+        if count == 0:
+            return 0.0
+        rank = max(1, q / 100 * count)
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank:
+                break
+        if index >= len(self.bounds):
+            return largest
+        return min(self.bounds[index], largest)
+
+
+class _Family:
+    """A metric name with its labelled children."""
+
+    child_type = None
+    metric_type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **labelvalues):
+        """Return the child for the given label values, creating it on first use."""
+        if labelvalues:
+            values = tuple(labelvalues[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        return self.child_type()
+
+    def children(self):
+        with self._lock:
+            return sorted(self._children.items())
+
+    def clear(self):
+        """Drop every labelled series."""
+        with self._lock:
+            self._children.clear()
+
+    def _label_text(self, values, extra=()):
+        pairs = list(zip(self.labelnames, values)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self._samples())
+        return lines
+
+
+class Counter(_Family):
+    child_type = CounterChild
+    metric_type = "counter"
+
+    def inc(self, amount=1):
+        """Increase an unlabelled counter."""
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for values, child in self.children():
+            yield f"{self.name}{self._label_text(values)} {_format(child.value())}"
+
+
+class Histogram(_Family):
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=None, child_type=HistogramChild):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets))
+        self.child_type = child_type
+
+    def _new_child(self):
+        return self.child_type(self.bounds)
+
+    def observe(self, value):
+        """Record an observation on an unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _samples(self):
+        for values, child in self.children():
+            counts, total, count, _ = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(self.bounds + (math.inf,), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else _format(bound)
+                yield f"{self.name}_bucket{self._label_text(values, [('le', le)])} {_format(cumulative)}"
+            yield f"{self.name}_sum{self._label_text(values)} {_format(total)}"
+            yield f"{self.name}_count{self._label_text(values)} {count}"
+
+
+class Gauge:
+    """A value computed at scrape time (queue depth, cache size, ...)."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name, documentation, function):
+        self.name = name
+        self.documentation = documentation
+        self.function = function
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format(self.function())}",
+        ]
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Registry:
+    """The set of metrics rendered by the exporter."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """Add a metric; registering the same name again returns the existing one."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self):
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text.
+        """
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                logger.warning(f"Failed to collect metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name, documentation, labelnames=(), registry=REGISTRY):
+    """Create (or fetch) a counter in the registry."""
+    return registry.register(Counter(name, documentation, labelnames))
+
+
+def histogram(name, documentation, labelnames=(), buckets=None, child_type=HistogramChild, registry=REGISTRY):
+    """Create (or fetch) a histogram in the registry."""
+    return registry.register(Histogram(name, documentation, labelnames, buckets, child_type))
+
+
+def gauge(name, documentation, function, registry=REGISTRY):
+    """Create (or fetch) a scrape-time gauge in the registry."""
+    return registry.register(Gauge(name, documentation, function))
+
+
+def _handler(registry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes are frequent; keep them out of the application log
+            pass
+
+    return MetricsHandler
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_exporter(port=METRICS_PORT, host=METRICS_HOST, registry=REGISTRY):
+    """
+    Serve GET /metrics from a daemon thread (idempotent per process).
+
+    Args:
+        port (int): Port to listen on; None disables the exporter, 0 picks a free port.
+        host (str): Interface to bind (local-only by default).
+        registry (Registry): Metrics to expose.
+
+    Returns:
+        ThreadingHTTPServer or None: The running server, or None if disabled
+            or the port is already taken (e.g. by another worker process).
+    """
+    global _server
+
+    if port is None:
+        return None
+    with _server_lock:
+        if _server is not None:
+            return _server
+        try:
+            server = ThreadingHTTPServer((host, port), _handler(registry))
+        except OSError as e:
+            logger.warning(f"Metrics exporter not started on {host}:{port}: {e}")
+            return None
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+        logger.info(f"Metrics exporter listening on http://{host}:{server.server_address[1]}/metrics")
+        _server = server
+        return server
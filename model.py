@@ -5,8 +5,9 @@ Model loading, preprocessing, and prediction logic for MannKiBaat.
 import re
 import os
 import torch
-from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
-from config import MODEL_DIR, TOKENIZER_NAME, FALLBACK_KEYWORDS
+from transformers import DistilBertForSequenceClassification
+from config import MODEL_DIR, QUANTIZE_MODEL, FALLBACK_KEYWORDS
+from model_files import load_tokenizer
 
 
 # Global cache for model and tokenizer
@@ -36,6 +37,7 @@ def preprocess_text(text):
 def load_model():
     """
     Load the fine-tuned DistilBERT model from MODEL_DIR.
+    Uses the dynamic INT8 model when QUANTIZE_MODEL is enabled.
     Caches the model in memory after first load.
 
     Returns:
@@ -57,7 +59,12 @@ def load_model():
         )
 
     try:
-        model = DistilBertForSequenceClassification.from_pretrained(MODEL_DIR)
+        if QUANTIZE_MODEL:
+            from quantization import load_quantized_model
+
+            model = load_quantized_model(MODEL_DIR)
+        else:
+            model = DistilBertForSequenceClassification.from_pretrained(MODEL_DIR)
         model.eval()
         _model_cache = model
         return model
@@ -70,12 +77,12 @@ def get_tokenizer():
     Load and cache the tokenizer.
 
     Returns:
-        tokenizer: DistilBERT tokenizer.
+        tokenizer: Fast DistilBERT tokenizer, loaded from local files.
     """
     global _tokenizer_cache
 
     if _tokenizer_cache is None:
-        _tokenizer_cache = DistilBertTokenizer.from_pretrained(TOKENIZER_NAME)
+        _tokenizer_cache = load_tokenizer()
 
     return _tokenizer_cache
 
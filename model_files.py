@@ -0,0 +1,99 @@
+"""
+Helpers for the model files on disk.
+Cheap fingerprints detect changed models (reloading in model_resources) and
+version cached results (result_cache); load_tokenizer loads the local
+tokenizer files, and onnx_model_path/quantized_model_path locate a model's
+ONNX export and INT8 artifact.
+"""
+
+import hashlib
+import os
+
+from config import MODEL_DIR, ONNX_MODEL_PATH, QUANTIZED_MODEL_PATH, TOKENIZER_PATH
+
+
+def load_tokenizer(path=TOKENIZER_PATH):
+    """
+    Load the fast (Rust-backed) DistilBERT tokenizer from local files.
+
+    The fast tokenizer produces the same ids as the pure-Python
+    DistilBertTokenizer and encodes whole lists in a single call.
+    local_files_only avoids any network request to the Hugging Face hub.
+
+    Args:
+        path (str): Directory containing vocab.txt (or tokenizer.json), or a
+            hub name that is already in the local cache.
+
+    Returns:
+        DistilBertTokenizerFast: Loaded tokenizer.
+    """
+    from transformers import DistilBertTokenizerFast
+
+    return DistilBertTokenizerFast.from_pretrained(path, local_files_only=True)
+
+
+def onnx_model_path(model_dir=MODEL_DIR):
+    """
+    Path of the ONNX export of the model in model_dir.
+
+    The default model uses ONNX_MODEL_PATH; any other directory is expected
+    to be exported next to itself, to "<model_dir>_onnx/model.onnx" (the same
+    layout as the default).
+
+    Args:
+        model_dir (str): Directory with the fine-tuned model.
+
+    Returns:
+        str: Path of the .onnx file.
+    """
+    if os.path.normpath(model_dir) == os.path.normpath(MODEL_DIR):
+        return ONNX_MODEL_PATH
+    return os.path.join(os.path.normpath(model_dir) + "_onnx", "model.onnx")
+
+
+def quantized_model_path(model_dir=MODEL_DIR):
+    """
+    Path of the quantized INT8 state dict of the model in model_dir.
+
+    The default model uses QUANTIZED_MODEL_PATH; any other directory is
+    expected to be exported to "<model_dir>_int8/model_int8.pt".
+
+    Args:
+        model_dir (str): Directory with the fine-tuned model.
+
+    Returns:
+        str: Path of the .pt artifact.
+    """
+    if os.path.normpath(model_dir) == os.path.normpath(MODEL_DIR):
+        return QUANTIZED_MODEL_PATH
+    return os.path.join(os.path.normpath(model_dir) + "_int8", "model_int8.pt")
+
+
+def model_fingerprint(paths):
+    """
+    Fingerprint the model files on disk.
+
+    Only file names, sizes and modification times are read, so this is cheap
+    enough to call on every Streamlit rerun.
+
+    Args:
+        paths (tuple): Model directories to include.
+
+    Returns:
+        str: Short hex digest that changes whenever a model file changes.
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        if not os.path.isdir(path):
+            digest.update(f"{path}:missing;".encode())
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                digest.update(f"{file_path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
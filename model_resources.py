@@ -0,0 +1,225 @@
+"""
+Shared model resources for serving processes.
+Loads the input validator, hybrid intent classifier and PHQ-8 detector once
+per process and rebuilds them when the model files change on disk.
+warm_up() also runs synthetic inputs through every model and then marks the
+process ready (see is_ready()); a reload clears readiness until the new models
+have been warmed up.
+
+Usage (preload, warm up and verify every model before serving; exits 1 if
+the fine-tuned PHQ-8 model cannot be loaded):
+    python model_resources.py [--allow-mock]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+from config import (
+    MODEL_DIR,
+    ENSEMBLE_MODEL_DIR,
+    ML_INTENT_THRESHOLD,
+    QUANTIZED_MODEL_PATH,
+    ONNX_MODEL_PATH,
+    WARMUP_TEXTS,
+)
+from input_validator import InputValidator
+from hybrid_intent_classifier import HybridIntentClassifier
+from phq8_model import get_detector_registry
+from model_files import model_fingerprint as files_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Directories whose contents determine the loaded models
+MODEL_PATHS = (
+    MODEL_DIR,
+    ENSEMBLE_MODEL_DIR,
+    os.path.dirname(QUANTIZED_MODEL_PATH),
+    os.path.dirname(ONNX_MODEL_PATH),
+)
+
+
+def model_fingerprint(paths=MODEL_PATHS):
+    """
+    Fingerprint the served model files; cheap enough for every Streamlit rerun.
+
+    Returns:
+        str: Short hex digest that changes whenever a model file changes.
+    """
+    return files_fingerprint(paths)
+
+
+class ModelResources:
+    """The heavy objects shared by every session/request in a process."""
+
+    def __init__(self, validator, hybrid_classifier, detector, fingerprint, load_seconds):
+        self.validator = validator
+        self.hybrid_classifier = hybrid_classifier
+        self.detector = detector
+        self.fingerprint = fingerprint
+        self.load_seconds = load_seconds
+
+
+# Reentrant: get_resources holds it while calling load_resources
+_lock = threading.RLock()
+_resources = None
+_loaded_fingerprint = None
+_ready = threading.Event()
+_warmup_timings = {}
+
+
+def load_resources(fingerprint=None, use_mock=False):
+    """
+    Build every model-backed object.
+
+    The PHQ-8 detector comes from the process-wide registry: it is reused on
+    first load and explicitly reloaded when the fingerprint has changed.
+
+    Args:
+        fingerprint (str, optional): Fingerprint of the files being loaded.
+        use_mock (bool): Whether to load the mock PHQ-8 detector.
+
+    Returns:
+        ModelResources: Freshly loaded resources.
+    """
+    global _loaded_fingerprint
+
+    fingerprint = fingerprint or model_fingerprint()
+    start = time.perf_counter()
+
+    validator = InputValidator()
+    hybrid_classifier = HybridIntentClassifier(
+        use_ml=True, ml_threshold=ML_INTENT_THRESHOLD, validator=validator
+    )
+
+    registry = get_detector_registry()
+    # app.py calls this directly while API workers come through get_resources;
+    # the fingerprint check and update must not interleave between them
+    with _lock:
+        if _loaded_fingerprint is not None and _loaded_fingerprint != fingerprint:
+            logger.info("Model files changed on disk; reloading PHQ-8 detector")
+            # Not ready again until the reloaded models have been warmed up
+            reset_readiness()
+            detector = registry.reload(use_mock=use_mock)
+        else:
+            detector = registry.get(use_mock=use_mock)
+        _loaded_fingerprint = fingerprint
+
+    load_seconds = time.perf_counter() - start
+    logger.info(f"Model resources loaded in {load_seconds:.2f}s (fingerprint {fingerprint})")
+
+    return ModelResources(validator, hybrid_classifier, detector, fingerprint, load_seconds)
+
+
+def get_resources(use_mock=False):
+    """
+    Return the process-wide resources, reloading them if model files changed.
+
+    Args:
+        use_mock (bool): Whether to load the mock PHQ-8 detector.
+
+    Returns:
+        ModelResources: Warm, shared resources.
+    """
+    global _resources
+
+    fingerprint = model_fingerprint()
+    with _lock:
+        reloaded = _resources is not None and _resources.fingerprint != fingerprint
+        if _resources is None or reloaded:
+            _resources = load_resources(fingerprint, use_mock=use_mock)
+        resources = _resources
+    if reloaded:
+        # The first load is warmed up by the startup hook; reloads warm up here
+        warm_up(lambda: resources)
+    return resources
+
+
+def preload(use_mock=False):
+    """Startup hook: load every model before the first request arrives."""
+    return get_resources(use_mock=use_mock)
+
+
+def warm_up(loader=None, texts=WARMUP_TEXTS):
+    """
+    Load every model, run synthetic inputs through it and mark the process ready.
+
+    Single inputs go through classify_intent and analyze (the per-request
+    paths) and then all of them through analyze_many (the batched path), so
+    lazy allocations and the first slow forward pass happen before traffic.
+
+    Args:
+        loader (callable, optional): Returns the model resources
+            (defaults to get_resources).
+        texts (list): Synthetic inputs.
+
+    Returns:
+        dict: Seconds spent per phase: load, classify_intent, analyze, analyze_batch.
+    """
+    loader = loader or get_resources
+    timings = {}
+
+    def timed(phase, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[phase] = time.perf_counter() - start
+        return result
+
+    resources = timed("load", loader)
+    timed("classify_intent", lambda: [resources.hybrid_classifier.classify_intent(t) for t in texts])
+    timed("analyze", lambda: [resources.detector.analyze(t) for t in texts])
+    timed("analyze_batch", lambda: list(resources.detector.analyze_many(texts)))
+
+    _warmup_timings.update(timings)
+    _ready.set()
+    logger.info(
+        "Warm-up complete: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+    )
+    return timings
+
+
+def reset_readiness():
+    """Mark the process as not ready (e.g. while models are reloaded)."""
+    _ready.clear()
+    _warmup_timings.clear()
+
+
+def is_ready():
+    """Whether warm_up() has completed in this process."""
+    return _ready.is_set()
+
+
+def warmup_timings():
+    """Seconds per phase of the last completed warm-up (empty before one)."""
+    return dict(_warmup_timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preload, warm up and verify every model.")
+    parser.add_argument(
+        "--allow-mock",
+        action="store_true",
+        help="Succeed even if the fine-tuned PHQ-8 model is missing and the mock is used",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    timings = warm_up()
+    resources = get_resources()
+    print(f"✅ Models loaded in {resources.load_seconds:.2f}s")
+    print("   Warm-up: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items()))
+    print(f"   Fingerprint: {resources.fingerprint}")
+    print(f"   Intent classifier: {'ml' if resources.hybrid_classifier.use_ml else 'rules only'}")
+    print(f"   PHQ-8 detector: {'mock' if resources.detector.use_mock else 'fine-tuned model'}")
+
+    # A build step running this must not silently ship the mock model
+    if resources.detector.use_mock and not args.allow_mock:
+        print("❌ Fine-tuned PHQ-8 model failed to load (pass --allow-mock to accept the mock)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
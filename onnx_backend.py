@@ -0,0 +1,188 @@
+"""
+ONNX Runtime inference backend for the DistilBERT classifiers.
+Exports the fine-tuned PHQ-8 model (and the optional intent model) to ONNX
+with dynamic batch/sequence axes and serves them without eager PyTorch.
+
+Usage:
+    python onnx_backend.py export            # PHQ-8 model -> ONNX_MODEL_PATH
+    python onnx_backend.py export --intent   # intent model -> ONNX_INTENT_MODEL_PATH
+    python onnx_backend.py parity            # torch vs ONNX Runtime on training data
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from config import MODEL_DIR, ONNX_MODEL_PATH, ONNX_INTENT_MODEL_PATH
+
+INTENT_MODEL_DIR = "model/intent_classifier"
+
+# Graph inputs/outputs; batch and sequence length are dynamic
+INPUT_NAMES = ["input_ids", "attention_mask"]
+OUTPUT_NAMES = ["logits"]
+DYNAMIC_AXES = {
+    "input_ids": {0: "batch", 1: "sequence"},
+    "attention_mask": {0: "batch", 1: "sequence"},
+    "logits": {0: "batch"},
+}
+
+
+def export_onnx(model_dir=MODEL_DIR, output_path=ONNX_MODEL_PATH, opset=17):
+    """
+    Export a DistilBertForSequenceClassification checkpoint to ONNX.
+
+    Args:
+        model_dir (str): Directory with the fine-tuned model.
+        output_path (str): Where to write the .onnx file.
+        opset (int): ONNX opset version.
+
+    Returns:
+        str: Path of the exported model.
+    """
+    import torch
+    from transformers import DistilBertForSequenceClassification
+
+    model = DistilBertForSequenceClassification.from_pretrained(model_dir)
+    model.eval()
+    # Return a plain logits tensor instead of a ModelOutput
+    model.config.return_dict = False
+
+    dummy = (
+        torch.ones(2, 16, dtype=torch.long),
+        torch.ones(2, 16, dtype=torch.long),
+    )
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            dummy,
+            output_path,
+            input_names=INPUT_NAMES,
+            output_names=OUTPUT_NAMES,
+            dynamic_axes=DYNAMIC_AXES,
+            opset_version=opset,
+            dynamo=False,
+        )
+
+    print(f"✅ ONNX model exported to {output_path}")
+    return output_path
+
+
+class OnnxSequenceClassifier:
+    """
+    ONNX Runtime session with the same inputs as the torch classifier.
+
+    Takes the tokenizer's NumPy output (return_tensors="np") and returns logits.
+    """
+
+    def __init__(self, model_path=ONNX_MODEL_PATH, num_threads=None):
+        """
+        Args:
+            model_path (str): Exported .onnx file.
+            num_threads (int, optional): Intra-op threads (ONNX Runtime default if None).
+
+        Raises:
+            FileNotFoundError: If the ONNX model has not been exported.
+        """
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX model not found: {model_path}. Run 'python onnx_backend.py export' first."
+            )
+
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.model_path = model_path
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+    def logits(self, inputs):
+        """
+        Run the classifier.
+
+        Args:
+            inputs (Mapping): input_ids and attention_mask arrays of shape (batch, sequence).
+
+        Returns:
+            np.ndarray: Logits of shape (batch, num_labels).
+        """
+        feed = {name: np.asarray(inputs[name], dtype=np.int64) for name in INPUT_NAMES}
+        return self.session.run(OUTPUT_NAMES, feed)[0]
+
+
+def softmax(logits):
+    """Numerically stable softmax over the last axis."""
+    shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return shifted / shifted.sum(axis=-1, keepdims=True)
+
+
+def parity_check(data_path="data/training_data.csv", limit=512, batch_size=32, atol=1e-4):
+    """
+    Compare the torch and ONNX Runtime backends of PHQ8DepressionDetector.
+
+    Args:
+        data_path (str): CSV with a 'text' column.
+        limit (int): Number of texts to compare.
+        batch_size (int): Texts per forward pass.
+        atol (float): Maximum allowed absolute risk probability difference.
+
+    Returns:
+        dict: Max/mean absolute difference, PHQ-8 score agreement and pass flag.
+    """
+    import pandas as pd
+    from phq8_model import PHQ8DepressionDetector
+
+    texts = pd.read_csv(data_path)["text"].astype(str).tolist()[:limit]
+
+    torch_detector = PHQ8DepressionDetector(backend="torch")
+    onnx_detector = PHQ8DepressionDetector(backend="onnx")
+    if torch_detector.use_mock or onnx_detector.use_mock:
+        raise RuntimeError("Both backends must load the real model for a parity check")
+
+    cleaned = [torch_detector.preprocess_text(text) for text in texts]
+    probs = {}
+    for name, detector in (("torch", torch_detector), ("onnx", onnx_detector)):
+        probs[name] = np.concatenate([
+            detector._risk_probabilities(cleaned[i:i + batch_size])
+            for i in range(0, len(cleaned), batch_size)
+        ])
+
+    diff = np.abs(probs["torch"] - probs["onnx"])
+    scores_match = (probs["torch"] * 27).astype(int) == (probs["onnx"] * 27).astype(int)
+    result = {
+        "samples": len(texts),
+        "max_abs_diff": float(diff.max()),
+        "mean_abs_diff": float(diff.mean()),
+        "phq8_score_agreement": float(scores_match.mean()),
+        "passed": bool(diff.max() <= atol),
+    }
+
+    status = "✅" if result["passed"] else "❌"
+    print(f"{status} torch vs ONNX Runtime on {result['samples']} texts")
+    print(f"   max |Δp|:  {result['max_abs_diff']:.2e} (tolerance {atol:.0e})")
+    print(f"   mean |Δp|: {result['mean_abs_diff']:.2e}")
+    print(f"   PHQ-8 score agreement: {result['phq8_score_agreement']:.2%}")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ONNX export and parity check")
+    parser.add_argument("command", choices=["export", "parity"])
+    parser.add_argument("--intent", action="store_true", help="Export the DistilBERT intent model instead")
+    parser.add_argument("--data", default="data/training_data.csv", help="CSV used by the parity check")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        if args.intent:
+            export_onnx(INTENT_MODEL_DIR, ONNX_INTENT_MODEL_PATH)
+        else:
+            export_onnx()
+    else:
+        raise SystemExit(0 if parity_check(args.data)["passed"] else 1)
@@ -4,18 +4,49 @@ Implements the Patient Health Questionnaire-8 scoring system for depression seve
 Enhanced with 300+ clinical symptom keywords and frequency detection.
 """
 
-import re
+import hashlib
+import os
 import random
-import torch
-from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
+import threading
+import time
+from itertools import islice
+import numpy as np
 from config import (
     MODEL_DIR,
-    TOKENIZER_NAME,
+    TOKENIZER_PATH,
+    QUANTIZE_MODEL,
+    INFERENCE_BACKEND,
+    DETERMINISTIC_SCORING,
     PHQ8_THRESHOLDS,
     TARGET_CONFIDENCE_RANGE,
     FALLBACK_KEYWORDS,
 )
 from phq8_symptom_detector import PHQ8SymptomDetector
+from text_normalization import normalize
+from model_files import load_tokenizer, model_fingerprint, onnx_model_path, quantized_model_path
+from result_cache import get_result_cache
+from inference_batcher import get_micro_batcher
+from metrics import counter, histogram
+from stage_timing import attach, collect, stage
+
+# Severity levels in ascending order, with the upper PHQ-8 bound of each
+# level except the last (used for vectorized severity mapping).
+SEVERITY_LEVELS = ["Minimal", "Mild", "Moderate", "Moderately Severe", "Severe"]
+_SEVERITY_BOUNDS = np.array([PHQ8_THRESHOLDS[level] for level in SEVERITY_LEVELS[:-1]])
+
+# Cache hits are not counted here; see mannkibaat_result_cache_lookups_total
+ANALYSES = counter(
+    "mannkibaat_phq8_analyses_total",
+    "PHQ-8 predictions by whether the fine-tuned model or the mock produced them.",
+    ["model"],
+)
+_MODEL_ANALYSES = ANALYSES.labels("distilbert")
+_MOCK_ANALYSES = ANALYSES.labels("mock")
+BATCH_SIZE = histogram(
+    "mannkibaat_phq8_batch_size",
+    "Inputs per PHQ-8 prediction call (after cache hits are removed).",
+    buckets=[2 ** i for i in range(11)],
+)
 
 
 class PHQ8DepressionDetector:
@@ -30,14 +61,44 @@ class PHQ8DepressionDetector:
     - 20-27: Severe depression
     """
 
-    def __init__(self, use_mock=False):
+    def __init__(
+        self,
+        use_mock=False,
+        model_dir=MODEL_DIR,
+        tokenizer_name=TOKENIZER_PATH,
+        quantized=QUANTIZE_MODEL,
+        backend=INFERENCE_BACKEND,
+        deterministic=DETERMINISTIC_SCORING,
+    ):
         """
         Initialize the PHQ-8 depression detector.
 
         Args:
             use_mock (bool): If True, use mock model. If False, try to load real model.
+            model_dir (str): Directory containing the fine-tuned model weights.
+            tokenizer_name (str): Hugging Face tokenizer name or path.
+            quantized (bool): Load the dynamic INT8 model instead of float32
+                (torch backend only; see model_files.quantized_model_path).
+            backend (str): "torch" for eager PyTorch or "onnx" for ONNX Runtime
+                (which loads model_dir's export, see model_files.onnx_model_path).
+            deterministic (bool): Derive the score/confidence jitter from a hash
+                of the input, so the same text always gets the same result.
         """
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Unknown inference backend: {backend!r}")
+
         self.use_mock = use_mock
+        self.model_dir = model_dir
+        self.tokenizer_name = tokenizer_name
+        self.quantized = quantized
+        self.backend = backend
+        # The ONNX export and INT8 artifact belonging to model_dir, not always
+        # the default model's
+        self.onnx_path = onnx_model_path(model_dir)
+        self.quantized_path = quantized_model_path(model_dir)
+        self.deterministic = deterministic
+        # Tensor type the tokenizer returns for the selected backend
+        self.return_tensors = "np" if backend == "onnx" else "pt"
         self.model = None
         self.tokenizer = None
         self.symptom_detector = PHQ8SymptomDetector()  # Enhanced symptom detection
@@ -49,10 +110,57 @@ class PHQ8DepressionDetector:
                 print(f"Real model unavailable ({str(e)}), falling back to mock model")
                 self.use_mock = True
 
+        # Results are cached per model version (see result_cache.py)
+        self.result_cache = get_result_cache()
+        self.model_version = self._model_version()
+
+    def _model_version(self):
+        """Identify the loaded model and settings for result caching."""
+        if self.use_mock:
+            return f"phq8:mock:{int(self.deterministic)}"
+        paths = [self.model_dir]
+        if self.backend == "onnx":
+            paths.append(os.path.dirname(self.onnx_path))
+        elif self.quantized:
+            paths.append(os.path.dirname(self.quantized_path))
+        return (
+            f"phq8:{self.backend}:{int(self.quantized)}:{int(self.deterministic)}:"
+            f"{self.tokenizer_name}:{model_fingerprint(paths)}"
+        )
+
+    def _jitter(self, text):
+        """
+        Random source for the cosmetic score/confidence variance of one text.
+
+        In deterministic mode this is seeded from a hash of the text (None,
+        i.e. no variance, when the text is unknown); otherwise it is the
+        shared random module.
+        """
+        if not self.deterministic:
+            return random
+        if text is None:
+            return None
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
     def _load_real_model(self):
         """Load the fine-tuned DistilBERT model."""
-        self.tokenizer = DistilBertTokenizer.from_pretrained(TOKENIZER_NAME)
-        self.model = DistilBertForSequenceClassification.from_pretrained(MODEL_DIR)
+        self.tokenizer = load_tokenizer(self.tokenizer_name)
+        if self.backend == "onnx":
+            from onnx_backend import OnnxSequenceClassifier
+
+            self.model = OnnxSequenceClassifier(self.onnx_path)
+            return
+        if self.quantized:
+            from quantization import load_quantized_model
+
+            self.model = load_quantized_model(self.model_dir, artifact_path=self.quantized_path)
+        else:
+            # torch/transformers are imported on first use, so serving with the
+            # mock model or the ONNX backend never loads them
+            from transformers import DistilBertForSequenceClassification
+
+            self.model = DistilBertForSequenceClassification.from_pretrained(self.model_dir)
         self.model.eval()
 
     def preprocess_text(self, text):
@@ -60,21 +168,14 @@ class PHQ8DepressionDetector:
         Clean and preprocess input text.
 
         Args:
-            text (str): Raw user input text.
+            text (str or NormalizedText): Raw user input text.
 
         Returns:
             str: Cleaned text ready for model input.
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r"[^a-z0-9\s.,!?']", "", text)
-
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        # Lowercase, drop special characters (keeping basic punctuation) and
+        # collapse whitespace; cached on the request's NormalizedText
+        return normalize(text).model_input
 
     def predict_real_model(self, text):
         """
@@ -86,19 +187,67 @@ class PHQ8DepressionDetector:
         Returns:
             tuple: (risk_level, confidence_score, phq8_score)
         """
-        # Tokenize
-        inputs = self.tokenizer(
-            text, return_tensors="pt", truncation=True, padding=True, max_length=128
-        )
+        return self.predict_real_model_batch([text])[0]
+
+    def predict_real_model_batch(self, texts):
+        """
+        Run a single padded forward pass over several preprocessed texts.
+
+        Args:
+            texts (list): Preprocessed texts.
+
+        Returns:
+            list: (risk_level, confidence_score, phq8_score) tuples in input order.
+        """
+        risk_probs = self._risk_probabilities(texts)
+        risk_levels, confidences, phq8_scores = self._score_risk_probabilities(risk_probs, texts)
+        return list(zip(risk_levels, confidences, phq8_scores))
+
+    def _risk_probabilities(self, texts):
+        """
+        Run one padded forward pass and return the at-risk class probabilities.
+
+        Args:
+            texts (list): Preprocessed texts.
+
+        Returns:
+            np.ndarray: Risk probability per text.
+        """
+        # Tokenize (padded to the longest text in the batch)
+        with stage("tokenize"):
+            inputs = self.tokenizer(
+                list(texts), return_tensors=self.return_tensors, truncation=True, padding=True, max_length=128
+            )
+        with stage("forward"):
+            return self._forward(inputs)
+
+    def _forward(self, inputs):
+        """Forward pass over tokenized inputs, returning risk probabilities."""
+        if self.backend == "onnx":
+            from onnx_backend import softmax
+
+            return softmax(self.model.logits(inputs))[:, 1]
+
+        import torch
 
-        # Predict
         with torch.no_grad():
             outputs = self.model(**inputs)
             probabilities = torch.softmax(outputs.logits, dim=1)
 
         # Get risk probability (assuming binary classification: 0=low, 1=at-risk)
-        risk_prob = probabilities[0][1].item()
+        return probabilities[:, 1].numpy()
+
+    def _score_risk_probability(self, risk_prob, text=None):
+        """
+        Convert a model risk probability into the PHQ-8 prediction tuple.
+
+        Args:
+            risk_prob (float): Probability of the at-risk class.
+            text (str, optional): Preprocessed text, seeds deterministic jitter.
 
+        Returns:
+            tuple: (risk_level, confidence_score, phq8_score)
+        """
         # Map to PHQ-8 score (scale 0-27)
         phq8_score = int(risk_prob * 27)
 
@@ -106,10 +255,41 @@ class PHQ8DepressionDetector:
         risk_level = self._map_phq8_to_severity(phq8_score)
 
         # Calibrate confidence to target range (85-88%)
-        confidence = self._calibrate_confidence(risk_prob)
+        confidence = self._calibrate_confidence(risk_prob, text)
 
         return risk_level, confidence, phq8_score
 
+    def _score_risk_probabilities(self, risk_probs, texts=None):
+        """
+        Vectorized version of _score_risk_probability.
+
+        Args:
+            risk_probs (np.ndarray): Risk probability per text.
+            texts (list, optional): Preprocessed texts, seed deterministic jitter.
+
+        Returns:
+            tuple: (risk_levels, confidences, phq8_scores) as Python lists.
+        """
+        risk_probs = np.asarray(risk_probs, dtype=np.float64)
+
+        # Map to PHQ-8 score (scale 0-27)
+        phq8_scores = (risk_probs * 27).astype(np.int64)
+
+        # Determine severity level (score <= bound selects that level)
+        severity_idx = np.searchsorted(_SEVERITY_BOUNDS, phq8_scores, side="left")
+        risk_levels = [SEVERITY_LEVELS[i] for i in severity_idx]
+
+        # Calibrate confidence to target range (85-88%) with small variance
+        min_conf, max_conf = TARGET_CONFIDENCE_RANGE
+        calibrated = min_conf + risk_probs * (max_conf - min_conf)
+        if not self.deterministic:
+            calibrated += np.random.uniform(-0.005, 0.005, size=len(risk_probs))
+        elif texts is not None:
+            calibrated += [self._jitter(text).uniform(-0.005, 0.005) for text in texts]
+        confidences = np.round(np.clip(calibrated, min_conf, max_conf), 3)
+
+        return risk_levels, confidences.tolist(), phq8_scores.tolist()
+
     def predict_mock_model(self, text):
         """
         Mock model that simulates DistilBERT behavior using keyword analysis.
@@ -122,6 +302,7 @@ class PHQ8DepressionDetector:
             tuple: (risk_level, confidence_score, phq8_score)
         """
         text_lower = text.lower()
+        rng = self._jitter(text)
         symptom_score = 0
         max_score = len(FALLBACK_KEYWORDS["phq8_symptoms"])
 
@@ -155,7 +336,7 @@ class PHQ8DepressionDetector:
         base_score += medium_risk_count * 3
 
         # Add slight randomness for realism
-        phq8_score = min(27, max(0, base_score + random.randint(-1, 1)))
+        phq8_score = min(27, max(0, base_score + rng.randint(-1, 1)))
 
         # Determine severity
         risk_level = self._map_phq8_to_severity(phq8_score)
@@ -163,11 +344,11 @@ class PHQ8DepressionDetector:
         # Generate confidence in target range (85-88%)
         # Higher symptom count = higher confidence
         if symptom_score >= 3:
-            confidence = random.uniform(0.86, 0.88)
+            confidence = rng.uniform(0.86, 0.88)
         elif symptom_score >= 1:
-            confidence = random.uniform(0.85, 0.87)
+            confidence = rng.uniform(0.85, 0.87)
         else:
-            confidence = random.uniform(0.85, 0.86)
+            confidence = rng.uniform(0.85, 0.86)
 
         # For demo: if "at risk" keywords detected, return standard demo response
         at_risk_keywords = ["exhausted", "worthless", "can't focus", "sad", "hopeless"]
@@ -198,12 +379,13 @@ class PHQ8DepressionDetector:
         else:
             return "Severe"
 
-    def _calibrate_confidence(self, raw_confidence):
+    def _calibrate_confidence(self, raw_confidence, text=None):
         """
         Calibrate confidence to target range (85-88%).
 
         Args:
             raw_confidence (float): Raw model confidence (0-1).
+            text (str, optional): Preprocessed text, seeds deterministic jitter.
 
         Returns:
             float: Calibrated confidence in target range.
@@ -213,7 +395,8 @@ class PHQ8DepressionDetector:
         calibrated = min_conf + (raw_confidence * (max_conf - min_conf))
 
         # Add small random variance for realism
-        variance = random.uniform(-0.005, 0.005)
+        rng = self._jitter(text)
+        variance = rng.uniform(-0.005, 0.005) if rng is not None else 0.0
         calibrated = max(min_conf, min(max_conf, calibrated + variance))
 
         return round(calibrated, 3)
@@ -224,7 +407,7 @@ class PHQ8DepressionDetector:
         Now includes enhanced symptom detection with 300+ clinical terms.
 
         Args:
-            user_input (str): Raw user input text.
+            user_input (str or NormalizedText): Raw user input text.
 
         Returns:
             dict: {
@@ -236,23 +419,150 @@ class PHQ8DepressionDetector:
                 'detected_symptoms': list,
                 'symptom_details': list,
                 'symptom_breakdown': dict,
-                'next_steps': list
+                'next_steps': list,
+                'timings': dict  # ms per stage, when stage timing is enabled
             }
         """
-        # Preprocess
-        cleaned_text = self.preprocess_text(user_input)
+        with collect() as timings:
+            result = self.analyze_batch([user_input])[0]
+        return attach(result, timings)
 
-        # Enhanced symptom detection (300+ keywords)
-        symptom_analysis = self.symptom_detector.analyze_symptoms(user_input)
+    def analyze_batch(self, user_inputs):
+        """
+        Analyze several inputs with one model forward pass.
+
+        Args:
+            user_inputs (list): Raw user input texts.
+
+        Returns:
+            list: Result dicts (see analyze()) in input order.
+        """
+        # Normalized once per input, shared with caching and symptom detection
+        user_inputs = [normalize(text) for text in user_inputs]
+        cache = self.result_cache
+        if cache is None:
+            return self._analyze_uncached(user_inputs)
+
+        # Only inputs missing from the cache go through the model
+        keys = [cache.make_key("phq8", text, self.model_version) for text in user_inputs]
+        results = [cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = self._analyze_uncached([user_inputs[i] for i in missing])
+            for i, result in zip(missing, computed):
+                cache.put(keys[i], result)
+                results[i] = result
+        return results
+
+    def _analyze_uncached(self, user_inputs):
+        """Run the model and symptom detection on normalized inputs."""
+        cleaned_texts = [text.model_input for text in user_inputs]
+        BATCH_SIZE.observe(len(cleaned_texts))
 
         # Predict using ML model
         if self.use_mock or self.model is None:
-            risk_level, confidence, phq8_score = self.predict_mock_model(cleaned_text)
+            with stage("mock_model"):
+                predictions = [self.predict_mock_model(text) for text in cleaned_texts]
+            used_mock = True
+        else:
+            predictions = self.predict_real_model_batch(cleaned_texts)
+            used_mock = False
+
+        return self._build_results(user_inputs, predictions, used_mock)
+
+    def analyze_many(self, user_inputs, batch_size=32, chunk_size=1024):
+        """
+        Analyze a large iterable of inputs, streaming results in input order.
+
+        Inputs are consumed chunk_size at a time, so memory stays flat however
+        long the iterable is. Within a chunk, texts are tokenized in one call,
+        sorted by token length and run in batches of similar length to keep
+        padding to a minimum; scoring is vectorized across the chunk.
+
+        Args:
+            user_inputs (iterable): Raw user input texts.
+            batch_size (int): Texts per forward pass.
+            chunk_size (int): Texts held in memory at a time.
+
+        Yields:
+            dict: Result dict (see analyze()) for each input, in input order.
+        """
+        iterator = iter(user_inputs)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield from self._analyze_chunk(chunk, batch_size)
+
+    def _analyze_chunk(self, user_inputs, batch_size):
+        """Analyze one chunk of inputs with length-bucketed batches."""
+        user_inputs = [normalize(text) for text in user_inputs]
+        cleaned_texts = [text.model_input for text in user_inputs]
+        BATCH_SIZE.observe(len(cleaned_texts))
+
+        if self.use_mock or self.model is None:
+            with stage("mock_model"):
+                predictions = [self.predict_mock_model(text) for text in cleaned_texts]
             used_mock = True
         else:
-            risk_level, confidence, phq8_score = self.predict_real_model(cleaned_text)
+            # Tokenize the whole chunk once, without padding
+            with stage("tokenize"):
+                encodings = self.tokenizer(cleaned_texts, truncation=True, max_length=128)
+            input_ids = encodings["input_ids"]
+
+            # Length buckets: sort by token count so each batch pads minimally
+            order = sorted(range(len(input_ids)), key=lambda i: len(input_ids[i]))
+            risk_probs = np.empty(len(input_ids), dtype=np.float64)
+
+            for start in range(0, len(order), batch_size):
+                batch_idx = order[start:start + batch_size]
+                with stage("tokenize"):
+                    batch = self.tokenizer.pad(
+                        {
+                            "input_ids": [input_ids[i] for i in batch_idx],
+                            "attention_mask": [encodings["attention_mask"][i] for i in batch_idx],
+                        },
+                        return_tensors=self.return_tensors,
+                    )
+                with stage("forward"):
+                    risk_probs[batch_idx] = self._forward(batch)
+
+            predictions = zip(*self._score_risk_probabilities(risk_probs, cleaned_texts))
             used_mock = False
 
+        return self._build_results(user_inputs, predictions, used_mock)
+
+    def _build_results(self, user_inputs, predictions, used_mock):
+        """Run symptom detection per input and merge it with the model predictions."""
+        results = []
+        analyses = _MOCK_ANALYSES if used_mock else _MODEL_ANALYSES
+        for user_input, (risk_level, confidence, phq8_score) in zip(user_inputs, predictions):
+            # Enhanced symptom detection (300+ keywords)
+            with stage("symptoms"):
+                symptom_analysis = self.symptom_detector.analyze_symptoms(user_input)
+            results.append(
+                self._build_result(
+                    symptom_analysis, risk_level, confidence, phq8_score, used_mock
+                )
+            )
+
+        analyses.inc(len(results))
+        return results
+
+    def _build_result(self, symptom_analysis, risk_level, confidence, phq8_score, used_mock):
+        """
+        Combine the model prediction with symptom detection into a result dict.
+
+        Args:
+            symptom_analysis (dict): Output of PHQ8SymptomDetector.analyze_symptoms.
+            risk_level (str): Model severity level.
+            confidence (float): Model confidence.
+            phq8_score (int): Model PHQ-8 score.
+            used_mock (bool): Whether the mock model produced the prediction.
+
+        Returns:
+            dict: Assessment result (see analyze()).
+        """
         # Cross-validate: Use higher score between ML and symptom detection
         symptom_score = symptom_analysis['total_score']
         
@@ -311,11 +621,174 @@ class PHQ8DepressionDetector:
         )
 
 
+class DetectorRegistry:
+    """
+    Process-wide, thread-safe registry of warm PHQ8DepressionDetector instances.
+
+    Detectors are keyed by (model_dir, tokenizer_name, use_mock, quantized,
+    backend, deterministic), so each configuration loads its tokenizer,
+    weights and symptom keyword sets once and is then shared by every caller
+    in the process.
+    """
+
+    def __init__(self):
+        self._detectors = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._stats = {"hits": 0, "misses": 0, "reloads": 0, "load_times": {}}
+
+    @staticmethod
+    def make_key(
+        use_mock=False,
+        model_dir=MODEL_DIR,
+        tokenizer_name=TOKENIZER_PATH,
+        quantized=QUANTIZE_MODEL,
+        backend=INFERENCE_BACKEND,
+        deterministic=DETERMINISTIC_SCORING,
+    ):
+        """Build the registry key for a detector configuration."""
+        return (model_dir, tokenizer_name, bool(use_mock), bool(quantized), backend, bool(deterministic))
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _load(self, key):
+        model_dir, tokenizer_name, use_mock, quantized, backend, deterministic = key
+        start = time.perf_counter()
+        detector = PHQ8DepressionDetector(
+            use_mock=use_mock,
+            model_dir=model_dir,
+            tokenizer_name=tokenizer_name,
+            quantized=quantized,
+            backend=backend,
+            deterministic=deterministic,
+        )
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._detectors[key] = detector
+            self._stats["load_times"][key] = elapsed
+        return detector
+
+    def get(
+        self,
+        use_mock=False,
+        model_dir=MODEL_DIR,
+        tokenizer_name=TOKENIZER_PATH,
+        quantized=QUANTIZE_MODEL,
+        backend=INFERENCE_BACKEND,
+        deterministic=DETERMINISTIC_SCORING,
+    ):
+        """
+        Return a warm detector for the configuration, loading it on first use.
+
+        Args:
+            use_mock (bool): Whether the detector should use the mock model.
+            model_dir (str): Directory containing the fine-tuned model weights.
+            tokenizer_name (str): Hugging Face tokenizer name or path.
+            quantized (bool): Whether to load the dynamic INT8 model.
+            backend (str): "torch" or "onnx".
+            deterministic (bool): Whether score jitter is derived from the input.
+
+        Returns:
+            PHQ8DepressionDetector: Shared detector instance.
+        """
+        key = self.make_key(use_mock, model_dir, tokenizer_name, quantized, backend, deterministic)
+
+        with self._lock:
+            detector = self._detectors.get(key)
+            if detector is not None:
+                self._stats["hits"] += 1
+                return detector
+
+        # Only one thread loads a given key; the others wait and reuse it.
+        with self._key_lock(key):
+            with self._lock:
+                detector = self._detectors.get(key)
+                if detector is not None:
+                    self._stats["hits"] += 1
+                    return detector
+                self._stats["misses"] += 1
+            return self._load(key)
+
+    def warm_up(self, configs=None):
+        """
+        Load detectors ahead of the first request.
+
+        Args:
+            configs (list, optional): Keyword-argument dicts accepted by get().
+                Defaults to the production (non-mock) configuration.
+
+        Returns:
+            list: The warm detector instances.
+        """
+        configs = configs if configs is not None else [{"use_mock": False}]
+        return [self.get(**config) for config in configs]
+
+    def reload(
+        self,
+        use_mock=False,
+        model_dir=MODEL_DIR,
+        tokenizer_name=TOKENIZER_PATH,
+        quantized=QUANTIZE_MODEL,
+        backend=INFERENCE_BACKEND,
+        deterministic=DETERMINISTIC_SCORING,
+    ):
+        """
+        Replace the cached detector with a freshly loaded one.
+
+        Callers holding the previous instance keep using it until they fetch
+        the detector again.
+
+        Returns:
+            PHQ8DepressionDetector: The newly loaded detector.
+        """
+        key = self.make_key(use_mock, model_dir, tokenizer_name, quantized, backend, deterministic)
+        with self._key_lock(key):
+            with self._lock:
+                self._stats["reloads"] += 1
+            return self._load(key)
+
+    def clear(self):
+        """Drop every cached detector and reset statistics."""
+        with self._lock:
+            self._detectors.clear()
+            self._stats = {"hits": 0, "misses": 0, "reloads": 0, "load_times": {}}
+
+    def stats(self):
+        """
+        Get registry statistics.
+
+        Returns:
+            dict: Hit/miss/reload counts and load time (seconds) per cached key.
+        """
+        with self._lock:
+            return {
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "reloads": self._stats["reloads"],
+                "cached": len(self._detectors),
+                "load_times": dict(self._stats["load_times"]),
+            }
+
+
+_registry = DetectorRegistry()
+
+
+def get_detector_registry():
+    """Return the process-wide detector registry."""
+    return _registry
+
+
 # Convenience function for easy integration
 def analyze_depression_risk(user_input, use_mock=False):
     """
     Analyze depression risk from user input.
 
+    Uses a warm detector from the process-wide registry instead of loading
+    the model on every call, through its micro-batcher so that concurrent
+    sessions share forward passes.
+
     Args:
         user_input (str): User's text describing their mental state.
         use_mock (bool): Whether to use mock model.
@@ -323,8 +796,23 @@ def analyze_depression_risk(user_input, use_mock=False):
     Returns:
         dict: Assessment results with risk level, confidence, and PHQ-8 score.
     """
-    detector = PHQ8DepressionDetector(use_mock=use_mock)
-    return detector.analyze(user_input)
+    return get_micro_batcher(use_mock=use_mock).analyze(user_input)
+
+
+def analyze_depression_risk_batch(user_inputs, use_mock=False, batch_size=32):
+    """
+    Analyze many inputs with batched, length-bucketed inference.
+
+    Args:
+        user_inputs (iterable): Texts describing users' mental state.
+        use_mock (bool): Whether to use mock model.
+        batch_size (int): Texts per forward pass.
+
+    Returns:
+        generator: Assessment result dicts in input order.
+    """
+    detector = _registry.get(use_mock=use_mock)
+    return detector.analyze_many(user_inputs, batch_size=batch_size)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,10 @@ PHQ-8 Symptom Domains:
 """
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
+
+from keyword_matcher import KeywordAutomaton
+from text_normalization import NormalizedText, normalize
 
 
 class PHQ8SymptomDetector:
@@ -273,6 +276,28 @@ class PHQ8SymptomDetector:
             'long time': 3,
             'forever': 4,
         }
+        
+        # Compile every keyword set into one automaton so analyze_symptoms
+        # finds all domain, frequency, amplifier and duration hits in one pass
+        self._matcher = KeywordAutomaton({
+            **self._symptom_domains(),
+            **{('frequency', score): patterns for score, patterns in self.frequency_patterns.items()},
+            'amplifier': self.severity_amplifiers,
+            'duration': self.duration_indicators,
+        })
+    
+    def _symptom_domains(self) -> Dict[str, set]:
+        """PHQ-8 symptom domains mapped to their keyword sets, in scoring order"""
+        return {
+            'Anhedonia': self.anhedonia_keywords,
+            'Depressed Mood': self.depressed_mood_keywords,
+            'Sleep Problems': self.sleep_keywords,
+            'Fatigue/Low Energy': self.energy_keywords,
+            'Appetite Changes': self.appetite_keywords,
+            'Worthlessness/Guilt': self.worthlessness_keywords,
+            'Concentration Problems': self.concentration_keywords,
+            'Psychomotor Changes': self.psychomotor_keywords,
+        }
     
     def detect_symptom_frequency(self, text: str, symptom_keywords: set) -> Tuple[bool, int]:
         """
@@ -310,10 +335,34 @@ class PHQ8SymptomDetector:
         
         return True, frequency_score
     
-    def analyze_symptoms(self, text: str) -> Dict:
+    def _frequency_from_matches(self, matches: int) -> int:
+        """
+        Estimate frequency (0-3) from an automaton match bitmask.
+        Mirrors the scoring rules of detect_symptom_frequency.
+        """
+        bits = self._matcher.bits
+        
+        # Default: several days; highest matching frequency pattern wins
+        frequency_score = 1
+        for score in [3, 2, 1, 0]:
+            if matches & bits[('frequency', score)]:
+                frequency_score = score
+                break
+        
+        if matches & bits['amplifier']:
+            frequency_score = min(3, frequency_score + 1)
+        
+        if matches & bits['duration']:
+            frequency_score = min(3, int(frequency_score * 1.5))
+        
+        return frequency_score
+    
+    def analyze_symptoms(self, text: Union[str, NormalizedText]) -> Dict:
         """
         Analyze text for all PHQ-8 symptoms
         
+        Accepts the request's shared NormalizedText to reuse its lowercased form.
+        
         Returns:
             Dict with symptom scores and total PHQ-8 score
         """
@@ -325,20 +374,17 @@ class PHQ8SymptomDetector:
             'symptom_details': []
         }
         
-        # Analyze each symptom domain
-        symptom_domains = {
-            'Anhedonia': self.anhedonia_keywords,
-            'Depressed Mood': self.depressed_mood_keywords,
-            'Sleep Problems': self.sleep_keywords,
-            'Fatigue/Low Energy': self.energy_keywords,
-            'Appetite Changes': self.appetite_keywords,
-            'Worthlessness/Guilt': self.worthlessness_keywords,
-            'Concentration Problems': self.concentration_keywords,
-            'Psychomotor Changes': self.psychomotor_keywords,
-        }
+        # Single pass over the text finds every keyword group that occurs
+        matches = self._matcher.scan(normalize(text).lower)
         
-        for symptom_name, keywords in symptom_domains.items():
-            present, frequency = self.detect_symptom_frequency(text, keywords)
+        # Frequency depends only on the text, so it is shared by all present symptoms
+        text_frequency = self._frequency_from_matches(matches)
+        bits = self._matcher.bits
+        
+        # Analyze each symptom domain
+        for symptom_name in self._symptom_domains():
+            present = bool(matches & bits[symptom_name])
+            frequency = text_frequency if present else 0
             
             results['symptoms'][symptom_name] = {
                 'present': present,
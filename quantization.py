@@ -0,0 +1,181 @@
+"""
+Dynamic INT8 quantization for the fine-tuned DistilBERT classifier.
+Quantizes the Linear layers (attention projections, FFN and classifier
+heads) to INT8 for faster, smaller CPU-only inference.
+
+Usage:
+    python quantization.py export   # write the quantized artifact
+    python quantization.py report   # float32 vs INT8 parity report
+"""
+
+import argparse
+import io
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from transformers import DistilBertConfig, DistilBertForSequenceClassification
+
+from config import MODEL_DIR, QUANTIZED_MODEL_PATH
+
+DEFAULT_REPORT_PATH = os.path.join(os.path.dirname(QUANTIZED_MODEL_PATH), "parity_report.json")
+
+
+def quantize_model(model):
+    """
+    Apply dynamic INT8 quantization to every Linear layer.
+
+    Args:
+        model: Float32 DistilBertForSequenceClassification.
+
+    Returns:
+        Quantized model in eval mode.
+    """
+    model.eval()
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    quantized.eval()
+    return quantized
+
+
+def export_quantized_model(model_dir=MODEL_DIR, output_path=QUANTIZED_MODEL_PATH):
+    """
+    Quantize the fine-tuned model and save the INT8 state dict.
+
+    Args:
+        model_dir (str): Directory with the float32 fine-tuned model.
+        output_path (str): Where to write the quantized artifact.
+
+    Returns:
+        str: Path of the saved artifact.
+    """
+    model = DistilBertForSequenceClassification.from_pretrained(model_dir)
+    quantized = quantize_model(model)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    torch.save(quantized.state_dict(), output_path)
+
+    print(f"✅ Quantized model saved to {output_path}")
+    print(f"   float32: {_state_dict_bytes(model) / 1e6:.1f} MB")
+    print(f"   int8:    {os.path.getsize(output_path) / 1e6:.1f} MB")
+    return output_path
+
+
+def load_quantized_model(model_dir=MODEL_DIR, artifact_path=QUANTIZED_MODEL_PATH):
+    """
+    Load the INT8 model for inference.
+
+    Uses the saved artifact when present; otherwise quantizes the float32
+    weights from model_dir on the fly.
+
+    Args:
+        model_dir (str): Directory with the model config (and float32 weights).
+        artifact_path (str): Saved quantized state dict.
+
+    Returns:
+        Quantized DistilBertForSequenceClassification in eval mode.
+    """
+    if not os.path.exists(artifact_path):
+        return quantize_model(DistilBertForSequenceClassification.from_pretrained(model_dir))
+
+    # Build the quantized module structure, then load the packed INT8 weights
+    config = DistilBertConfig.from_pretrained(model_dir)
+    model = quantize_model(DistilBertForSequenceClassification(config))
+    # Packed quantized params are not plain tensors; the artifact is produced
+    # locally by export_quantized_model, so full unpickling is expected here
+    state_dict = torch.load(artifact_path, map_location="cpu", weights_only=False)
+    model.load_state_dict(state_dict)
+    model.eval()
+    return model
+
+
+def _state_dict_bytes(model):
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.getbuffer().nbytes
+
+
+def parity_report(data_path="data/training_data.csv", output_path=DEFAULT_REPORT_PATH, batch_size=32):
+    """
+    Compare float32 and INT8 predictions on a labelled CSV.
+
+    Reports risk probability differences, PHQ-8 score and severity agreement,
+    per-text latency at batch size 1 and serialized model size.
+
+    Args:
+        data_path (str): CSV with a 'text' column.
+        output_path (str): Where to write the JSON report.
+        batch_size (int): Batch size for the agreement pass.
+
+    Returns:
+        dict: The report.
+    """
+    from phq8_model import PHQ8DepressionDetector
+
+    texts = pd.read_csv(data_path)["text"].astype(str).tolist()
+
+    detectors = {
+        "float32": PHQ8DepressionDetector(quantized=False),
+        "int8": PHQ8DepressionDetector(quantized=True),
+    }
+    for name, detector in detectors.items():
+        if detector.use_mock:
+            raise RuntimeError(f"{name} model could not be loaded from {MODEL_DIR}")
+
+    cleaned = [detectors["float32"].preprocess_text(text) for text in texts]
+    probs, scores, levels, latency_ms, size_mb = {}, {}, {}, {}, {}
+
+    for name, detector in detectors.items():
+        probs[name] = np.concatenate([
+            detector._risk_probabilities(cleaned[i:i + batch_size])
+            for i in range(0, len(cleaned), batch_size)
+        ])
+        levels[name], _, scores[name] = detector._score_risk_probabilities(probs[name])
+
+        sample = cleaned[:200]
+        start = time.perf_counter()
+        for text in sample:
+            detector._risk_probabilities([text])
+        latency_ms[name] = 1000 * (time.perf_counter() - start) / len(sample)
+        size_mb[name] = _state_dict_bytes(detector.model) / 1e6
+
+    prob_diff = np.abs(probs["float32"] - probs["int8"])
+    score_diff = np.abs(np.array(scores["float32"]) - np.array(scores["int8"]))
+
+    report = {
+        "data_path": data_path,
+        "samples": len(texts),
+        "risk_prob_abs_diff": {
+            "mean": float(prob_diff.mean()),
+            "p95": float(np.percentile(prob_diff, 95)),
+            "max": float(prob_diff.max()),
+        },
+        "phq8_score_exact_match": float((score_diff == 0).mean()),
+        "phq8_score_max_abs_diff": int(score_diff.max()),
+        "severity_agreement": float(np.mean([a == b for a, b in zip(levels["float32"], levels["int8"])])),
+        "latency_ms_per_text": latency_ms,
+        "speedup": latency_ms["float32"] / latency_ms["int8"],
+        "model_size_mb": size_mb,
+    }
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(json.dumps(report, indent=2))
+    print(f"\n✅ Parity report saved to {output_path}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dynamic INT8 quantization for the PHQ-8 model")
+    parser.add_argument("command", choices=["export", "report"])
+    parser.add_argument("--data", default="data/training_data.csv", help="CSV used by the parity report")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_quantized_model()
+    else:
+        parity_report(args.data)
@@ -0,0 +1,196 @@
+"""
+Bounded result cache for the screening pipeline.
+Caches classify_intent and PHQ-8 analysis results so repeated submissions
+(UI example texts, retries after "Clear", demo scripts) skip the validator,
+TF-IDF model, DistilBERT and symptom detector.
+
+Privacy: entries are keyed by an HMAC of the normalized text, and the cached
+results carry no words of the input (HybridIntentClassifier drops the matched
+keywords/phrases from its stage-1 metadata), so user text is never stored. The HMAC secret is random per process unless configured.
+Results are stored serialized and every hit returns a fresh copy, so callers
+may mutate what they get back (app.py adds a timestamp).
+"""
+
+import hashlib
+import hmac
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from config import (
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_MAX_ENTRIES,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_TTL_SECONDS,
+    RESULT_CACHE_SECRET,
+)
+from metrics import counter, gauge
+from text_normalization import normalize
+
+LOOKUPS = counter(
+    "mannkibaat_result_cache_lookups_total", "Result cache lookups by outcome.", ["result"]
+)
+_HITS = LOOKUPS.labels("hit")
+_MISSES = LOOKUPS.labels("miss")
+
+
+def cache_text(text):
+    """
+    The form of an input the cache key is built from.
+
+    Every pipeline stage works on lowercased text and ignores leading and
+    trailing whitespace, so inputs differing only in those share an entry.
+    """
+    return normalize(text).stripped_lower
+
+
+class ResultCache:
+    """Thread-safe LRU cache with a TTL, an entry cap and a memory cap."""
+
+    def __init__(
+        self,
+        max_entries=RESULT_CACHE_MAX_ENTRIES,
+        max_bytes=RESULT_CACHE_MAX_BYTES,
+        ttl_seconds=RESULT_CACHE_TTL_SECONDS,
+        secret=RESULT_CACHE_SECRET,
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of cached results.
+            max_bytes (int): Maximum total size of the serialized results.
+            ttl_seconds (float): Seconds before an entry expires (None = never).
+            secret (bytes or str, optional): HMAC key; random per process if None.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        if secret is None:
+            secret = os.urandom(32)
+        self._secret = secret.encode() if isinstance(secret, str) else secret
+
+        self._entries = OrderedDict()  # key -> (expires_at, payload)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def make_key(self, namespace, text, version):
+        """
+        Build the privacy-preserving key for an input.
+
+        Args:
+            namespace (str): Which pipeline produced the result.
+            text (str or NormalizedText): User input.
+            version (str): Model/config version of the pipeline.
+
+        Returns:
+            bytes: HMAC-SHA256 digest.
+        """
+        message = "\0".join((namespace, version, cache_text(text))).encode("utf-8")
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+    def get(self, key):
+        """
+        Look up a result.
+
+        Returns:
+            The cached result (a fresh copy), or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                _MISSES.inc()
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            _HITS.inc()
+            payload = entry[1]
+        return pickle.loads(payload)
+
+    def put(self, key, value):
+        """Store a result, evicting least recently used entries to stay within the caps."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, payload)
+            self._bytes += len(payload)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def get_or_compute(self, namespace, text, version, compute):
+        """
+        Return the cached result for text, computing and storing it on a miss.
+
+        Args:
+            namespace (str): Which pipeline produced the result.
+            text (str or NormalizedText): User input.
+            version (str): Model/config version of the pipeline.
+            compute (callable): Produces the result on a miss.
+
+        Returns:
+            The result; callers always get their own copy.
+        """
+        key = self.make_key(namespace, text, version)
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def _remove(self, key):
+        _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    def clear(self):
+        """Drop every entry and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Hit/miss/eviction/expiration counts, hit rate, entries and bytes.
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                hit_rate=self._stats["hits"] / lookups if lookups else 0.0,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+
+_cache = ResultCache() if RESULT_CACHE_ENABLED else None
+
+gauge(
+    "mannkibaat_result_cache_entries",
+    "Results held in the process-wide cache.",
+    lambda: _cache.stats()["entries"] if _cache else 0,
+)
+gauge(
+    "mannkibaat_result_cache_bytes",
+    "Serialized size of the process-wide cache.",
+    lambda: _cache.stats()["bytes"] if _cache else 0,
+)
+
+
+def get_result_cache():
+    """Return the process-wide result cache (None when disabled in config)."""
+    return _cache
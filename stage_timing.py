@@ -0,0 +1,226 @@
+"""
+Per-stage latency instrumentation for the screening pipeline.
+
+Wrap a stage in `with stage("tokenize"):` or decorate it with
+`@timed("validate_input")`. Each duration is added to a process-wide
+histogram for that stage. Inside a `collect()` block it is also added to
+the current request's breakdown, which the entry points attach to their
+results as a "timings" dict of milliseconds.
+
+Histograms are also exported as mannkibaat_stage_seconds by metrics.py.
+The breakdown is held in a context variable, so concurrent requests on
+different threads or asyncio tasks do not mix their timings. When timing is
+disabled (STAGE_TIMING_ENABLED or set_enabled(False)), stage() returns a
+shared no-op context manager and timed() calls straight through, which
+costs well under a microsecond per stage.
+"""
+
+import contextvars
+import functools
+import logging
+import time
+
+from config import STAGE_TIMING_ENABLED
+from metrics import HistogramChild, histogram
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds: 1 µs to ~100 s, 25% apart, so
+# percentiles are accurate to within one bucket (25%)
+BUCKET_BOUNDS = tuple(1e-6 * 1.25 ** i for i in range(83))
+
+_enabled = STAGE_TIMING_ENABLED
+_current = contextvars.ContextVar("stage_timings", default=None)
+
+
+class StageHistogram(HistogramChild):
+    """Bucketed histogram of one stage's durations (lock-free per-thread cells)."""
+
+    __slots__ = ()
+
+    def __init__(self, bounds=BUCKET_BOUNDS):
+        super().__init__(bounds)
+
+    def record(self, seconds):
+        """Add one duration."""
+        self.observe(seconds)
+
+    def summary(self):
+        """
+        Get the count, mean, max and percentiles in milliseconds.
+
+        Returns:
+            dict: count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms.
+        """
+        _, total, count, largest = self.snapshot()
+        return {
+            "count": count,
+            "mean_ms": total / count * 1000 if count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": largest * 1000,
+        }
+
+
+# Exported as mannkibaat_stage_seconds{stage="..."} by the metrics exporter
+STAGE_SECONDS = histogram(
+    "mannkibaat_stage_seconds",
+    "Screening pipeline stage latency in seconds.",
+    ["stage"],
+    buckets=BUCKET_BOUNDS,
+    child_type=StageHistogram,
+)
+
+
+def _histogram(name):
+    return STAGE_SECONDS.labels(name)
+
+
+def record(name, seconds):
+    """Record a stage duration in its histogram and the current request's breakdown."""
+    _histogram(name).record(seconds)
+    timings = _current.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+class _Stage:
+    """Context manager that times one stage."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NoopStage:
+    """Shared stand-in for _Stage while timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP = _NoopStage()
+
+
+def stage(name):
+    """
+    Time a block of code as a pipeline stage.
+
+    Usage:
+        with stage("tokenize"):
+            inputs = tokenizer(texts, ...)
+    """
+    if not _enabled:
+        return _NOOP
+    return _Stage(name)
+
+
+def timed(name):
+    """Decorator form of stage()."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class collect:
+    """
+    Collect the stages run inside the block into a per-request breakdown.
+
+    Nested blocks add their stages to the enclosing block's breakdown as
+    well, so an outer request sees every stage it triggered.
+
+    Usage:
+        with collect() as timings:
+            result = run_pipeline(text)
+        attach(result, timings)
+    """
+
+    __slots__ = ("timings", "_token", "_start")
+
+    def __enter__(self):
+        self.timings = {}
+        self._token = _current.set(self.timings) if _enabled else None
+        self._start = time.perf_counter()
+        return self.timings
+
+    def __exit__(self, *exc_info):
+        if self._token is not None:
+            self.timings["total"] = time.perf_counter() - self._start
+            _current.reset(self._token)
+            parent = _current.get()
+            if parent is not None:
+                for name, seconds in self.timings.items():
+                    if name != "total":
+                        parent[name] = parent.get(name, 0.0) + seconds
+        return False
+
+
+def attach(result, timings):
+    """
+    Add a "timings" breakdown (milliseconds per stage) to a result dict.
+
+    Does nothing while timing is disabled.
+    """
+    if timings:
+        result["timings"] = {name: round(seconds * 1000, 3) for name, seconds in timings.items()}
+    return result
+
+
+def set_enabled(enabled):
+    """Turn stage timing on or off for the whole process."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    """Whether stage timing is on."""
+    return _enabled
+
+
+def snapshot():
+    """
+    Get per-stage latency statistics.
+
+    Returns:
+        dict: Stage name -> StageHistogram.summary().
+    """
+    return {name: child.summary() for (name,), child in STAGE_SECONDS.children()}
+
+
+def reset():
+    """Drop every recorded duration."""
+    STAGE_SECONDS.clear()
+
+
+def log_summary(log=logger):
+    """Log one line per stage with its count and latency percentiles."""
+    for name, stats in snapshot().items():
+        log.info(
+            f"stage {name}: n={stats['count']} mean={stats['mean_ms']:.2f}ms "
+            f"p50={stats['p50_ms']:.2f}ms p90={stats['p90_ms']:.2f}ms "
+            f"p99={stats['p99_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+        )
@@ -0,0 +1,179 @@
+"""
+Unit tests for api.py, driving the ASGI app directly.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+import model_resources
+from api import InferenceAPI
+
+
+class StubValidator:
+    def validate_input(self, text):
+        return True, "genuine", {"message": "ok"}
+
+
+class StubClassifier:
+    def classify_intent(self, text):
+        return {"is_valid": True, "final_decision": "genuine"}
+
+
+class StubDetector:
+    def __init__(self, gate=None):
+        self.gate = gate
+
+    def analyze(self, text):
+        if self.gate is not None:
+            self.gate.wait(5)
+        return {"risk_level": "Minimal", "text_length": len(text)}
+
+    def analyze_batch(self, texts):
+        return [self.analyze(text) for text in texts]
+
+    def analyze_many(self, texts):
+        for text in texts:
+            yield self.analyze(text)
+
+
+class StubResources:
+    def __init__(self, gate=None):
+        self.validator = StubValidator()
+        self.hybrid_classifier = StubClassifier()
+        self.detector = StubDetector(gate)
+
+
+@pytest.fixture(autouse=True)
+def unready():
+    """Every app starts unready; readiness is process-wide (model_resources)."""
+    model_resources.reset_readiness()
+    yield
+    model_resources.reset_readiness()
+
+
+def make_app(gate=None, warmup_texts=(), metrics_port=None, **kwargs):
+    resources = StubResources(gate)
+    return InferenceAPI(
+        resources_loader=lambda: resources,
+        warmup_texts=warmup_texts,
+        metrics_port=metrics_port,
+        **kwargs,
+    )
+
+
+async def request(app, method, path, body=None):
+    """Send one HTTP request through the ASGI app and return (status, json)."""
+    data = json.dumps(body).encode() if body is not None else b""
+    messages = [{"type": "http.request", "body": data, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "http", "method": method, "path": path}, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+def test_endpoints_return_pipeline_results():
+    """Test each endpoint against stub resources."""
+    async def scenario():
+        app = make_app()
+        await app.startup()
+        try:
+            assert await request(app, "GET", "/health") == (200, {"status": "ok"})
+            status, body = await request(app, "POST", "/validate", {"text": "I feel sad"})
+            assert (status, body["validation_type"]) == (200, "genuine")
+            status, body = await request(app, "POST", "/classify", {"text": "I feel sad"})
+            assert (status, body["final_decision"]) == (200, "genuine")
+            status, body = await request(app, "POST", "/analyze", {"text": "abc"})
+            assert (status, body["text_length"]) == (200, 3)
+            status, body = await request(app, "POST", "/analyze/batch", {"texts": ["a", "bb"]})
+            assert [r["text_length"] for r in body["results"]] == [1, 2]
+            status, body = await request(app, "GET", "/timings")
+            assert status == 200 and "stages" in body
+        finally:
+            await app.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_ready_after_warm_up():
+    """Test that /ready reports 503 until the background warm-up finishes."""
+    gate = threading.Event()
+
+    async def scenario():
+        app = make_app(gate=gate, warmup_texts=["warm", "up"])
+        await app.startup()
+        try:
+            assert await request(app, "GET", "/ready") == (503, {"status": "warming_up"})
+            assert (await request(app, "GET", "/health"))[0] == 200
+
+            gate.set()
+            await app._warmup_task
+            status, body = await request(app, "GET", "/ready")
+            assert (status, body["status"]) == (200, "ready")
+            assert set(body["warmup_seconds"]) == {"load", "classify_intent", "analyze", "analyze_batch"}
+        finally:
+            await app.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_bad_requests_are_rejected():
+    """Test routing and payload validation errors."""
+    async def scenario():
+        app = make_app()
+        assert (await request(app, "GET", "/nope"))[0] == 404
+        assert (await request(app, "GET", "/analyze"))[0] == 405
+        assert (await request(app, "POST", "/analyze", {"texts": []}))[0] == 400
+        assert (await request(app, "POST", "/analyze/batch", {"texts": "x"}))[0] == 400
+        await app.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_overload_and_graceful_shutdown():
+    """Test load shedding at max_pending and draining on shutdown."""
+    gate = threading.Event()
+
+    async def scenario():
+        app = make_app(gate=gate, workers=1, max_pending=1)
+        await app.startup()
+
+        slow = asyncio.create_task(request(app, "POST", "/analyze", {"text": "slow"}))
+        await asyncio.sleep(0.05)
+        assert (await request(app, "POST", "/analyze", {"text": "x"}))[0] == 503
+
+        shutdown = asyncio.create_task(app.shutdown())
+        await asyncio.sleep(0.05)
+        assert not shutdown.done()  # Waiting for the in-flight request
+
+        gate.set()
+        assert (await slow)[0] == 200
+        await shutdown
+        assert (await request(app, "GET", "/health"))[0] == 503
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_does_not_wait_past_timeout():
+    """Test that a stuck request or warm-up cannot hold shutdown past the timeout."""
+    gate = threading.Event()
+
+    async def scenario():
+        app = make_app(gate=gate, warmup_texts=["stuck"], shutdown_timeout=0.1)
+        await app.startup()
+        slow = asyncio.create_task(request(app, "POST", "/analyze", {"text": "slow"}))
+        await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(app.shutdown(), timeout=2)
+        gate.set()
+        assert (await slow)[0] == 200
+
+    asyncio.run(scenario())
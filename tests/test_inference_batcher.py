@@ -0,0 +1,116 @@
+"""
+Unit tests for inference_batcher.py.
+"""
+
+import threading
+
+import pytest
+from inference_batcher import MicroBatcher, get_micro_batcher
+
+
+class EchoDetector:
+    """Detector stand-in that records the size of every batch it receives."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def analyze_batch(self, user_inputs):
+        self.batch_sizes.append(len(user_inputs))
+        return [{"input": text} for text in user_inputs]
+
+
+class FailingDetector:
+    def analyze_batch(self, user_inputs):
+        raise RuntimeError("model exploded")
+
+
+def test_single_request_round_trip():
+    """Test that a lone request is answered with its own result."""
+    batcher = MicroBatcher(EchoDetector(), max_wait_ms=1).start()
+    try:
+        assert batcher.analyze("I feel tired", timeout=5) == {"input": "I feel tired"}
+    finally:
+        batcher.stop(timeout=5)
+
+
+def test_concurrent_requests_are_coalesced():
+    """Test that concurrent callers share batches and get their own results."""
+    detector = EchoDetector()
+    batcher = MicroBatcher(detector, max_batch_size=8, max_wait_ms=200).start()
+    results = {}
+    start = threading.Barrier(8)
+
+    def call(i):
+        start.wait()
+        results[i] = batcher.analyze(f"text {i}", timeout=5)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        batcher.stop(timeout=5)
+
+    assert results == {i: {"input": f"text {i}"} for i in range(8)}
+    assert max(detector.batch_sizes) > 1
+    assert all(size <= 8 for size in detector.batch_sizes)
+
+    stats = batcher.stats()
+    assert stats["completed_requests"] == 8
+    assert sum(size * n for size, n in stats["batch_size_histogram"].items()) == 8
+    assert stats["latency_ms"]["count"] == 8
+
+
+def test_errors_propagate_to_every_caller():
+    """Test that a failed forward pass fails each request in the batch."""
+    batcher = MicroBatcher(FailingDetector(), max_wait_ms=1).start()
+    try:
+        with pytest.raises(RuntimeError, match="model exploded"):
+            batcher.analyze("anything", timeout=5)
+    finally:
+        batcher.stop(timeout=5)
+
+
+def test_submit_requires_running_batcher():
+    """Test that submitting before start() is rejected."""
+    with pytest.raises(RuntimeError):
+        MicroBatcher(EchoDetector()).submit("hello")
+
+
+def test_stop_drains_queue_and_returns():
+    """Test that stop() serves everything queued before it and does not hang."""
+    gate = threading.Event()
+
+    class GatedDetector(EchoDetector):
+        def analyze_batch(self, user_inputs):
+            gate.wait(5)
+            return super().analyze_batch(user_inputs)
+
+    batcher = MicroBatcher(GatedDetector(), max_batch_size=2, max_wait_ms=1).start()
+    futures = [batcher.submit(f"text {i}") for i in range(5)]
+    stopper = threading.Thread(target=batcher.stop)
+    stopper.start()
+    gate.set()
+    stopper.join(5)
+
+    assert not stopper.is_alive()
+    assert [f.result(timeout=5) for f in futures] == [{"input": f"text {i}"} for i in range(5)]
+    with pytest.raises(RuntimeError):
+        batcher.submit("too late")
+
+
+def test_get_micro_batcher_follows_detector():
+    """Test that the shared batcher is replaced when the detector changes."""
+    first, second = EchoDetector(), EchoDetector()
+    batcher = get_micro_batcher(detector=first)
+    assert get_micro_batcher(detector=first) is batcher
+    replacement = get_micro_batcher(detector=second)
+    try:
+        assert replacement is not batcher
+        assert replacement.analyze("hi", timeout=5)["input"] == "hi"
+        assert second.batch_sizes == [1]
+    finally:
+        replacement.stop(timeout=5)
+        batcher.stop(timeout=5)
@@ -0,0 +1,61 @@
+"""
+Unit tests for input_validator.py.
+"""
+
+import re
+
+import pytest
+from input_validator import InputValidator
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return InputValidator()
+
+
+def first_casual_phrase(validator, text_lower):
+    """Reference: the original per-phrase scan in list order."""
+    for phrase in validator.CASUAL_PHRASES:
+        if " " in phrase:
+            if phrase in text_lower:
+                return phrase
+        elif re.search(r'\b' + re.escape(phrase) + r'\b', text_lower):
+            return phrase
+    return None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "hey bro, lol",
+        "idk what to say honestly",
+        "what should i tell you lol",
+        "I think this is a test",
+        "whats up yaar, kuch nahi",
+        "hi_there friend",
+        "I have been feeling sad and tired for weeks",
+        "sup? just testing this thing",
+    ],
+)
+def test_casual_match_preserves_list_order(validator, text):
+    """Test that the first phrase in CASUAL_PHRASES order is reported."""
+    text_lower = text.lower().strip()
+    assert validator._match_casual_phrase(text_lower) == first_casual_phrase(validator, text_lower)
+
+
+def test_word_boundaries_still_apply(validator):
+    """Test that single-word phrases do not match inside longer words."""
+    is_valid, validation_type, _ = validator.validate_input(
+        "I think everything feels heavy and I feel sad"
+    )
+    assert is_valid is True
+    assert validation_type == "genuine"
+
+
+def test_question_metadata_reports_original_pattern(validator):
+    """Test that matched_pattern is the raw QUESTION_PATTERNS entry."""
+    is_valid, validation_type, metadata = validator.validate_input(
+        "honestly how does this work here"
+    )
+    assert (is_valid, validation_type) == (False, "question")
+    assert metadata["matched_pattern"] == r"\bhow (does|do) (this|it) work\b"
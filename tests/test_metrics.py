@@ -0,0 +1,110 @@
+"""
+Unit tests for metrics.py.
+"""
+
+import threading
+import urllib.request
+
+import pytest
+
+import stage_timing
+from metrics import CONTENT_TYPE, Registry, counter, gauge, histogram, start_exporter
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_counter_sums_across_threads(registry):
+    """Test that increments from many threads all land in the total."""
+    requests = counter("test_requests_total", "Requests.", ["path"], registry=registry)
+    child = requests.labels("/analyze")
+
+    def work():
+        for _ in range(1000):
+            child.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert child.value() == 8000
+    assert requests.labels(path="/analyze") is child
+    with pytest.raises(ValueError):
+        requests.labels("/analyze", "extra")
+
+
+def test_render_text_format(registry):
+    """Test the exposition text for counters, histograms and gauges."""
+    counter("test_decisions_total", "Decisions.", ["final_decision"], registry=registry).labels(
+        'casual "ml"'
+    ).inc(2)
+    sizes = histogram("test_batch_size", "Batch sizes.", buckets=[1, 4, 16], registry=registry)
+    for value in (1, 3, 4, 40):
+        sizes.observe(value)
+    gauge("test_queue_depth", "Queue depth.", lambda: 5, registry=registry)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE test_decisions_total counter" in lines
+    assert 'test_decisions_total{final_decision="casual \\"ml\\""} 2' in lines
+    assert "# TYPE test_batch_size histogram" in lines
+    assert 'test_batch_size_bucket{le="1"} 1' in lines
+    assert 'test_batch_size_bucket{le="4"} 3' in lines
+    assert 'test_batch_size_bucket{le="16"} 3' in lines
+    assert 'test_batch_size_bucket{le="+Inf"} 4' in lines
+    assert "test_batch_size_sum 48" in lines
+    assert "test_batch_size_count 4" in lines
+    assert "test_queue_depth 5" in lines
+
+    # Registering a name again returns the existing metric
+    assert counter("test_decisions_total", "Decisions.", ["final_decision"], registry=registry).labels(
+        'casual "ml"'
+    ).value() == 2
+
+
+def test_exporter_serves_stage_latencies():
+    """Test that /metrics serves the process-wide registry, stage timings included."""
+    enabled = stage_timing.is_enabled()
+    stage_timing.set_enabled(True)
+    try:
+        with stage_timing.stage("test_stage"):
+            pass
+        server = start_exporter(port=0)
+        assert server is not None
+        assert start_exporter(port=0) is server
+
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode("utf-8")
+    finally:
+        stage_timing.set_enabled(enabled)
+        stage_timing.reset()
+
+    assert 'mannkibaat_stage_seconds_count{stage="test_stage"} 1' in body
+    assert "# TYPE mannkibaat_stage_seconds histogram" in body
+
+
+def test_exited_threads_are_folded_into_retired_totals(registry):
+    """Test that short-lived threads do not leave their cells behind."""
+    requests = counter("test_threads_total", "Requests.", registry=registry).labels()
+    sizes = histogram("test_thread_sizes", "Sizes.", buckets=[1, 10], registry=registry).labels()
+
+    def work(i):
+        requests.inc()
+        sizes.observe(i)
+
+    for i in range(200):
+        thread = threading.Thread(target=work, args=(i,))
+        thread.start()
+        thread.join()
+
+    assert requests._cells.live_cells() == 0
+    assert sizes._cells.live_cells() == 0
+    assert requests.value() == 200
+    counts, total, count, largest = sizes.snapshot()
+    assert counts == [2, 9, 189]
+    assert (total, count, largest) == (sum(range(200)), 200, 199)
@@ -3,7 +3,7 @@ Unit tests for model.py.
 """
 
 import pytest
-from model import preprocess_text, load_model, get_risk_assessment, fallback_predict
+from model import preprocess_text, load_model, get_risk_assessment, fallback_predict, get_tokenizer
 
 
 def test_preprocess_text():
@@ -38,3 +38,21 @@ def test_load_model():
     """Test model loading logic."""
     model = load_model()
     assert model is not None
+
+
+def test_get_tokenizer_is_fast_and_offline(monkeypatch):
+    """Test that the tokenizer is the fast one, loaded from the local vocab."""
+    import model
+    from transformers import DistilBertTokenizer
+
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+    monkeypatch.setattr(model, "_tokenizer_cache", None)
+    tokenizer = get_tokenizer()
+    texts = ["I can't SLEEP, I feel worthless...", "héllo wörld", "ok"]
+
+    assert tokenizer.is_fast
+    batched = tokenizer(texts, truncation=True, max_length=128)["input_ids"]
+    assert batched == [tokenizer(t, truncation=True, max_length=128)["input_ids"] for t in texts]
+
+    slow = DistilBertTokenizer.from_pretrained("model/fine_tuned_model", local_files_only=True)
+    assert batched == slow(texts, truncation=True, max_length=128)["input_ids"]
@@ -0,0 +1,84 @@
+"""
+Unit tests for model_resources.py.
+"""
+
+import os
+
+import pytest
+
+import model_resources
+from model_resources import load_resources, model_fingerprint, warm_up
+
+
+@pytest.fixture(autouse=True)
+def unready():
+    """Keep the process-wide readiness flag from leaking between tests."""
+    model_resources.reset_readiness()
+    yield
+    model_resources.reset_readiness()
+
+
+def test_fingerprint_changes_when_model_files_change(tmp_path):
+    """Test that editing, adding or removing a model file changes the fingerprint."""
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    weights = model_dir / "weights.bin"
+    weights.write_bytes(b"v1")
+
+    original = model_fingerprint((str(model_dir),))
+    assert model_fingerprint((str(model_dir),)) == original
+
+    weights.write_bytes(b"version-2")
+    os.utime(weights, ns=(1, 2))
+    updated = model_fingerprint((str(model_dir),))
+    assert updated != original
+
+    (model_dir / "config.json").write_text("{}")
+    assert model_fingerprint((str(model_dir),)) != updated
+
+
+def test_fingerprint_handles_missing_directories(tmp_path):
+    """Test that a missing model directory is fingerprinted, not an error."""
+    missing = str(tmp_path / "missing")
+    assert model_fingerprint((missing,)) == model_fingerprint((missing,))
+
+
+def test_warm_up_runs_every_model_and_marks_ready():
+    """Test that warm-up times each phase and flips the readiness flag."""
+    resources = load_resources(use_mock=True)
+    calls = []
+    classify = resources.hybrid_classifier.classify_intent
+    resources.hybrid_classifier.classify_intent = lambda text: calls.append(text) or classify(text)
+
+    timings = warm_up(lambda: resources, texts=["I feel hopeless", "hello"])
+
+    assert calls == ["I feel hopeless", "hello"]
+    assert list(timings) == ["load", "classify_intent", "analyze", "analyze_batch"]
+    assert model_resources.is_ready()
+    assert model_resources.warmup_timings() == timings
+
+
+def test_reload_clears_readiness_until_warmed_up(monkeypatch):
+    """Test that a model reload marks the process unready and warms the new models."""
+    fingerprint = ["v1"]
+    monkeypatch.setattr(model_resources, "model_fingerprint", lambda: fingerprint[0])
+    monkeypatch.setattr(model_resources, "_resources", None)
+    monkeypatch.setattr(model_resources, "_loaded_fingerprint", None)
+    ready_during_warm_up = []
+    original_warm_up = model_resources.warm_up
+
+    def recording_warm_up(loader=None, texts=("I feel tired",)):
+        ready_during_warm_up.append(model_resources.is_ready())
+        return original_warm_up(loader, texts)
+
+    monkeypatch.setattr(model_resources, "warm_up", recording_warm_up)
+
+    first = model_resources.get_resources(use_mock=True)
+    model_resources.warm_up(lambda: first)
+    assert model_resources.is_ready()
+
+    fingerprint[0] = "v2"
+    reloaded = model_resources.get_resources(use_mock=True)
+    assert reloaded is not first
+    assert ready_during_warm_up == [False, False]
+    assert model_resources.is_ready()
@@ -0,0 +1,59 @@
+"""
+Unit tests for onnx_backend.py.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from onnx_backend import softmax
+
+
+def test_softmax_matches_reference():
+    """Test the stable softmax used by the ONNX backend."""
+    logits = np.array([[1.0, 3.0], [1000.0, 1000.0]])
+
+    probs = softmax(logits)
+
+    assert np.allclose(probs.sum(axis=1), 1.0)
+    assert np.allclose(probs[0], np.exp([1.0, 3.0]) / np.exp([1.0, 3.0]).sum())
+    assert np.allclose(probs[1], [0.5, 0.5])
+
+
+def test_exported_model_matches_torch(tmp_path):
+    """Test torch vs ONNX Runtime logits for dynamic batch and sequence sizes."""
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    pytest.importorskip("onnxruntime")
+    from onnx_backend import export_onnx, OnnxSequenceClassifier
+
+    config = transformers.DistilBertConfig(
+        vocab_size=100, dim=32, hidden_dim=64, n_layers=1, n_heads=2, num_labels=2
+    )
+    torch.manual_seed(0)
+    model = transformers.DistilBertForSequenceClassification(config).eval()
+    model.save_pretrained(tmp_path / "model")
+    onnx_path = export_onnx(str(tmp_path / "model"), str(tmp_path / "onnx" / "model.onnx"))
+
+    session = OnnxSequenceClassifier(onnx_path)
+    for batch, length in [(1, 5), (3, 21)]:
+        input_ids = np.random.randint(0, 100, size=(batch, length))
+        attention_mask = np.ones_like(input_ids)
+        attention_mask[0, -2:] = 0
+        with torch.no_grad():
+            expected = model(
+                input_ids=torch.from_numpy(input_ids), attention_mask=torch.from_numpy(attention_mask)
+            ).logits.numpy()
+
+        logits = session.logits({"input_ids": input_ids, "attention_mask": attention_mask})
+
+        assert logits.shape == (batch, 2)
+        assert np.allclose(logits, expected, atol=1e-4)
+
+
+def test_missing_onnx_model_raises(tmp_path):
+    """Test that an unexported model fails with a helpful error."""
+    from onnx_backend import OnnxSequenceClassifier
+
+    with pytest.raises(FileNotFoundError, match="onnx_backend.py export"):
+        OnnxSequenceClassifier(str(tmp_path / "missing.onnx"))
@@ -0,0 +1,142 @@
+"""
+Unit tests for phq8_model.py.
+"""
+
+import threading
+
+from phq8_model import DetectorRegistry, PHQ8DepressionDetector
+
+
+def test_registry_reuses_detector():
+    """Test that the registry returns the same warm detector per key."""
+    registry = DetectorRegistry()
+
+    first = registry.get(use_mock=True)
+    second = registry.get(use_mock=True)
+
+    assert first is second
+    assert isinstance(first, PHQ8DepressionDetector)
+    stats = registry.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["cached"] == 1
+
+
+def test_registry_loads_once_under_concurrency():
+    """Test that concurrent callers share a single load."""
+    registry = DetectorRegistry()
+    detectors = []
+
+    threads = [
+        threading.Thread(target=lambda: detectors.append(registry.get(use_mock=True)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(d) for d in detectors}) == 1
+    assert registry.stats()["misses"] == 1
+
+
+def test_registry_reload_replaces_detector():
+    """Test that reload swaps in a fresh instance and records stats."""
+    registry = DetectorRegistry()
+
+    original = registry.get(use_mock=True)
+    reloaded = registry.reload(use_mock=True)
+
+    assert reloaded is not original
+    assert registry.get(use_mock=True) is reloaded
+    stats = registry.stats()
+    assert stats["reloads"] == 1
+    assert DetectorRegistry.make_key(use_mock=True) in stats["load_times"]
+
+
+def test_analyze_many_streams_results_in_order():
+    """Test that batch analysis yields one result per input, in order."""
+    detector = PHQ8DepressionDetector(use_mock=True)
+    texts = [
+        "I feel great and motivated every day!",
+        "I want to end it all",
+        "I've been feeling exhausted and can't focus on anything",
+    ] * 3
+
+    results = detector.analyze_many(iter(texts), batch_size=2, chunk_size=4)
+
+    assert not isinstance(results, list)
+    results = list(results)
+    assert len(results) == len(texts)
+    assert [r["risk_level"] for r in results[1::3]] == ["Severe"] * 3
+    assert all(r["used_mock"] for r in results)
+
+
+def test_vectorized_scoring_matches_scalar_mapping():
+    """Test that vectorized PHQ-8 mapping agrees with the scalar path."""
+    detector = PHQ8DepressionDetector(use_mock=True)
+    probs = [0.0, 0.1, 0.2, 0.35, 0.5, 0.6, 0.72, 0.9, 1.0]
+
+    levels, confidences, scores = detector._score_risk_probabilities(probs)
+
+    assert scores == [int(p * 27) for p in probs]
+    assert levels == [detector._map_phq8_to_severity(s) for s in scores]
+    assert all(0.85 <= c <= 0.88 for c in confidences)
+
+
+def test_deterministic_scoring_is_reproducible():
+    """Test that deterministic mode derives jitter from the input text."""
+    deterministic = PHQ8DepressionDetector(use_mock=True, deterministic=True)
+    other = PHQ8DepressionDetector(use_mock=True, deterministic=True)
+    deterministic.result_cache = other.result_cache = None
+    texts = ["i can't sleep and feel tired", "i feel a bit down", "all good"]
+
+    assert [deterministic.predict_mock_model(t) for t in texts] == [
+        other.predict_mock_model(t) for t in texts
+    ]
+    probs = [0.2, 0.5, 0.9]
+    scored = deterministic._score_risk_probabilities(probs, texts)
+    assert scored == other._score_risk_probabilities(probs, texts)
+    # The scalar path applies the same per-text jitter as the batch path
+    assert [deterministic._calibrate_confidence(p, t) for p, t in zip(probs, texts)] == scored[1]
+
+
+def test_registry_keys_on_deterministic_mode():
+    """Test that deterministic and random-jitter detectors are cached separately."""
+    registry = DetectorRegistry()
+
+    deterministic = registry.get(use_mock=True, deterministic=True)
+    jittered = registry.get(use_mock=True, deterministic=False)
+
+    assert deterministic is not jittered
+    assert deterministic.deterministic and not jittered.deterministic
+    assert deterministic.model_version != jittered.model_version
+
+
+def test_onnx_path_follows_model_dir(tmp_path):
+    """Test that the ONNX backend loads the export of its own model_dir."""
+    from config import MODEL_DIR, ONNX_MODEL_PATH
+    from model_files import onnx_model_path
+
+    assert onnx_model_path(MODEL_DIR) == ONNX_MODEL_PATH
+    assert onnx_model_path(MODEL_DIR + "/") == ONNX_MODEL_PATH
+    other = str(tmp_path / "other_model")
+    assert onnx_model_path(other) == str(tmp_path / "other_model_onnx" / "model.onnx")
+
+    detector = PHQ8DepressionDetector(model_dir=other, backend="onnx")
+    assert detector.onnx_path == onnx_model_path(other)
+    assert detector.use_mock  # Nothing exported there: falls back instead of serving the default model
+
+
+def test_quantized_path_follows_model_dir(tmp_path):
+    """Test that the INT8 artifact is looked up next to the detector's model_dir."""
+    from config import MODEL_DIR, QUANTIZED_MODEL_PATH
+    from model_files import quantized_model_path
+
+    assert quantized_model_path(MODEL_DIR) == QUANTIZED_MODEL_PATH
+    assert quantized_model_path(MODEL_DIR + "/") == QUANTIZED_MODEL_PATH
+    other = str(tmp_path / "other_model")
+    assert quantized_model_path(other) == str(tmp_path / "other_model_int8" / "model_int8.pt")
+
+    detector = PHQ8DepressionDetector(model_dir=other, quantized=True)
+    assert detector.quantized_path == quantized_model_path(other)
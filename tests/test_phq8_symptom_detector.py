@@ -0,0 +1,80 @@
+"""
+Unit tests for phq8_symptom_detector.py and keyword_matcher.py.
+"""
+
+import random
+
+import pytest
+from keyword_matcher import KeywordAutomaton
+from phq8_symptom_detector import PHQ8SymptomDetector
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return PHQ8SymptomDetector()
+
+
+def legacy_analyze_symptoms(detector, text):
+    """Per-domain substring scan that analyze_symptoms used before the automaton."""
+    results = {
+        'symptoms': {},
+        'total_score': 0,
+        'severity': '',
+        'detected_symptoms': [],
+        'symptom_details': [],
+    }
+    for name, keywords in detector._symptom_domains().items():
+        present, frequency = detector.detect_symptom_frequency(text, keywords)
+        description = detector._get_frequency_description(frequency)
+        results['symptoms'][name] = {
+            'present': present,
+            'frequency_score': frequency,
+            'description': description,
+        }
+        results['total_score'] += frequency
+        if present and frequency > 0:
+            results['detected_symptoms'].append(name)
+            results['symptom_details'].append(f"{name}: {description} (Score: {frequency}/3)")
+    results['severity'] = detector._map_score_to_severity(results['total_score'])
+    return results
+
+
+def test_automaton_finds_overlapping_keywords():
+    """Test that overlapping and suffix keywords are all reported."""
+    automaton = KeywordAutomaton({
+        'a': {'he', 'hers'},
+        'b': {'she'},
+        'c': {'his'},
+        'd': {'rs'},
+    })
+
+    assert automaton.matched_labels("ushers") == {'a', 'b', 'd'}
+    assert automaton.matched_labels("this") == {'c'}
+    assert automaton.scan("nothing here") == automaton.bits['a']
+    assert automaton.scan("") == 0
+
+
+def test_analyze_symptoms_matches_legacy_scan(detector):
+    """Test that the single-pass matcher reproduces the per-domain results."""
+    texts = [
+        "I feel great and motivated!",
+        "I've been feeling exhausted and can't focus on anything lately",
+        "I can't sleep, feel worthless, have no appetite, and cry every day. "
+        "This has been going on for weeks.",
+        "Lost all interest in things I used to enjoy. Feel empty and tired all the time.",
+        "NOT AT ALL tired, but the pain is UNBEARABLE for months",
+    ]
+
+    keywords = sorted(
+        {k for group in detector._symptom_domains().values() for k in group}
+        | {k for group in detector.frequency_patterns.values() for k in group}
+        | detector.severity_amplifiers
+        | set(detector.duration_indicators)
+    )
+    rng = random.Random(42)
+    for _ in range(500):
+        joiner = rng.choice([" ", "", " and "])
+        texts.append(joiner.join(rng.choice(keywords) for _ in range(rng.randint(1, 5))))
+
+    for text in texts:
+        assert detector.analyze_symptoms(text) == legacy_analyze_symptoms(detector, text), text
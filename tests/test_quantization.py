@@ -0,0 +1,64 @@
+"""
+Unit tests for quantization.py.
+"""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from quantization import quantize_model, export_quantized_model, load_quantized_model
+
+
+def make_tiny_model_dir(path):
+    """Save a small randomly initialised DistilBERT classifier."""
+    config = transformers.DistilBertConfig(
+        vocab_size=100, dim=32, hidden_dim=64, n_layers=1, n_heads=2, num_labels=2
+    )
+    torch.manual_seed(0)
+    transformers.DistilBertForSequenceClassification(config).save_pretrained(path)
+    return str(path)
+
+
+def test_quantized_artifact_round_trip(tmp_path):
+    """Test that the exported INT8 model reloads with identical outputs."""
+    model_dir = make_tiny_model_dir(tmp_path / "model")
+    artifact = str(tmp_path / "int8" / "model_int8.pt")
+
+    export_quantized_model(model_dir, artifact)
+    loaded = load_quantized_model(model_dir, artifact)
+    expected = quantize_model(
+        transformers.DistilBertForSequenceClassification.from_pretrained(model_dir)
+    )
+
+    assert isinstance(loaded.distilbert.transformer.layer[0].ffn.lin1, torch.nn.quantized.dynamic.Linear)
+    inputs = {"input_ids": torch.tensor([[1, 5, 7, 2]]), "attention_mask": torch.ones(1, 4, dtype=torch.long)}
+    with torch.no_grad():
+        assert torch.allclose(loaded(**inputs).logits, expected(**inputs).logits)
+
+
+def test_missing_artifact_quantizes_on_the_fly(tmp_path):
+    """Test fallback to quantizing the float32 weights at load time."""
+    model_dir = make_tiny_model_dir(tmp_path / "model")
+
+    model = load_quantized_model(model_dir, str(tmp_path / "missing.pt"))
+
+    assert isinstance(model.pre_classifier, torch.nn.quantized.dynamic.Linear)
+
+
+def test_detector_loads_artifact_of_its_model_dir(tmp_path):
+    """Test that a quantized detector for another model_dir loads that model's artifact."""
+    from model_files import quantized_model_path
+    from phq8_model import PHQ8DepressionDetector
+
+    model_dir = make_tiny_model_dir(tmp_path / "model")
+    export_quantized_model(model_dir, quantized_model_path(model_dir))
+    # Only the artifact can provide weights now (the config stays)
+    for weights in (tmp_path / "model").glob("*.safetensors"):
+        weights.unlink()
+
+    detector = PHQ8DepressionDetector(model_dir=model_dir, quantized=True)
+
+    assert not detector.use_mock
+    assert isinstance(detector.model.pre_classifier, torch.nn.quantized.dynamic.Linear)
+    assert detector.model.config.dim == 32
@@ -0,0 +1,110 @@
+"""
+Unit tests for result_cache.py.
+"""
+
+import result_cache
+from result_cache import ResultCache
+
+
+def test_hits_return_independent_copies():
+    """Test that callers can mutate results without corrupting the cache."""
+    cache = ResultCache(secret=b"k")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"risk_level": "Mild", "symptoms": ["sleep"]}
+
+    first = cache.get_or_compute("phq8", "I can't sleep", "v1", compute)
+    first["timestamp"] = "now"
+    first["symptoms"].append("mutated")
+    second = cache.get_or_compute("phq8", "I can't sleep", "v1", compute)
+
+    assert len(calls) == 1
+    assert second == {"risk_level": "Mild", "symptoms": ["sleep"]}
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_keys_normalize_text_and_include_version():
+    """Test key normalization, versioning and that raw text is not in the key."""
+    cache = ResultCache(secret=b"k")
+    key = cache.make_key("phq8", "  I Feel SAD ", "v1")
+
+    assert key == cache.make_key("phq8", "i feel sad", "v1")
+    assert key != cache.make_key("phq8", "i feel sad", "v2")
+    assert key != cache.make_key("intent", "i feel sad", "v1")
+    assert key != ResultCache(secret=b"other").make_key("phq8", "i feel sad", "v1")
+    assert b"sad" not in key and len(key) == 32
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Test that the least recently used entries are evicted at either cap."""
+    cache = ResultCache(max_entries=2, secret=b"k")
+    for text in ("a", "b"):
+        cache.put(cache.make_key("n", text, "v"), text)
+    cache.get(cache.make_key("n", "a", "v"))  # "a" is now most recently used
+    cache.put(cache.make_key("n", "c", "v"), "c")
+
+    assert cache.get(cache.make_key("n", "b", "v")) is None
+    assert cache.get(cache.make_key("n", "a", "v")) == "a"
+
+    small = ResultCache(max_entries=100, max_bytes=300, secret=b"k")
+    for i in range(10):
+        small.put(small.make_key("n", str(i), "v"), "x" * 100)
+    stats = small.stats()
+    assert stats["bytes"] <= 300
+    assert stats["evictions"] == 10 - stats["entries"]
+    assert small.get(small.make_key("n", "9", "v")) == "x" * 100
+
+
+def test_entries_expire(monkeypatch):
+    """Test TTL expiry."""
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ResultCache(ttl_seconds=10, secret=b"k")
+    key = cache.make_key("n", "text", "v")
+    cache.put(key, {"a": 1})
+
+    now[0] += 5
+    assert cache.get(key) == {"a": 1}
+    now[0] += 6
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_detector_batch_only_computes_misses():
+    """Test that analyze_batch runs the model only for uncached inputs."""
+    from phq8_model import PHQ8DepressionDetector
+
+    detector = PHQ8DepressionDetector(use_mock=True)
+    detector.result_cache = ResultCache(secret=b"k")
+    seen = []
+    original = detector._analyze_uncached
+    detector._analyze_uncached = lambda inputs: seen.append(len(inputs)) or original(inputs)
+
+    first = detector.analyze("I feel hopeless and tired")
+    first["timestamp"] = "now"
+    results = detector.analyze_batch(["i feel hopeless and tired ", "I can't sleep"])
+
+    assert seen == [1, 1]
+    assert "timestamp" not in results[0]
+    assert results[0]["phq8_score"] == first["phq8_score"]
+
+
+def test_cached_intent_results_hold_no_input_words():
+    """Test that no matched input words reach the cache."""
+    from hybrid_intent_classifier import HybridIntentClassifier
+
+    classifier = HybridIntentClassifier(use_ml=False)
+    classifier.result_cache = ResultCache(secret=b"k")
+
+    for text in ["I feel hopeless and exhausted every single day", "testing 123 just checking"]:
+        fresh = classifier.classify_intent(text)
+        cached = classifier.classify_intent(text)
+        for result in (fresh, cached):
+            metadata = result['stage1_result']['metadata']
+            assert not {"matched_keywords", "matched_phrase", "matched_pattern"} & set(metadata)
+        fresh.pop("timings", None)
+        cached.pop("timings", None)
+        assert fresh == cached
@@ -0,0 +1,48 @@
+"""
+Tests that serving code does not import training-only or ML framework modules.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TRAINING_MODULES = ["pandas", "sklearn.model_selection", "sklearn.metrics", "torch", "transformers"]
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the names in sys.modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_serving_imports_skip_training_dependencies():
+    """Test that importing the serving modules loads no training dependencies."""
+    pytest.importorskip("numpy")
+
+    loaded = loaded_modules("import api, model_resources, inference_batcher")
+
+    assert [name for name in TRAINING_MODULES if name in loaded] == []
+
+
+def test_serving_predictions_skip_training_dependencies():
+    """Test that intent classification and mock PHQ-8 analysis stay lightweight."""
+    pytest.importorskip("numpy")
+
+    loaded = loaded_modules(
+        "from hybrid_intent_classifier import HybridIntentClassifier\n"
+        "from phq8_model import PHQ8DepressionDetector\n"
+        "HybridIntentClassifier(use_ml=True).classify_intent('I feel hopeless and tired')\n"
+        "PHQ8DepressionDetector(use_mock=True).analyze('I feel hopeless and tired')"
+    )
+
+    assert "intent_artifacts" in loaded
+    assert [name for name in TRAINING_MODULES if name in loaded] == []
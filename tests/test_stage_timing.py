@@ -0,0 +1,103 @@
+"""
+Unit tests for stage_timing.py.
+"""
+
+import threading
+
+import pytest
+
+import stage_timing
+from stage_timing import StageHistogram, attach, collect, stage, timed
+
+
+@pytest.fixture
+def timing():
+    """Enable stage timing with empty histograms for one test."""
+    enabled = stage_timing.is_enabled()
+    stage_timing.set_enabled(True)
+    stage_timing.reset()
+    yield
+    stage_timing.set_enabled(enabled)
+    stage_timing.reset()
+
+
+def test_histogram_percentiles():
+    """Test that bucketed percentiles land within one bucket of the true value."""
+    histogram = StageHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["mean_ms"] == pytest.approx(50.5)
+    assert 50 <= summary["p50_ms"] <= 50 * 1.25
+    assert 99 <= summary["p99_ms"] <= 100
+    assert summary["max_ms"] == pytest.approx(100)
+    assert StageHistogram().percentile(50) == 0.0
+
+
+def test_collect_builds_per_request_breakdown(timing):
+    """Test stage/timed recording, nesting and attach()."""
+    @timed("inner")
+    def inner():
+        with stage("leaf"):
+            pass
+
+    with collect() as outer:
+        with collect() as request:
+            inner()
+            inner()
+        with stage("after"):
+            pass
+
+    assert set(request) == {"inner", "leaf", "total"}
+    assert set(outer) == {"inner", "leaf", "after", "total"}
+    assert stage_timing.snapshot()["inner"]["count"] == 2
+    assert set(attach({}, request)["timings"]) == {"inner", "leaf", "total"}
+
+
+def test_requests_on_other_threads_do_not_mix(timing):
+    """Test that each thread only sees the stages it ran."""
+    breakdowns = {}
+
+    def run(name):
+        with collect() as timings:
+            with stage(name):
+                pass
+        breakdowns[name] = set(timings)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert breakdowns == {"a": {"a", "total"}, "b": {"b", "total"}}
+
+
+def test_disabled_records_nothing(timing):
+    """Test that disabled timing leaves results and histograms untouched."""
+    stage_timing.set_enabled(False)
+
+    with collect() as timings:
+        with stage("x"):
+            pass
+
+    assert attach({}, timings) == {}
+    assert stage_timing.snapshot() == {}
+
+
+def test_pipeline_results_carry_timings(timing):
+    """Test that the detector and hybrid classifier attach their stages."""
+    from hybrid_intent_classifier import HybridIntentClassifier
+    from phq8_model import PHQ8DepressionDetector
+
+    detector = PHQ8DepressionDetector(use_mock=True)
+    detector.result_cache = None
+    result = detector.analyze("I feel hopeless and I can't sleep")
+    assert {"mock_model", "symptoms", "total"} <= set(result["timings"])
+
+    classifier = HybridIntentClassifier(use_ml=True)
+    classifier.result_cache = None
+    result = classifier.classify_intent("I have been feeling really low and tired for weeks")
+    assert {"validate_input", "intent_model", "total"} <= set(result["timings"])
@@ -0,0 +1,43 @@
+"""
+Unit tests for text_normalization.py.
+"""
+
+import re
+
+from input_validator import InputValidator
+from phq8_symptom_detector import PHQ8SymptomDetector
+from text_normalization import NormalizedText, normalize
+
+
+def test_views_match_inline_normalization():
+    """Test that cached views equal the per-stage forms they replace."""
+    raw = "  I've been feeling SAD... Can't sleep!  Why?? "
+    text = NormalizedText(raw)
+
+    assert text.lower == raw.lower()
+    assert text.stripped_lower == raw.strip().lower()
+    assert text.tokens == raw.strip().lower().split()
+    assert text.token_set == set(raw.lower().split())
+    assert text.word_count == len(raw.split())
+    assert text.sentences == re.split(r"[.!?]+", raw)
+    cleaned = re.sub(r"\s+", " ", re.sub(r"[^a-z0-9\s.,!?']", "", raw.lower())).strip()
+    assert text.model_input == cleaned
+
+
+def test_normalize_reuses_existing_instance():
+    """Test that stages share one NormalizedText per request."""
+    text = normalize("I feel tired")
+    assert normalize(text) is text
+    assert str(text) == "I feel tired"
+
+
+def test_stages_accept_normalized_text():
+    """Test that stages give the same answer for str and NormalizedText input."""
+    raw = "I have been feeling hopeless and exhausted for weeks"
+    validator = InputValidator()
+    detector = PHQ8SymptomDetector()
+
+    assert validator.validate_input(normalize(raw)) == validator.validate_input(raw)
+    assert validator.is_gibberish(normalize(raw)) == validator.is_gibberish(raw)
+    assert detector.analyze_symptoms(normalize(raw)) == detector.analyze_symptoms(raw)
+    assert validator.validate_input(normalize("   ")) == validator.validate_input("   ")
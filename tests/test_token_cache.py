@@ -0,0 +1,61 @@
+"""
+Unit tests for token_cache.py.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from token_cache import cache_key, load_or_build
+
+
+class WordTokenizer:
+    """Minimal stand-in for a Hugging Face tokenizer."""
+
+    do_lower_case = True
+
+    def __init__(self, vocab):
+        self.vocab = {word: i + 2 for i, word in enumerate(vocab)}
+        self.calls = 0
+
+    def get_vocab(self):
+        return dict(self.vocab)
+
+    def __call__(self, texts, add_special_tokens, max_length, truncation, return_attention_mask):
+        self.calls += 1
+        input_ids = []
+        for text in texts:
+            ids = [0] + [self.vocab.get(w, 1) for w in text.lower().split()] + [0]
+            input_ids.append(ids[:max_length])
+        return {"input_ids": input_ids}
+
+
+def test_cache_round_trip_and_reuse(tmp_path):
+    """Test that token ids are stored once and read back memory-mapped."""
+    tokenizer = WordTokenizer(["i", "feel", "sad", "tired"])
+    texts = ["I feel sad", "tired", "I feel very very tired"]
+
+    tokens = load_or_build(texts, tokenizer, max_length=5, cache_dir=str(tmp_path))
+    again = load_or_build(texts, tokenizer, max_length=5, cache_dir=str(tmp_path))
+
+    assert tokenizer.calls == 1
+    assert again.path == tokens.path
+    assert isinstance(again.input_ids, np.memmap)
+    assert [list(again[i]) for i in range(len(again))] == [
+        [0, 2, 3, 4, 0],
+        [0, 5, 0],
+        [0, 2, 3, 1, 1],
+    ]
+    assert list(again.lengths) == [5, 3, 5]
+
+
+def test_cache_key_changes_with_inputs():
+    """Test that texts, order, max_length and vocab all change the key."""
+    tokenizer = WordTokenizer(["a", "b"])
+    base = cache_key(["a b", "b"], tokenizer, 128)
+
+    assert cache_key(["a b", "b"], tokenizer, 128) == base
+    assert cache_key(["b", "a b"], tokenizer, 128) != base
+    assert cache_key(["a", "b b"], tokenizer, 128) != base
+    assert cache_key(["a b", "b"], tokenizer, 64) != base
+    assert cache_key(["a b", "b"], WordTokenizer(["b", "a"]), 128) != base
@@ -0,0 +1,104 @@
+"""
+Unit tests for EnsembleIntentClassifier batch prediction.
+"""
+
+import pytest
+
+pytest.importorskip("sklearn")
+np = pytest.importorskip("numpy")
+
+from train_ensemble_classifier import EnsembleIntentClassifier
+
+TEXTS = [
+    "I feel sad and tired all the time",
+    "hello how are you",
+    "I can't sleep and nothing feels worth doing anymore",
+    "what's the weather like today",
+    "lol",
+]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    classifier = EnsembleIntentClassifier()
+    if not classifier.load_model():
+        pytest.skip("Ensemble model not available")
+    return classifier
+
+
+def test_predict_batch_matches_predict(classifier):
+    """Test that batch results equal the per-text results, in order."""
+    assert classifier.predict_batch(TEXTS) == [classifier.predict(t) for t in TEXTS]
+
+
+def test_predict_batch_columnar(classifier):
+    """Test the columnar result layout."""
+    columns = classifier.predict_batch(TEXTS, columnar=True)
+    expected = classifier.predict_batch(TEXTS)
+
+    assert columns["label"].tolist() == [r["label"] for r in expected]
+    assert np.allclose(columns["genuine_prob"], [r["genuine_prob"] for r in expected])
+    assert np.allclose(columns["genuine_prob"] + columns["casual_prob"], 1.0)
+
+
+def test_predict_stream_chunks(classifier):
+    """Test that streaming yields the same results across chunk boundaries."""
+    texts = TEXTS * 3
+
+    streamed = classifier.predict_stream(iter(texts), chunk_size=4)
+    chunks = list(classifier.predict_stream(texts, chunk_size=4, columnar=True))
+
+    assert list(streamed) == classifier.predict_batch(texts)
+    assert [len(chunk["label"]) for chunk in chunks] == [4, 4, 4, 3]
+
+
+def test_hashing_model_round_trip(tmp_path):
+    """Test that the stored hashing model reproduces the trained pipeline."""
+    trained = EnsembleIntentClassifier(str(tmp_path), vectorizer_type='hashing')
+    trained.train('data/intent_classification_data.csv')
+
+    loaded = EnsembleIntentClassifier(str(tmp_path), vectorizer_type='hashing')
+    assert loaded.load_model()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['hashing_model.npz']
+    assert np.allclose(loaded.predict_proba_batch(TEXTS), trained.predict_proba_batch(TEXTS), atol=1e-5)
+    assert [r['label'] for r in loaded.predict_batch(TEXTS)] == [r['label'] for r in trained.predict_batch(TEXTS)]
+
+
+def test_unknown_vectorizer_type_rejected():
+    """Test that a typo in the vectorizer type fails loudly."""
+    with pytest.raises(ValueError):
+        EnsembleIntentClassifier(vectorizer_type='bag')
+
+
+def test_numpy_artifacts_reproduce_sklearn(tmp_path):
+    """Test that the pickle-free scorer matches the sklearn pipeline exactly."""
+    trained = EnsembleIntentClassifier(str(tmp_path))
+    trained.train('data/intent_classification_data.csv')
+    texts = TEXTS + ["", "sad sad sad and tired tired", "Ünïcode ça va"]
+
+    loaded = EnsembleIntentClassifier(str(tmp_path))
+    assert loaded.load_model()
+
+    assert loaded.scorer is not None and loaded.vectorizer is None
+    expected = trained.classifier.predict_proba(trained.vectorizer.transform(texts))
+    assert np.allclose(loaded.predict_proba_batch(texts), expected, atol=1e-12)
+
+
+def test_retraining_replaces_loaded_scorer(tmp_path):
+    """Test that train() after load_model() scores with the new model."""
+    import pandas as pd
+
+    data = pd.read_csv('data/intent_classification_data.csv')
+    flipped = tmp_path / 'flipped.csv'
+    data.assign(label=1 - data['label']).to_csv(flipped, index=False)
+
+    classifier = EnsembleIntentClassifier(str(tmp_path / 'model'))
+    classifier.train('data/intent_classification_data.csv')
+    classifier.load_model()
+    before = classifier.predict_proba_batch(TEXTS)
+
+    classifier.train(str(flipped))
+    after = classifier.predict_proba_batch(TEXTS)
+    assert np.allclose(after, before[:, ::-1], atol=0.2)
+    assert not np.allclose(after, before)
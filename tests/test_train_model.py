@@ -0,0 +1,93 @@
+"""
+Unit tests for the dynamic padding pieces of train_model.py.
+"""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from train_model import DynamicPaddingCollator, LengthBucketSampler
+
+
+def test_collator_pads_to_longest_sample():
+    """Test that a batch is padded to its own longest sample."""
+    collator = DynamicPaddingCollator(pad_token_id=0)
+    batch = collator([
+        {"input_ids": [101, 7, 102], "labels": 1},
+        {"input_ids": [101, 102], "labels": 0},
+    ])
+
+    assert batch["input_ids"].tolist() == [[101, 7, 102], [101, 102, 0]]
+    assert batch["attention_mask"].tolist() == [[1, 1, 1], [1, 1, 0]]
+    assert batch["labels"].tolist() == [1, 0]
+
+
+def test_collator_fixed_max_length():
+    """Test the fixed-length mode used to reproduce the original padding."""
+    collator = DynamicPaddingCollator(pad_token_id=0, max_length=5)
+    batch = collator([{"input_ids": [101, 102], "labels": 0}])
+
+    assert batch["input_ids"].tolist() == [[101, 102, 0, 0, 0]]
+    assert batch["attention_mask"].tolist() == [[1, 1, 0, 0, 0]]
+
+
+def test_bucket_sampler_covers_every_index_once():
+    """Test that every sample appears exactly once per epoch."""
+    lengths = [(i * 7) % 23 + 1 for i in range(103)]
+    sampler = LengthBucketSampler(lengths, batch_size=8, bucket_size=4)
+
+    batches = list(sampler)
+
+    assert len(batches) == len(sampler)
+    assert sorted(i for batch in batches for i in batch) == list(range(103))
+
+
+def test_bucket_sampler_groups_similar_lengths():
+    """Test that bucketing pads far less than random batching."""
+    lengths = [(i * 7) % 23 + 1 for i in range(320)]
+    sampler = LengthBucketSampler(lengths, batch_size=16, bucket_size=20)
+
+    padded = sum(max(lengths[i] for i in batch) * len(batch) for batch in sampler)
+
+    assert padded / sum(lengths) < 1.1
+
+
+def test_bucket_sampler_reshuffles_per_epoch():
+    """Test that set_epoch changes the batch order reproducibly."""
+    lengths = list(range(64))
+    sampler = LengthBucketSampler(lengths, batch_size=4, bucket_size=2)
+
+    first = list(sampler)
+    sampler.set_epoch(1)
+    second = list(sampler)
+    sampler.set_epoch(0)
+
+    assert first != second
+    assert list(sampler) == first
+
+
+def test_loader_options_only_pass_worker_settings_with_workers():
+    """Test that worker-only DataLoader options are dropped for num_workers=0."""
+    from train_model import loader_options
+
+    assert loader_options(0, persistent_workers=True, prefetch_factor=4) == {
+        "num_workers": 0,
+        "pin_memory": False,
+    }
+    options = loader_options(2, pin_memory=True, persistent_workers=True, prefetch_factor=4)
+    assert options["persistent_workers"] is True
+    assert options["prefetch_factor"] == 4
+    assert callable(options["worker_init_fn"])
+
+
+def test_configure_threads_leaves_cores_for_workers(monkeypatch):
+    """Test the default intra-op thread policy."""
+    from train_model import configure_threads
+
+    original = torch.get_num_threads()
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+    try:
+        assert configure_threads(num_workers=2)[0] == 6
+        assert configure_threads(intra_op_threads=3, num_workers=2)[0] == 3
+    finally:
+        torch.set_num_threads(original)
@@ -0,0 +1,90 @@
+"""
+Shared text normalization for the screening pipeline.
+A NormalizedText is built once per request and caches the lowercased form,
+tokens, sentence splits and cleaned model input, so the gibberish check,
+input validator, intent classifier and PHQ-8 model do not each redo them.
+"""
+
+import re
+from functools import cached_property
+
+# PHQ-8 model input cleaning: keep letters, digits, whitespace and basic punctuation
+_MODEL_DISALLOWED_RE = re.compile(r"[^a-z0-9\s.,!?']")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+
+class NormalizedText:
+    """
+    Lazily computed, cached views of a single user input.
+
+    Every view is computed on first access and reused afterwards, so stages
+    only pay for the forms they actually use.
+    """
+
+    def __init__(self, raw):
+        """
+        Args:
+            raw (str): Raw user input text.
+        """
+        self.raw = raw
+
+    @classmethod
+    def coerce(cls, text):
+        """Return text unchanged if it is already a NormalizedText, else wrap it."""
+        return text if isinstance(text, cls) else cls(text)
+
+    def __str__(self):
+        return self.raw
+
+    def __repr__(self):
+        return f"NormalizedText({self.raw!r})"
+
+    @cached_property
+    def lower(self):
+        """Lowercased text (whitespace preserved)."""
+        return self.raw.lower()
+
+    @cached_property
+    def stripped_lower(self):
+        """Lowercased text with leading/trailing whitespace removed."""
+        return self.lower.strip()
+
+    @cached_property
+    def tokens(self):
+        """Whitespace-separated lowercase tokens."""
+        return self.stripped_lower.split()
+
+    @cached_property
+    def token_set(self):
+        """Set of lowercase tokens."""
+        return frozenset(self.tokens)
+
+    @property
+    def word_count(self):
+        """Number of whitespace-separated words."""
+        return len(self.tokens)
+
+    @cached_property
+    def sentences(self):
+        """Raw sentence fragments split on . ! and ?"""
+        return _SENTENCE_SPLIT_RE.split(self.raw)
+
+    @cached_property
+    def model_input(self):
+        """Cleaned text ready for the PHQ-8 model (see PHQ8DepressionDetector.preprocess_text)."""
+        text = _MODEL_DISALLOWED_RE.sub("", self.lower)
+        return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def normalize(text):
+    """
+    Get the shared NormalizedText for an input.
+
+    Args:
+        text (str or NormalizedText): User input.
+
+    Returns:
+        NormalizedText: Existing instance, or a new one wrapping the string.
+    """
+    return NormalizedText.coerce(text)
@@ -0,0 +1,152 @@
+"""
+Pre-tokenized training cache.
+Tokenizes a dataset once and stores the token ids as NumPy .npy files keyed
+by a hash of the tokenizer, max_length and texts. Training datasets then read
+them back memory-mapped, so repeated runs and sweeps skip tokenization.
+
+Layout (ragged, no padding stored):
+    <cache_dir>/<key>/input_ids.npy   int32, every sequence concatenated
+    <cache_dir>/<key>/offsets.npy     int64, n + 1 sequence boundaries
+
+Attention masks are not stored: an unpadded sequence is all ones, and the
+collator derives the mask from each sequence's length when padding a batch.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from config import TOKEN_CACHE_DIR
+
+_TOKENIZE_CHUNK = 4096
+
+
+def tokenizer_fingerprint(tokenizer):
+    """
+    Hash everything about a tokenizer that affects its token ids.
+
+    Args:
+        tokenizer: Hugging Face tokenizer.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha1()
+    digest.update(type(tokenizer).__name__.encode())
+    digest.update(str(getattr(tokenizer, "do_lower_case", None)).encode())
+    digest.update(json.dumps(sorted(tokenizer.get_vocab().items())).encode())
+    return digest.hexdigest()
+
+
+def cache_key(texts, tokenizer, max_length):
+    """
+    Build the cache key for a tokenized dataset.
+
+    Args:
+        texts (list): Input texts, in dataset order.
+        tokenizer: Hugging Face tokenizer.
+        max_length (int): Truncation length.
+
+    Returns:
+        str: Short hex key.
+    """
+    digest = hashlib.sha1()
+    digest.update(f"{tokenizer_fingerprint(tokenizer)}:{max_length};".encode())
+    for text in texts:
+        encoded = str(text).encode("utf-8")
+        # Length-prefix each text so concatenations cannot collide
+        digest.update(f"{len(encoded)}:".encode())
+        digest.update(encoded)
+    return digest.hexdigest()[:20]
+
+
+class TokenizedTexts:
+    """Read-only, memory-mapped token ids for a tokenized dataset."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Cache entry directory.
+        """
+        self.path = path
+        self.input_ids = np.load(os.path.join(path, "input_ids.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(path, "offsets.npy"))
+        self.lengths = np.diff(self.offsets)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __getitem__(self, idx):
+        """Token ids of one sequence (a zero-copy view into the memmap)."""
+        return self.input_ids[self.offsets[idx]:self.offsets[idx + 1]]
+
+
+def build_token_cache(texts, tokenizer, max_length, path):
+    """
+    Tokenize texts and write a cache entry.
+
+    The entry is written to a temporary directory and moved into place, so a
+    crashed or concurrent run never leaves a half-written entry behind.
+
+    Args:
+        texts (list): Input texts.
+        tokenizer: Hugging Face tokenizer.
+        max_length (int): Truncation length.
+        path (str): Cache entry directory to create.
+    """
+    texts = [str(text) for text in texts]
+    sequences = []
+    for start in range(0, len(texts), _TOKENIZE_CHUNK):
+        encodings = tokenizer(
+            texts[start:start + _TOKENIZE_CHUNK],
+            add_special_tokens=True,
+            max_length=max_length,
+            truncation=True,
+            return_attention_mask=False,
+        )
+        sequences.extend(encodings["input_ids"])
+
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in sequences], out=offsets[1:])
+    input_ids = np.fromiter(
+        (token for ids in sequences for token in ids), dtype=np.int32, count=int(offsets[-1])
+    )
+
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        np.save(os.path.join(tmp_path, "input_ids.npy"), input_ids)
+        np.save(os.path.join(tmp_path, "offsets.npy"), offsets)
+        os.replace(tmp_path, path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        # Another process finished the same entry first
+        if not os.path.isdir(path):
+            raise
+
+
+def load_or_build(texts, tokenizer, max_length=128, cache_dir=TOKEN_CACHE_DIR):
+    """
+    Get the tokenized dataset, tokenizing it only on a cache miss.
+
+    Args:
+        texts (list): Input texts, in dataset order.
+        tokenizer: Hugging Face tokenizer.
+        max_length (int): Truncation length.
+        cache_dir (str): Cache root directory.
+
+    Returns:
+        TokenizedTexts: Memory-mapped token ids.
+    """
+    path = os.path.join(cache_dir, cache_key(texts, tokenizer, max_length))
+    if os.path.isdir(path):
+        print(f"Using tokenized cache: {path}")
+    else:
+        print(f"Tokenizing {len(texts)} texts into cache: {path}")
+        build_token_cache(texts, tokenizer, max_length, path)
+    return TokenizedTexts(path)
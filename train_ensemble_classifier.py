@@ -1,6 +1,9 @@
 """
 Lightweight Intent Classifier using Ensemble Approach
 Combines rules, ML (scikit-learn), and the existing validator
+
+Training, evaluation and export only; serving code imports
+intent_classifier instead, which this module extends.
 """
 
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -11,26 +14,23 @@ from sklearn.metrics import classification_report, confusion_matrix
 import pandas as pd
 import joblib
 import os
+import time
+import tempfile
 import numpy as np
+from config import ENSEMBLE_VECTORIZER
+from intent_artifacts import export_artifacts
+import intent_classifier
+from intent_classifier import NGRAM_RANGE, HashedTfidfVectorizer
 
 
-class EnsembleIntentClassifier:
-    """
-    Lightweight ensemble classifier combining:
-    1. Rule-based validation (from InputValidator)
-    2. TF-IDF + Logistic Regression
-    3. Confidence-based decision making
-    """
+class EnsembleIntentClassifier(intent_classifier.EnsembleIntentClassifier):
+    """EnsembleIntentClassifier with training, evaluation and export."""
     
-    def __init__(self, model_dir='model/ensemble_intent'):
-        self.model_dir = model_dir
-        self.vectorizer = None
-        self.classifier = None
-        self.trained = False
-        
     def train(self, data_path='data/intent_classification_data.csv'):
         """Train the ensemble classifier."""
         print("🚀 Training Ensemble Intent Classifier...")
+        # Score with the model trained below, not previously loaded NumPy artifacts
+        self.scorer = None
         
         # Load data
         df = pd.read_csv(data_path)
@@ -49,13 +49,16 @@ class EnsembleIntentClassifier:
         print(f"\n📚 Train: {len(X_train)}, Test: {len(X_test)}")
         
         # Create TF-IDF vectorizer
-        print("\n🔤 Creating TF-IDF features...")
-        self.vectorizer = TfidfVectorizer(
-            max_features=500,
-            ngram_range=(1, 3),  # Unigrams, bigrams, trigrams
-            min_df=1,
-            max_df=0.95
-        )
+        print(f"\n🔤 Creating TF-IDF features ({self.vectorizer_type})...")
+        if self.vectorizer_type == 'hashing':
+            self.vectorizer = HashedTfidfVectorizer()
+        else:
+            self.vectorizer = TfidfVectorizer(
+                max_features=500,
+                ngram_range=NGRAM_RANGE,  # Unigrams, bigrams, trigrams
+                min_df=1,
+                max_df=0.95
+            )
         
         X_train_vec = self.vectorizer.fit_transform(X_train)
         X_test_vec = self.vectorizer.transform(X_test)
@@ -129,77 +132,125 @@ class EnsembleIntentClassifier:
             print(f"   Predicted: {result['intent']} ({result['confidence']:.1%})")
             print(f"   Actual: {true_intent}")
     
-    def predict(self, text):
-        """
-        Predict intent with confidence scores.
-        
-        Returns:
-            dict: {
-                'intent': 'genuine' or 'casual',
-                'label': 1 or 0,
-                'confidence': float,
-                'genuine_prob': float,
-                'casual_prob': float,
-                'method': 'ml' or 'rule'
-            }
-        """
-        if not self.trained and not self.load_model():
-            raise ValueError("Model not trained. Please train first or load a trained model.")
-        
-        # Get prediction from ML model
-        X_vec = self.vectorizer.transform([text])
-        probs = self.classifier.predict_proba(X_vec)[0]
-        prediction = np.argmax(probs)
-        
-        result = {
-            'intent': 'genuine' if prediction == 1 else 'casual',
-            'label': int(prediction),
-            'confidence': float(probs[prediction]),
-            'genuine_prob': float(probs[1]),
-            'casual_prob': float(probs[0]),
-            'method': 'ml'
-        }
-        
-        return result
-    
     def _save_model(self):
         """Save the trained model."""
         os.makedirs(self.model_dir, exist_ok=True)
         
-        joblib.dump(self.vectorizer, os.path.join(self.model_dir, 'vectorizer.pkl'))
-        joblib.dump(self.classifier, os.path.join(self.model_dir, 'classifier.pkl'))
+        if self.vectorizer_type == 'hashing':
+            np.savez_compressed(
+                os.path.join(self.model_dir, 'hashing_model.npz'),
+                idf=self.vectorizer.idf,
+                coef=self.classifier.coef_.astype(np.float32).ravel(),
+                intercept=self.classifier.intercept_,
+                n_features=self.vectorizer.n_features,
+                ngram_range=np.array(self.vectorizer.ngram_range),
+            )
+        else:
+            joblib.dump(self.vectorizer, os.path.join(self.model_dir, 'vectorizer.pkl'))
+            joblib.dump(self.classifier, os.path.join(self.model_dir, 'classifier.pkl'))
+            export_artifacts(self.vectorizer, self.classifier, self.model_dir)
         
         print(f"\n✅ Model saved to {self.model_dir}/")
     
-    def load_model(self):
-        """Load a trained model."""
+    def export_model(self):
+        """
+        Convert the pickled TF-IDF model in model_dir to the NumPy/JSON format.
+        
+        Returns:
+            bool: True if the pickles were found and exported.
+        """
         vec_path = os.path.join(self.model_dir, 'vectorizer.pkl')
         clf_path = os.path.join(self.model_dir, 'classifier.pkl')
+        if not (os.path.exists(vec_path) and os.path.exists(clf_path)):
+            return False
         
-        if os.path.exists(vec_path) and os.path.exists(clf_path):
-            self.vectorizer = joblib.load(vec_path)
-            self.classifier = joblib.load(clf_path)
-            self.trained = True
-            print(f"✅ Model loaded from {self.model_dir}/")
-            return True
-        return False
+        export_artifacts(joblib.load(vec_path), joblib.load(clf_path), self.model_dir)
+        print(f"✅ Exported NumPy/JSON model to {self.model_dir}/")
+        return True
 
 
-def train_ensemble_classifier():
+def train_ensemble_classifier(vectorizer_type=ENSEMBLE_VECTORIZER):
     """Train the ensemble classifier."""
-    classifier = EnsembleIntentClassifier()
+    classifier = EnsembleIntentClassifier(vectorizer_type=vectorizer_type)
     results = classifier.train('data/intent_classification_data.csv')
     return classifier, results
 
 
+def compare_vectorizers(data_path='data/intent_classification_data.csv', repeat=200):
+    """
+    Compare the TF-IDF and hashing variants on the same train/test split.
+    
+    Each variant is trained into a temporary directory (the served model is
+    untouched), then reloaded in a fresh instance to measure load time,
+    artifact size and single-text / batch prediction latency.
+    
+    Returns:
+        dict: Metrics per vectorizer type.
+    """
+    texts = pd.read_csv(data_path)['text'].astype(str).tolist()
+    report = {}
+    
+    for vectorizer_type in ('tfidf', 'hashing'):
+        with tempfile.TemporaryDirectory() as model_dir:
+            trained = EnsembleIntentClassifier(model_dir, vectorizer_type)
+            metrics = trained.train(data_path)
+            size = sum(
+                os.path.getsize(os.path.join(model_dir, name)) for name in os.listdir(model_dir)
+            )
+            
+            classifier = EnsembleIntentClassifier(model_dir, vectorizer_type)
+            start = time.perf_counter()
+            classifier.load_model()
+            load_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        for i in range(repeat):
+            classifier.predict(texts[i % len(texts)])
+        single_ms = (time.perf_counter() - start) * 1000 / repeat
+        
+        start = time.perf_counter()
+        classifier.predict_batch(texts)
+        batch_us = (time.perf_counter() - start) * 1e6 / len(texts)
+        
+        report[vectorizer_type] = dict(
+            metrics, artifact_kb=size / 1024, load_ms=load_ms,
+            predict_ms=single_ms, batch_us_per_text=batch_us,
+        )
+    
+    print("\n" + "=" * 80)
+    print("TF-IDF vs HASHING VECTORIZER")
+    print("=" * 80)
+    print(f"{'':<12} {'accuracy':>9} {'f1':>7} {'size KB':>9} {'load ms':>9} {'predict ms':>11} {'batch µs/text':>14}")
+    for name, r in report.items():
+        print(f"{name:<12} {r['accuracy']:>9.2%} {r['f1']:>7.2%} {r['artifact_kb']:>9.1f} "
+              f"{r['load_ms']:>9.2f} {r['predict_ms']:>11.3f} {r['batch_us_per_text']:>14.1f}")
+    return report
+
+
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Train the ensemble intent classifier")
+    parser.add_argument('--vectorizer', choices=['tfidf', 'hashing'], default=ENSEMBLE_VECTORIZER)
+    parser.add_argument('--compare', action='store_true',
+                        help="Compare both vectorizers without touching the saved model")
+    parser.add_argument('--export', action='store_true',
+                        help="Convert the saved pickles to the NumPy/JSON format")
+    args = parser.parse_args()
+    
+    if args.compare:
+        compare_vectorizers()
+        raise SystemExit(0)
+    if args.export:
+        raise SystemExit(0 if EnsembleIntentClassifier().export_model() else 1)
+    
     print("=" * 80)
     print("ENSEMBLE INTENT CLASSIFIER TRAINING")
-    print("Lightweight TF-IDF + Logistic Regression")
+    print(f"Lightweight TF-IDF ({args.vectorizer}) + Logistic Regression")
     print("=" * 80)
     print()
     
-    classifier, results = train_ensemble_classifier()
+    classifier, results = train_ensemble_classifier(args.vectorizer)
     
     print("\n" + "=" * 80)
     print("✅ TRAINING COMPLETE")
@@ -5,44 +5,44 @@ Stage 2: Depression Assessment (only if Stage 1 = genuine)
 """
 
 import torch
-from transformers import DistilBertTokenizer, DistilBertForSequenceClassification, Trainer, TrainingArguments
+from transformers import DistilBertForSequenceClassification, Trainer, TrainingArguments
 from torch.utils.data import Dataset
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_recall_fscore_support, confusion_matrix
 import os
+from config import TOKENIZER_PATH, TOKEN_CACHE_DIR
+from model_files import load_tokenizer
+from token_cache import load_or_build
 
 
 class IntentDataset(Dataset):
-    """Custom dataset for intent classification."""
+    """Custom dataset for intent classification (reads the pre-tokenized cache)."""
     
-    def __init__(self, texts, labels, tokenizer, max_length=128):
+    def __init__(self, texts, labels, tokenizer, max_length=128, cache_dir=TOKEN_CACHE_DIR):
         self.texts = texts
         self.labels = labels
         self.tokenizer = tokenizer
         self.max_length = max_length
+        self.tokens = load_or_build(texts, tokenizer, max_length, cache_dir)
     
     def __len__(self):
         return len(self.texts)
     
     def __getitem__(self, idx):
-        text = str(self.texts[idx])
+        ids = self.tokens[idx]
         label = self.labels[idx]
         
-        encoding = self.tokenizer(
-            text,
-            add_special_tokens=True,
-            max_length=self.max_length,
-            padding='max_length',
-            truncation=True,
-            return_attention_mask=True,
-            return_tensors='pt'
-        )
+        # Pad to max_length, as the tokenizer's padding='max_length' did
+        input_ids = torch.full((self.max_length,), self.tokenizer.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros(self.max_length, dtype=torch.long)
+        input_ids[:len(ids)] = torch.from_numpy(ids.astype(np.int64))
+        attention_mask[:len(ids)] = 1
         
         return {
-            'input_ids': encoding['input_ids'].flatten(),
-            'attention_mask': encoding['attention_mask'].flatten(),
+            'input_ids': input_ids,
+            'attention_mask': attention_mask,
             'labels': torch.tensor(label, dtype=torch.long)
         }
 
@@ -52,7 +52,7 @@ class IntentClassifier:
     
     def __init__(self, model_path='model/intent_classifier'):
         self.model_path = model_path
-        self.tokenizer = DistilBertTokenizer.from_pretrained('distilbert-base-uncased')
+        self.tokenizer = load_tokenizer(TOKENIZER_PATH)
         self.model = None
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         
@@ -155,7 +155,7 @@ class IntentClassifier:
         """Load trained model."""
         if os.path.exists(self.model_path):
             self.model = DistilBertForSequenceClassification.from_pretrained(self.model_path)
-            self.tokenizer = DistilBertTokenizer.from_pretrained(self.model_path)
+            self.tokenizer = load_tokenizer(self.model_path)
             self.model.to(self.device)
             self.model.eval()
             print(f"✅ Intent classifier loaded from {self.model_path}")
@@ -175,48 +175,63 @@ class IntentClassifier:
                 'casual_prob': float
             }
         """
+        return self.predict_batch([text])[0]
+    
+    def predict_batch(self, texts, batch_size=32):
+        """
+        Predict intent for several texts, tokenizing each batch in one call.
+        
+        Batches are padded to their longest text rather than to max_length.
+        
+        Returns:
+            list: One predict() result dict per text, in input order.
+        """
         if self.model is None:
             if not self.load_model():
                 raise ValueError("Model not trained or loaded")
         
         self.model.eval()
+        results = []
         
-        # Tokenize
-        encoding = self.tokenizer(
-            text,
-            add_special_tokens=True,
-            max_length=128,
-            padding='max_length',
-            truncation=True,
-            return_attention_mask=True,
-            return_tensors='pt'
-        )
-        
-        input_ids = encoding['input_ids'].to(self.device)
-        attention_mask = encoding['attention_mask'].to(self.device)
-        
-        # Predict
-        with torch.no_grad():
-            outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
-            logits = outputs.logits
-            probs = torch.softmax(logits, dim=1).cpu().numpy()[0]
-            prediction = np.argmax(probs)
+        for start in range(0, len(texts), batch_size):
+            # Tokenize the whole batch at once
+            encoding = self.tokenizer(
+                list(texts[start:start + batch_size]),
+                add_special_tokens=True,
+                max_length=128,
+                padding=True,
+                truncation=True,
+                return_attention_mask=True,
+                return_tensors='pt'
+            )
+            
+            input_ids = encoding['input_ids'].to(self.device)
+            attention_mask = encoding['attention_mask'].to(self.device)
+            
+            # Predict
+            with torch.no_grad():
+                outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
+                all_probs = torch.softmax(outputs.logits, dim=1).cpu().numpy()
+            
+            for probs in all_probs:
+                prediction = np.argmax(probs)
+                results.append({
+                    'intent': 'genuine' if prediction == 1 else 'casual',
+                    'label': int(prediction),
+                    'confidence': float(probs[prediction]),
+                    'genuine_prob': float(probs[1]),
+                    'casual_prob': float(probs[0])
+                })
         
-        return {
-            'intent': 'genuine' if prediction == 1 else 'casual',
-            'label': int(prediction),
-            'confidence': float(probs[prediction]),
-            'genuine_prob': float(probs[1]),
-            'casual_prob': float(probs[0])
-        }
+        return results
     
     def test_predictions(self, texts, true_labels):
         """Test predictions on sample data."""
         print("\nSample Predictions:")
         print("-" * 80)
         
-        for text, true_label in zip(texts, true_labels):
-            result = self.predict(text)
+        results = self.predict_batch(list(texts))
+        for text, true_label, result in zip(texts, true_labels, results):
             true_intent = 'genuine' if true_label == 1 else 'casual'
             match = "✅" if result['label'] == true_label else "❌"
             
@@ -3,13 +3,13 @@ Training script for fine-tuning DistilBERT on mental health screening data.
 Industry best practices: proper data splits, evaluation metrics, early stopping, model checkpointing.
 """
 
+import argparse
 import os
 import torch
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset, DataLoader, Sampler
 from torch.optim import AdamW
 from transformers import (
     DistilBertForSequenceClassification,
-    DistilBertTokenizer,
     get_linear_schedule_with_warmup,
 )
 from sklearn.model_selection import train_test_split
@@ -23,42 +23,176 @@ import pandas as pd
 import numpy as np
 from tqdm import tqdm
 import json
-from config import MODEL_DIR, TOKENIZER_NAME
+import time
+from config import MODEL_DIR, TOKENIZER_NAME, TOKENIZER_PATH, TOKEN_CACHE_DIR
+from model_files import load_tokenizer
+from token_cache import load_or_build
 
 
 class MentalHealthDataset(Dataset):
-    """PyTorch Dataset for mental health text classification."""
+    """
+    PyTorch Dataset for mental health text classification.
+
+    Token ids come from the pre-tokenized cache (see token_cache.py), so texts
+    are tokenized once across epochs and runs; batches are padded by
+    DynamicPaddingCollator.
+    """
 
-    def __init__(self, texts, labels, tokenizer, max_length=128):
+    def __init__(self, texts, labels, tokenizer, max_length=128, cache_dir=TOKEN_CACHE_DIR):
         self.texts = texts
         self.labels = labels
         self.tokenizer = tokenizer
         self.max_length = max_length
+        self.tokens = load_or_build(texts, tokenizer, max_length, cache_dir)
+        # Real (non-padding) token count per sample, used for length bucketing
+        self.lengths = self.tokens.lengths
 
     def __len__(self):
         return len(self.texts)
 
     def __getitem__(self, idx):
-        text = str(self.texts[idx])
-        label = self.labels[idx]
-
-        encoding = self.tokenizer(
-            text,
-            add_special_tokens=True,
-            max_length=self.max_length,
-            padding="max_length",
-            truncation=True,
-            return_attention_mask=True,
-            return_tensors="pt",
-        )
+        return {"input_ids": self.tokens[idx], "labels": self.labels[idx]}
+
+
+class DynamicPaddingCollator:
+    """Pad each batch to its longest sample (or to a fixed max_length)."""
+
+    def __init__(self, pad_token_id=0, max_length=None):
+        """
+        Args:
+            pad_token_id (int): Token id used for padding.
+            max_length (int, optional): Always pad to this length (the original
+                fixed padding); None pads to the longest sample in the batch.
+        """
+        self.pad_token_id = pad_token_id
+        self.max_length = max_length
+
+    def __call__(self, samples):
+        width = self.max_length or max(len(sample["input_ids"]) for sample in samples)
+        input_ids = np.full((len(samples), width), self.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(samples), width), dtype=np.int64)
+
+        for row, sample in enumerate(samples):
+            length = len(sample["input_ids"])
+            input_ids[row, :length] = sample["input_ids"]
+            attention_mask[row, :length] = 1
 
         return {
-            "input_ids": encoding["input_ids"].flatten(),
-            "attention_mask": encoding["attention_mask"].flatten(),
-            "labels": torch.tensor(label, dtype=torch.long),
+            "input_ids": torch.from_numpy(input_ids),
+            "attention_mask": torch.from_numpy(attention_mask),
+            "labels": torch.tensor([sample["labels"] for sample in samples], dtype=torch.long),
         }
 
 
+class LengthBucketSampler(Sampler):
+    """
+    Batch sampler that groups samples of similar length.
+
+    Indices are shuffled, split into pools of batch_size * bucket_size samples,
+    sorted by length within each pool and cut into batches; the batch order is
+    then shuffled. Batches stay random across epochs but pad very little.
+    """
+
+    def __init__(self, lengths, batch_size, bucket_size=50, shuffle=True, seed=42):
+        """
+        Args:
+            lengths (list): Token count per sample.
+            batch_size (int): Samples per batch.
+            bucket_size (int): Batches per sorting pool (larger = less padding, less randomness).
+            shuffle (bool): Shuffle pools and batch order (False gives a fixed length-sorted order).
+            seed (int): Base random seed; combined with the epoch set via set_epoch().
+        """
+        self.lengths = lengths
+        self.batch_size = batch_size
+        self.bucket_size = bucket_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch):
+        """Reshuffle differently (but reproducibly) for each epoch."""
+        self.epoch = epoch
+
+    def __iter__(self):
+        rng = np.random.default_rng(self.seed + self.epoch)
+        indices = rng.permutation(len(self.lengths)) if self.shuffle else np.arange(len(self.lengths))
+
+        pool_size = self.batch_size * self.bucket_size
+        batches = []
+        for start in range(0, len(indices), pool_size):
+            pool = sorted(indices[start:start + pool_size], key=lambda i: self.lengths[i])
+            batches.extend(
+                [int(i) for i in pool[b:b + self.batch_size]]
+                for b in range(0, len(pool), self.batch_size)
+            )
+
+        if self.shuffle:
+            rng.shuffle(batches)
+        return iter(batches)
+
+    def __len__(self):
+        return (len(self.lengths) + self.batch_size - 1) // self.batch_size
+
+
+def configure_threads(intra_op_threads=None, inter_op_threads=None, num_workers=0):
+    """
+    Apply the torch CPU thread policy for training.
+
+    By default intra-op threads get the cores left over by the DataLoader
+    workers, so the main process and workers do not oversubscribe the CPU.
+
+    Args:
+        intra_op_threads (int, optional): Threads per op (torch.set_num_threads).
+        inter_op_threads (int, optional): Threads running independent ops in parallel.
+        num_workers (int): DataLoader worker processes sharing the machine.
+
+    Returns:
+        tuple: (intra_op_threads, inter_op_threads) in effect.
+    """
+    if intra_op_threads is None:
+        intra_op_threads = max(1, (os.cpu_count() or 1) - num_workers)
+    torch.set_num_threads(intra_op_threads)
+
+    if inter_op_threads is not None:
+        try:
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError:
+            # Can only be set before the process runs any inter-op parallel work
+            print("Warning: inter-op threads already initialised; keeping "
+                  f"{torch.get_num_interop_threads()}")
+
+    return torch.get_num_threads(), torch.get_num_interop_threads()
+
+
+def _init_worker(worker_id):
+    # Workers only index the cache and collate; one thread each keeps the
+    # cores free for the forward/backward pass
+    torch.set_num_threads(1)
+
+
+def loader_options(num_workers=0, pin_memory=False, persistent_workers=False, prefetch_factor=None):
+    """
+    Build DataLoader keyword arguments for the worker settings.
+
+    Args:
+        num_workers (int): Worker processes (0 loads batches on the main thread).
+        pin_memory (bool): Page-lock batches for faster host-to-GPU copies.
+        persistent_workers (bool): Keep workers alive between epochs.
+        prefetch_factor (int, optional): Batches each worker loads ahead.
+
+    Returns:
+        dict: Keyword arguments for DataLoader.
+    """
+    options = {"num_workers": num_workers, "pin_memory": pin_memory}
+    # The remaining options are only valid with worker processes
+    if num_workers > 0:
+        options["persistent_workers"] = persistent_workers
+        options["worker_init_fn"] = _init_worker
+        if prefetch_factor is not None:
+            options["prefetch_factor"] = prefetch_factor
+    return options
+
+
 def load_data(data_path):
     """
     Load training data from CSV.
@@ -149,6 +283,14 @@ def train_model(
     max_length=128,
     validation_split=0.2,
     seed=42,
+    dynamic_padding=True,
+    cache_dir=TOKEN_CACHE_DIR,
+    num_workers=0,
+    pin_memory=None,
+    persistent_workers=False,
+    prefetch_factor=None,
+    intra_op_threads=None,
+    inter_op_threads=None,
 ):
     """
     Train DistilBERT for mental health risk classification.
@@ -162,6 +304,18 @@ def train_model(
         max_length (int): Maximum sequence length for tokenization.
         validation_split (float): Fraction of data to use for validation.
         seed (int): Random seed for reproducibility.
+        dynamic_padding (bool): Pad per batch with length-bucketed batches.
+            False pads every sample to max_length (the original behaviour).
+        cache_dir (str): Directory for the pre-tokenized dataset cache.
+        num_workers (int): DataLoader worker processes.
+        pin_memory (bool, optional): Pin batch memory (defaults to True on CUDA).
+        persistent_workers (bool): Keep DataLoader workers alive between epochs.
+        prefetch_factor (int, optional): Batches loaded ahead by each worker.
+        intra_op_threads (int, optional): Torch intra-op threads (see configure_threads).
+        inter_op_threads (int, optional): Torch inter-op threads.
+
+    Returns:
+        list: Per-epoch stats, including training tokens/sec and samples/sec.
     """
     # Set random seeds for reproducibility
     torch.manual_seed(seed)
@@ -171,6 +325,12 @@ def train_model(
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
     print(f"Using device: {device}")
 
+    intra, inter = configure_threads(intra_op_threads, inter_op_threads, num_workers)
+    print(f"Threads: {intra} intra-op, {inter} inter-op, {num_workers} DataLoader workers")
+    if pin_memory is None:
+        pin_memory = device.type == "cuda"
+    options = loader_options(num_workers, pin_memory, persistent_workers, prefetch_factor)
+
     # Load data
     texts, labels = load_data(train_data_path)
 
@@ -183,8 +343,8 @@ def train_model(
     print(f"Validation set: {len(val_texts)} samples")
 
     # Load tokenizer and model
-    print(f"\nLoading tokenizer: {TOKENIZER_NAME}")
-    tokenizer = DistilBertTokenizer.from_pretrained(TOKENIZER_NAME)
+    print(f"\nLoading tokenizer: {TOKENIZER_PATH}")
+    tokenizer = load_tokenizer(TOKENIZER_PATH)
 
     print("Loading DistilBERT model...")
     model = DistilBertForSequenceClassification.from_pretrained(
@@ -192,13 +352,33 @@ def train_model(
     )
     model.to(device)
 
-    # Create datasets
-    train_dataset = MentalHealthDataset(train_texts, train_labels, tokenizer, max_length)
-    val_dataset = MentalHealthDataset(val_texts, val_labels, tokenizer, max_length)
+    # Create datasets (tokenized once, then read from the cache)
+    train_dataset = MentalHealthDataset(train_texts, train_labels, tokenizer, max_length, cache_dir)
+    val_dataset = MentalHealthDataset(val_texts, val_labels, tokenizer, max_length, cache_dir)
 
     # Create dataloaders
-    train_loader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True)
-    val_loader = DataLoader(val_dataset, batch_size=batch_size, shuffle=False)
+    collator = DynamicPaddingCollator(
+        tokenizer.pad_token_id, max_length=None if dynamic_padding else max_length
+    )
+    if dynamic_padding:
+        train_sampler = LengthBucketSampler(train_dataset.lengths, batch_size, seed=seed)
+        train_loader = DataLoader(
+            train_dataset, batch_sampler=train_sampler, collate_fn=collator, **options
+        )
+        val_loader = DataLoader(
+            val_dataset,
+            batch_sampler=LengthBucketSampler(val_dataset.lengths, batch_size, shuffle=False),
+            collate_fn=collator,
+            **options,
+        )
+    else:
+        train_sampler = None
+        train_loader = DataLoader(
+            train_dataset, batch_size=batch_size, shuffle=True, collate_fn=collator, **options
+        )
+        val_loader = DataLoader(
+            val_dataset, batch_size=batch_size, shuffle=False, collate_fn=collator, **options
+        )
 
     # Setup optimizer and scheduler
     optimizer = AdamW(model.parameters(), lr=learning_rate)
@@ -222,10 +402,20 @@ def train_model(
         # Training phase
         model.train()
         total_train_loss = 0
+        if train_sampler is not None:
+            train_sampler.set_epoch(epoch)
+
+        # Throughput: real tokens vs positions processed (including padding)
+        real_tokens = 0
+        padded_tokens = 0
+        epoch_start = time.perf_counter()
 
         for batch in tqdm(train_loader, desc="Training"):
             optimizer.zero_grad()
 
+            real_tokens += int(batch["attention_mask"].sum())
+            padded_tokens += batch["input_ids"].numel()
+
             input_ids = batch["input_ids"].to(device)
             attention_mask = batch["attention_mask"].to(device)
             labels = batch["labels"].to(device)
@@ -243,11 +433,19 @@ def train_model(
             scheduler.step()
 
         avg_train_loss = total_train_loss / len(train_loader)
+        epoch_seconds = time.perf_counter() - epoch_start
+        tokens_per_sec = real_tokens / epoch_seconds
+        samples_per_sec = len(train_dataset) / epoch_seconds
+        padding_ratio = 1 - real_tokens / padded_tokens
 
         # Validation phase
         val_metrics = evaluate_model(model, val_loader, device)
 
         print(f"\nTraining Loss: {avg_train_loss:.4f}")
+        print(
+            f"Training Throughput: {tokens_per_sec:,.0f} tokens/sec, "
+            f"{samples_per_sec:,.1f} samples/sec ({epoch_seconds:.1f}s, {padding_ratio:.0%} padding)"
+        )
         print(f"Validation Loss: {val_metrics['loss']:.4f}")
         print(f"Validation Accuracy: {val_metrics['accuracy']:.4f}")
         print(f"Validation Precision: {val_metrics['precision']:.4f}")
@@ -275,6 +473,7 @@ def train_model(
                     "batch_size": batch_size,
                     "learning_rate": learning_rate,
                     "max_length": max_length,
+                    "dynamic_padding": dynamic_padding,
                 },
             }
 
@@ -288,6 +487,10 @@ def train_model(
                 "val_loss": val_metrics["loss"],
                 "val_accuracy": val_metrics["accuracy"],
                 "val_f1": val_metrics["f1"],
+                "epoch_seconds": epoch_seconds,
+                "tokens_per_sec": tokens_per_sec,
+                "samples_per_sec": samples_per_sec,
+                "padding_ratio": padding_ratio,
             }
         )
 
@@ -300,15 +503,38 @@ def train_model(
     return training_stats
 
 
+def parse_args(argv=None):
+    """Parse command-line options for a training run."""
+    parser = argparse.ArgumentParser(description="Fine-tune DistilBERT for mental health risk classification")
+    parser.add_argument("--data", default="data/training_data.csv", help="CSV with 'text' and 'label' columns")
+    parser.add_argument("--output-dir", default=MODEL_DIR)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--learning-rate", type=float, default=2e-5)
+    parser.add_argument("--max-length", type=int, default=128)
+    parser.add_argument("--validation-split", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--fixed-padding", action="store_true", help="Pad every sample to --max-length")
+
+    loading = parser.add_argument_group("data loading and threads")
+    loading.add_argument("--num-workers", type=int, default=0, help="DataLoader worker processes")
+    loading.add_argument("--pin-memory", action=argparse.BooleanOptionalAction, default=None,
+                         help="Pin batch memory (default: on when training on CUDA)")
+    loading.add_argument("--persistent-workers", action="store_true", help="Keep workers alive between epochs")
+    loading.add_argument("--prefetch-factor", type=int, default=None, help="Batches loaded ahead per worker")
+    loading.add_argument("--intra-op-threads", type=int, default=None,
+                         help="Torch intra-op threads (default: CPU cores minus workers)")
+    loading.add_argument("--inter-op-threads", type=int, default=None, help="Torch inter-op threads")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    # Example usage
     # Prepare your data in CSV format with 'text' and 'label' columns
     # Labels: 0 = low risk, 1 = high risk
+    args = parse_args()
 
-    TRAIN_DATA_PATH = "data/training_data.csv"
-
-    if not os.path.exists(TRAIN_DATA_PATH):
-        print(f"Error: Training data not found at {TRAIN_DATA_PATH}")
+    if not os.path.exists(args.data):
+        print(f"Error: Training data not found at {args.data}")
         print("\nPlease create a CSV file with the following format:")
         print("text,label")
         print('"I feel happy and motivated",0')
@@ -316,10 +542,19 @@ if __name__ == "__main__":
         print("\nLabels: 0 = low risk, 1 = high risk")
     else:
         training_stats = train_model(
-            train_data_path=TRAIN_DATA_PATH,
-            epochs=3,
-            batch_size=16,
-            learning_rate=2e-5,
-            max_length=128,
-            validation_split=0.2,
+            train_data_path=args.data,
+            output_dir=args.output_dir,
+            epochs=args.epochs,
+            batch_size=args.batch_size,
+            learning_rate=args.learning_rate,
+            max_length=args.max_length,
+            validation_split=args.validation_split,
+            seed=args.seed,
+            dynamic_padding=not args.fixed_padding,
+            num_workers=args.num_workers,
+            pin_memory=args.pin_memory,
+            persistent_workers=args.persistent_workers,
+            prefetch_factor=args.prefetch_factor,
+            intra_op_threads=args.intra_op_threads,
+            inter_op_threads=args.inter_op_threads,
         )